@@ -0,0 +1,202 @@
+"""
+Admission control untuk job berat di aplikasi Streamlit.
+
+Satu AdmissionController dipakai bersama oleh semua sesi (modul Python hanya
+di-import sekali per proses server):
+- semaphore global: maksimal `max_jobs` job berjalan bersamaan, sisanya antre FIFO
+- batas per sesi: ukuran satu job, total byte yang sedang diproses, dan jumlah
+  job per jendela waktu (rate limit)
+- input besar (>= `streaming_bytes`) ditandai agar diproses engine streaming
+  / tanpa tabel proses, bukan engine yang menyimpan seluruh hasil antara
+
+Konfigurasi lewat environment variable:
+    AUTOKEY_MAX_JOBS        job bersamaan (default: jumlah core)
+    AUTOKEY_MAX_UPLOAD_MB   ukuran maksimum satu job (default 200)
+    AUTOKEY_SESSION_MB      total byte in-flight per sesi (default 400)
+    AUTOKEY_RATE            job per menit per sesi (default 30)
+    AUTOKEY_STREAM_MB       ambang routing ke engine streaming (default 16)
+
+Contoh:
+    with getController().admit(session_id, len(data), on_wait=show) as ticket:
+        result = streamEngine(data) if ticket.streaming else engine(data)
+"""
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from instrumentation import count
+
+MB = 1024 * 1024
+
+
+class AdmissionError(ValueError):
+    """Job ditolak (terlalu besar, terlalu sering, atau antrean habis waktu)."""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+class Ticket:
+    __slots__ = ("session", "size", "streaming", "enqueued", "started", "position")
+
+    def __init__(self, session: str, size: int, streaming: bool):
+        self.session = session
+        self.size = size
+        self.streaming = streaming
+        self.enqueued = time.monotonic()
+        self.started = None
+        self.position = None
+
+    @property
+    def waited(self) -> float:
+        return (self.started or time.monotonic()) - self.enqueued
+
+
+class AdmissionController:
+    def __init__(self, max_jobs: int = None, max_job_bytes: int = 200 * MB,
+                 max_session_bytes: int = 400 * MB, rate_limit: int = 30,
+                 rate_window: float = 60.0, streaming_bytes: int = 16 * MB):
+        self.max_jobs = max_jobs or os.cpu_count() or 1
+        self.max_job_bytes = max_job_bytes
+        self.max_session_bytes = max_session_bytes
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.streaming_bytes = streaming_bytes
+        self._cond = threading.Condition()
+        self._queue = deque()
+        self._running = 0
+        self._sessions = {}
+
+    @classmethod
+    def fromEnv(cls) -> "AdmissionController":
+        env = os.environ.get
+        return cls(
+            max_jobs=int(env("AUTOKEY_MAX_JOBS", 0)) or None,
+            max_job_bytes=int(float(env("AUTOKEY_MAX_UPLOAD_MB", 200)) * MB),
+            max_session_bytes=int(float(env("AUTOKEY_SESSION_MB", 400)) * MB),
+            rate_limit=int(env("AUTOKEY_RATE", 30)),
+            streaming_bytes=int(float(env("AUTOKEY_STREAM_MB", 16)) * MB),
+        )
+
+    # --------------------------------------------------
+    # ADMISSION
+    # --------------------------------------------------
+    @staticmethod
+    def _reject(message: str, reason: str) -> AdmissionError:
+        count("admission_rejected", reason=reason)
+        return AdmissionError(message, reason)
+
+    def _enter(self, session: str, size: int) -> Ticket:
+        """Cek batas per sesi lalu masukkan ticket ke antrean (dipanggil dengan lock)."""
+        if size > self.max_job_bytes:
+            raise self._reject(f"Input {size / MB:.1f} MB melebihi batas {self.max_job_bytes / MB:.0f} MB per job!", "size")
+        state = self._sessions.setdefault(session, {"times": deque(), "bytes": 0})
+        if state["bytes"] + size > self.max_session_bytes:
+            raise self._reject("Sesi ini masih memproses data lain; tunggu hingga selesai.", "session_bytes")
+        now = time.monotonic()
+        times = state["times"]
+        while times and now - times[0] > self.rate_window:
+            times.popleft()
+        if len(times) >= self.rate_limit:
+            retry = self.rate_window - (now - times[0])
+            raise self._reject(f"Terlalu banyak permintaan. Coba lagi dalam {retry:.0f} detik.", "rate")
+        times.append(now)
+        state["bytes"] += size
+        ticket = Ticket(session, size, streaming=size >= self.streaming_bytes)
+        self._queue.append(ticket)
+        return ticket
+
+    def _acquire(self, ticket: Ticket, on_wait, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        reported = None
+        while True:
+            with self._cond:
+                if self._queue[0] is ticket and self._running < self.max_jobs:
+                    self._queue.popleft()
+                    self._running += 1
+                    ticket.started = time.monotonic()
+                    ticket.position = 0
+                    self._cond.notify_all()
+                    return
+                ticket.position = self._queue.index(ticket) + 1
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise self._reject("Antrean penuh terlalu lama; coba lagi nanti.", "timeout")
+                if ticket.position == reported or on_wait is None:
+                    # tunggu notifikasi; timeout kecil sebagai jaring pengaman
+                    self._cond.wait(0.5)
+                    continue
+            reported = ticket.position
+            on_wait(reported)       # di luar lock: callback boleh lambat (render UI)
+
+    def _release(self, ticket: Ticket):
+        with self._cond:
+            if ticket.started is not None:
+                self._running -= 1
+            elif ticket in self._queue:
+                self._queue.remove(ticket)
+            self._sessions[ticket.session]["bytes"] -= ticket.size
+            self._expireSessions()
+            self._cond.notify_all()
+
+    def _expireSessions(self):
+        """
+        Hapus sesi tanpa job in-flight yang tidak punya permintaan dalam jendela
+        rate limit (dipanggil dengan lock). Sesi Streamlit tidak memberi tahu
+        saat ditutup, jadi tanpa ini state sesi menumpuk selama proses hidup.
+        """
+        now = time.monotonic()
+        for session, state in list(self._sessions.items()):
+            times = state["times"]
+            while times and now - times[0] > self.rate_window:
+                times.popleft()
+            if state["bytes"] == 0 and not times:
+                del self._sessions[session]
+
+    @contextmanager
+    def admit(self, session: str, size: int, on_wait=None, timeout: float = None):
+        """
+        Tunggu giliran untuk job berukuran `size` byte. on_wait(posisi) dipanggil
+        setiap kali posisi antrean berubah. Melempar AdmissionError jika ditolak.
+        """
+        with self._cond:
+            ticket = self._enter(session, size)
+        try:
+            self._acquire(ticket, on_wait, timeout)
+            if ticket.waited > 0.001:
+                count("admission_wait_seconds", ticket.waited)
+            yield ticket
+        finally:
+            self._release(ticket)
+
+    def status(self) -> dict:
+        with self._cond:
+            self._expireSessions()
+            return {
+                "running": self._running,
+                "queued": len(self._queue),
+                "max_jobs": self.max_jobs,
+                "sessions": len(self._sessions),
+            }
+
+    def forget(self, session: str):
+        """Hapus state sesi yang sudah tidak aktif."""
+        with self._cond:
+            state = self._sessions.get(session)
+            if state is not None and state["bytes"] == 0:
+                del self._sessions[session]
+
+# ======================================================
+# CONTROLLER GLOBAL
+# ======================================================
+_controller = None
+_controller_lock = threading.Lock()
+
+def getController() -> AdmissionController:
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdmissionController.fromEnv()
+        return _controller
@@ -0,0 +1,171 @@
+"""
+Autokey Cipher dengan alfabet yang bisa dikonfigurasi.
+
+Cipher teks klasik (autokeyEncrypt) terkunci pada A-Z dan membuang angka,
+tanda baca, dan huruf non-ASCII. Modul ini memakai tabel lookup (code point ->
+indeks, indeks -> code point) yang dihitung sekali per alfabet, sehingga
+alfabet apa pun (termasuk Unicode) diproses dengan kecepatan vektor. Code
+point di atas Latin-1 dicari dengan np.searchsorted, jadi ukuran tabel
+mengikuti jumlah simbol, bukan code point terbesar.
+
+Karakter di luar alfabet diperlakukan sesuai kebijakan `outside`:
+- "keep": disalin apa adanya dan tidak memajukan keystream (default)
+- "drop": dibuang dari output
+
+Contoh:
+    autokeyEncryptAlphabet("Halo, Dunia 2025!", "kunci", "latin")   # huruf kecil & tanda baca tetap
+    autokeyEncryptAlphabet("Kode A1B2", "K3Y", "alnum")
+    autokeyEncryptAlphabet("ΑΒΓ", "Β", "ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ")
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from autokey_fast import autokeyKeystream, autokeyRecover, codesToText, textToCodes
+
+# ======================================================
+# PRESET ALFABET
+# ======================================================
+UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LOWER = UPPER.lower()
+DIGITS = "0123456789"
+LATIN1_UPPER = "".join(chr(c) for c in range(0xC0, 0xDF) if c != 0xD7)
+LATIN1_LOWER = "".join(chr(c) for c in range(0xE0, 0xFF) if c != 0xF7)
+
+# nama -> (simbol kanonik, [varian huruf yang dipetakan ke indeks yang sama])
+PRESETS = {
+    "AZ": (UPPER, []),
+    "latin": (UPPER, [LOWER]),
+    "latin-ext": (UPPER + LATIN1_UPPER, [LOWER + LATIN1_LOWER]),
+    "alnum": (DIGITS + UPPER + LOWER, []),
+}
+
+OUTSIDE_POLICIES = ("keep", "drop")
+DENSE_SIZE = 256     # code point di bawah ini memakai tabel lookup langsung
+
+
+class Alphabet:
+    """
+    Alfabet dengan tabel lookup terhitung. `symbols` menentukan urutan indeks
+    (modulus = len(symbols)); setiap string di `variants` (panjang sama)
+    dipetakan ke indeks yang sama dan bentuknya dipertahankan di output,
+    misalnya huruf kecil pada alfabet "latin".
+    """
+
+    def __init__(self, symbols: str, variants=(), name: str = None):
+        forms = [symbols, *variants]
+        if len(set(symbols)) != len(symbols) or not symbols:
+            raise ValueError("Alfabet harus berisi simbol unik dan tidak boleh kosong!")
+        if any(len(v) != len(symbols) for v in variants):
+            raise ValueError("Setiap varian harus sepanjang alfabet!")
+
+        self.name = name or symbols
+        self.symbols = symbols
+        self.size = len(symbols)
+        codes = [textToCodes(form) for form in forms]
+        allCodes = np.concatenate(codes)
+        if len(np.unique(allCodes)) != len(allCodes):
+            raise ValueError("Simbol yang sama muncul di lebih dari satu varian!")
+        allIndex = np.tile(np.arange(self.size), len(forms))
+        allForm = np.repeat(np.arange(len(forms), dtype=np.int8), self.size)
+
+        # code point < DENSE_SIZE: tabel langsung; sisanya (Unicode) dicari
+        # dengan searchsorted di array terurut, jadi memori ~ ukuran alfabet
+        dense = allCodes < DENSE_SIZE
+        self.index = np.full(DENSE_SIZE, -1, dtype=np.int64)   # code point -> indeks
+        self.form = np.zeros(DENSE_SIZE, dtype=np.int8)         # code point -> varian
+        self.index[allCodes[dense]] = allIndex[dense]
+        self.form[allCodes[dense]] = allForm[dense]
+        order = np.argsort(allCodes[~dense])
+        self.wide_codes = allCodes[~dense][order]
+        self.wide_index = allIndex[~dense][order]
+        self.wide_form = allForm[~dense][order]
+        self.reverse = np.stack(codes).astype(np.uint32)      # (varian, indeks) -> code point
+
+    def lookup(self, codes: np.ndarray):
+        """Kembalikan (indeks, varian) per code point; indeks -1 = di luar alfabet."""
+        inside = codes < DENSE_SIZE
+        safe = np.where(inside, codes, 0)
+        idx = np.where(inside, self.index[safe], -1)
+        form = self.form[safe]
+        if len(self.wide_codes) and not inside.all():
+            pos = np.searchsorted(self.wide_codes, codes).clip(max=len(self.wide_codes) - 1)
+            hit = ~inside & (self.wide_codes[pos] == codes)
+            idx[hit] = self.wide_index[pos[hit]]
+            form[hit] = self.wide_form[pos[hit]]
+        return idx, form
+
+    def __repr__(self):
+        return f"Alphabet({self.name!r}, size={self.size})"
+
+
+@lru_cache(maxsize=16)
+def getAlphabet(alphabet) -> Alphabet:
+    """Nama preset ("AZ", "latin", "latin-ext", "alnum") atau string simbol kustom."""
+    if isinstance(alphabet, Alphabet):
+        return alphabet
+    if alphabet in PRESETS:
+        symbols, variants = PRESETS[alphabet]
+        return Alphabet(symbols, variants, name=alphabet)
+    return Alphabet(alphabet)
+
+
+def _keyIndices(key: str, alpha: Alphabet) -> np.ndarray:
+    idx, _ = alpha.lookup(textToCodes(key))
+    idx = idx[idx >= 0]
+    if len(idx) == 0:
+        raise ValueError(f"Key harus berisi minimal satu simbol dari alfabet {alpha.name}!")
+    return idx
+
+# ======================================================
+# ENGINE
+# ======================================================
+def _process(text: str, key: str, alphabet, outside: str, decrypt: bool) -> str:
+    if outside not in OUTSIDE_POLICIES:
+        raise ValueError(f"Kebijakan karakter luar alfabet tidak dikenal: {outside}")
+    alpha = getAlphabet(alphabet)
+    keyIdx = _keyIndices(key, alpha)
+    codes = textToCodes(text)
+    idx, form = alpha.lookup(codes)
+    inside = idx >= 0
+    values = idx[inside]
+    if decrypt:
+        result = autokeyRecover(values, keyIdx, alpha.size)
+    else:
+        result = (values + autokeyKeystream(values, keyIdx)) % alpha.size
+    out = codes.copy()
+    out[inside] = alpha.reverse[form[inside], result]
+    return codesToText(out if outside == "keep" else out[inside])
+
+def autokeyEncryptAlphabet(plaintext: str, key: str, alphabet="latin", outside: str = "keep") -> str:
+    return _process(plaintext, key, alphabet, outside, decrypt=False)
+
+def autokeyDecryptAlphabet(ciphertext: str, key: str, alphabet="latin", outside: str = "keep") -> str:
+    return _process(ciphertext, key, alphabet, outside, decrypt=True)
+
+# ======================================================
+# REFERENSI (loop per karakter, untuk uji kesetaraan)
+# ======================================================
+def autokeyAlphabetReference(text: str, key: str, alphabet="latin", outside: str = "keep",
+                             decrypt: bool = False) -> str:
+    alpha = getAlphabet(alphabet)
+    forms = [alpha.symbols] + ["".join(chr(c) for c in row) for row in alpha.reverse[1:].tolist()]
+    position = {c: (i, f) for f, form in enumerate(forms) for i, c in enumerate(form)}
+    keyStream = [position[c][0] for c in key if c in position]
+    if not keyStream:
+        raise ValueError(f"Key harus berisi minimal satu simbol dari alfabet {alpha.name}!")
+
+    out = []
+    ki = 0
+    for c in text:
+        if c not in position:
+            if outside == "keep":
+                out.append(c)
+            continue
+        n, f = position[c]
+        k = keyStream[ki]
+        r = (n - k) % alpha.size if decrypt else (n + k) % alpha.size
+        keyStream.append(r if decrypt else n)
+        ki += 1
+        out.append(forms[f][r])
+    return "".join(out)
@@ -0,0 +1,175 @@
+"""
+Analisis frekuensi dan statistik untuk plaintext, ciphertext, dan keystream.
+
+Semua perhitungan dilakukan dalam satu pass vektor (np.bincount) dan hasilnya
+berupa array ringkas yang siap digambar oleh UI:
+- histogram huruf (26) / byte (256)
+- index of coincidence dan entropy (bit per simbol)
+- bigram sampai quadgram (array berukuran size^n, indeks = kode n-gram;
+  batas n per jenis data di MAX_NGRAM)
+
+Untuk file besar, StreamingStats menerima data per potongan dan membawa
+n-1 simbol terakhir antar potongan sehingga n-gram di perbatasan tetap dihitung.
+"""
+import numpy as np
+
+from autokey_fast import findKeystream, textToCodes
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+LETTERS = 26
+BYTES = 256
+# n maksimum per jenis data: quadgram huruf = 26^4 = 456.976 sel (~3,7 MB int64,
+# dipakai model n-gram), trigram byte = 256^3 = 16 juta sel (128 MB), terlalu besar
+MAX_NGRAM = {"letters": 4, "bytes": 2}
+
+# Index of coincidence acuan (teks Inggris, teks Indonesia, huruf acak)
+ENGLISH_IOC = 0.0667
+INDONESIAN_IOC = 0.0719
+RANDOM_IOC = 1 / LETTERS
+
+# ======================================================
+# KONVERSI INPUT
+# ======================================================
+def letterValues(text: str) -> np.ndarray:
+    """Huruf A-Z (setelah upper) -> array nilai 0-25; karakter lain diabaikan."""
+    codes = textToCodes(text.upper())
+    letters = codes[(codes >= 65) & (codes <= 90)]
+    return (letters - 65).astype(np.uint8)
+
+def byteValues(data) -> np.ndarray:
+    return np.frombuffer(data, dtype=np.uint8)
+
+# ======================================================
+# STATISTIK DASAR
+# ======================================================
+def histogram(values: np.ndarray, size: int) -> np.ndarray:
+    return np.bincount(values, minlength=size).astype(np.int64)
+
+def indexOfCoincidence(counts: np.ndarray) -> float:
+    n = counts.sum()
+    if n < 2:
+        return 0.0
+    return float((counts * (counts - 1)).sum() / (n * (n - 1)))
+
+def entropy(counts: np.ndarray) -> float:
+    n = counts.sum()
+    if n == 0:
+        return 0.0
+    p = counts[counts > 0] / n
+    return float(-(p * np.log2(p)).sum())
+
+def ngramCodes(values: np.ndarray, n: int, size: int) -> np.ndarray:
+    """Kode n-gram: v[i]*size^(n-1) + ... + v[i+n-1]."""
+    if len(values) < n:
+        return np.zeros(0, dtype=np.int64)
+    codes = np.zeros(len(values) - n + 1, dtype=np.int64)
+    for j in range(n):
+        codes = codes * size + values[j:len(values) - n + 1 + j]
+    return codes
+
+def ngramCounts(values: np.ndarray, n: int, size: int) -> np.ndarray:
+    return np.bincount(ngramCodes(values, n, size), minlength=size ** n).astype(np.int64)
+
+def topNgrams(counts: np.ndarray, n: int, size: int, limit: int = 10, symbols: str = None) -> list:
+    """[(n-gram, jumlah)] terbanyak; n-gram ditulis sebagai huruf (A-Z) atau hex byte."""
+    result = []
+    for code in np.argsort(counts, kind="stable")[::-1][:limit].tolist():
+        total = int(counts[code])
+        if total == 0:
+            break
+        digits = []
+        for _ in range(n):
+            code, d = divmod(code, size)
+            digits.append(d)
+        digits.reverse()
+        label = "".join(symbols[d] for d in digits) if symbols else " ".join(f"{d:02X}" for d in digits)
+        result.append((label, total))
+    return result
+
+# ======================================================
+# STREAMING
+# ======================================================
+class StreamingStats:
+    """Akumulasi histogram dan n-gram per potongan data (huruf atau byte)."""
+
+    def __init__(self, kind: str = "letters", ngrams=(2, 3)):
+        if kind not in MAX_NGRAM:
+            raise ValueError(f"Jenis data tidak dikenal: {kind}")
+        self.kind = kind
+        self.size = LETTERS if kind == "letters" else BYTES
+        self.ngrams = tuple(n for n in ngrams if n <= MAX_NGRAM[kind])
+        self.counts = np.zeros(self.size, dtype=np.int64)
+        self.ngramTotals = {n: np.zeros(self.size ** n, dtype=np.int64) for n in self.ngrams}
+        self.carry = np.zeros(0, dtype=np.uint8)
+
+    def update(self, chunk):
+        values = letterValues(chunk) if self.kind == "letters" else byteValues(chunk)
+        self.updateValues(values)
+        return self
+
+    def updateValues(self, values: np.ndarray):
+        self.counts += histogram(values, self.size)
+        if self.ngrams:
+            joined = np.concatenate([self.carry, values])
+            for n in self.ngrams:
+                # hanya n-gram yang memuat minimal satu nilai baru
+                start = max(0, len(self.carry) - (n - 1))
+                self.ngramTotals[n] += ngramCounts(joined[start:], n, self.size)
+            keep = max(self.ngrams) - 1
+            self.carry = joined[-keep:] if keep else joined[:0]
+        return self
+
+    def result(self) -> dict:
+        out = {
+            "kind": self.kind,
+            "total": int(self.counts.sum()),
+            "histogram": self.counts,
+            "frequency": self.counts / max(1, self.counts.sum()),
+            "ioc": indexOfCoincidence(self.counts),
+            "entropy": entropy(self.counts),
+        }
+        for n, counts in self.ngramTotals.items():
+            out[f"ngram{n}"] = counts
+        return out
+
+# ======================================================
+# ENTRY POINT
+# ======================================================
+def analyzeValues(values: np.ndarray, kind: str, ngrams=(2, 3)) -> dict:
+    return StreamingStats(kind, ngrams).updateValues(values).result()
+
+def analyzeText(text: str, ngrams=(2, 3)) -> dict:
+    return analyzeValues(letterValues(text), "letters", ngrams)
+
+def analyzeBytes(data, ngrams=(2,)) -> dict:
+    return analyzeValues(byteValues(data), "bytes", ngrams)
+
+def analyzeFile(path: str, kind: str = "bytes", chunk_size: int = 4 * 1024 * 1024, ngrams=(2,)) -> dict:
+    stats = StreamingStats(kind, ngrams)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            # huruf dihitung dari byte ASCII, jadi potongan tidak perlu di-decode
+            stats.updateValues(byteValues(chunk) if kind == "bytes" else _asciiLetters(chunk))
+    return stats.result()
+
+def _asciiLetters(chunk: bytes) -> np.ndarray:
+    b = byteValues(chunk)
+    upper = np.where((b >= 97) & (b <= 122), b - 32, b)
+    return (upper[(upper >= 65) & (upper <= 90)] - 65).astype(np.uint8)
+
+def keystreamValues(plaintext: str, ciphertext: str) -> np.ndarray:
+    """Keystream (CT - PT) mod 26 pada posisi yang sama seperti findKey."""
+    return findKeystream(plaintext, ciphertext).astype(np.uint8)
+
+def analyzeKeyRecovery(plaintext: str, ciphertext: str, ngrams=(2, 3)) -> dict:
+    """Statistik plaintext, ciphertext, dan keystream untuk tab Find Key."""
+    return {
+        "plaintext": analyzeText(plaintext, ngrams),
+        "ciphertext": analyzeText(ciphertext, ngrams),
+        "keystream": analyzeValues(keystreamValues(plaintext, ciphertext), "letters", ngrams),
+    }
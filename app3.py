@@ -1,10 +1,29 @@
 import streamlit as st
 import pandas as pd
 import re
-from io import BytesIO
 import base64
 from autokey_functions import *
 from styles import *
+import os
+import uuid
+import functools
+import tempfile
+from importlib.util import find_spec
+from contextlib import contextmanager
+import instrumentation
+from instrumentation import stage
+from profiling import profileRun
+from alphabet import autokeyEncryptAlphabet, autokeyDecryptAlphabet
+from analysis import analyzeKeyRecovery, topNgrams
+from trace_export import exportTrace
+from compression import compressPayload, decompressPayload, payloadCodec
+from admission import AdmissionError, getController
+from preview import formatSize, previewCipher, readPreview
+from live_edit import AutokeyEditSession
+from key_check import checkDecryption
+from binary_attack import SAMPLE_BYTES as ATTACK_SAMPLE_BYTES, crackBytes
+from autokey_fast import findKeyFast, processBytesInto
+from dispatcher import decrypt as dispatchDecrypt, encrypt as dispatchEncrypt
 
 # ======================================================
 # UI STYLING — Pastel Pink & Blue Soft Theme
@@ -64,6 +83,385 @@ with st.sidebar:
     - Gunakan key yang sama untuk dekripsi
     """)
 
+    if os.environ.get("AUTOKEY_ADMIN"):
+        st.markdown("---")
+        st.markdown("### 🛠️ Admin")
+        st.toggle("Mode Profiling", key="profiling_mode",
+                  help="Jalankan proses berikutnya di bawah profiler dan sediakan file profil untuk diunduh")
+        st.radio("Jenis Profiler", ["deterministic", "sampling"], key="profiling_kind",
+                 help="deterministic: cProfile (.pstats) · sampling: collapsed stack untuk flame graph")
+        admission = getController().status()
+        st.caption(f"Job berjalan: {admission['running']}/{admission['max_jobs']} · "
+                   f"antre: {admission['queued']} · sesi: {admission['sessions']}")
+
+    if instrumentation.isEnabled():
+        st.markdown("---")
+        with st.expander("📈 Metrics (Prometheus)"):
+            st.code(instrumentation.prometheusText(), language=None)
+
+# ======================================================
+# PROFILING (ADMIN)
+# ======================================================
+def runJob(fn, *args):
+    """Jalankan fungsi cipher; jika mode profiling aktif, tampilkan ringkasan dan file profil."""
+    if not st.session_state.get("profiling_mode"):
+        return fn(*args)
+
+    profile = profileRun(fn, *args, mode=st.session_state.get("profiling_kind", "deterministic"))
+    with st.expander(f"🛠️ Profil {fn.__name__} ({profile.elapsed:.3f} s)", expanded=True):
+        st.code(profile.summary(), language=None)
+        st.download_button(
+            "💾 Download Profil",
+            profile.output,
+            f"{fn.__name__}_{profile.filename}",
+            use_container_width=True,
+            key=f"profile_download_{fn.__name__}"
+        )
+    return profile.result
+
+# ======================================================
+# ALFABET (Mode teks)
+# ======================================================
+ALPHABET_OPTIONS = {
+    "A–Z Klasik (dengan tabel proses)": None,
+    "Latin (huruf besar/kecil & tanda baca dipertahankan)": "latin",
+    "Latin + Aksen (À–Þ, à–þ)": "latin-ext",
+    "Alfanumerik (0–9, A–Z, a–z)": "alnum",
+    "Kustom": "custom",
+}
+
+def alphabetSelector(prefix):
+    """Pilihan alfabet untuk mode teks; kembalikan (alphabet, kebijakan karakter luar alfabet)."""
+    label = st.selectbox("🔤 Alfabet:", list(ALPHABET_OPTIONS), key=f"{prefix}_alphabet")
+    alphabet = ALPHABET_OPTIONS[label]
+    if alphabet is None:
+        return None, None
+    if alphabet == "custom":
+        alphabet = st.text_input(
+            "Simbol alfabet (urutan menentukan nilai, tanpa duplikat):",
+            value="ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
+            key=f"{prefix}_alphabet_custom"
+        )
+    outside = st.radio(
+        "Karakter di luar alfabet:",
+        ["keep", "drop"],
+        format_func=lambda v: "Pertahankan" if v == "keep" else "Buang",
+        horizontal=True,
+        key=f"{prefix}_outside"
+    )
+    return alphabet, outside
+
+def cipherText(operation, text, key, alphabet, outside, traced=True):
+    """
+    Enkripsi/dekripsi teks; mode alfabet dan input besar (traced=False, engine
+    pilihan dispatcher) tidak menghasilkan tabel proses (df = None).
+    """
+    if alphabet is None:
+        if not traced:
+            return runJob(dispatchEncrypt if operation == "Enkripsi" else dispatchDecrypt, text, key), None
+        return runJob(autokeyEncrypt if operation == "Enkripsi" else autokeyDecrypt, text, key)
+    fn = autokeyEncryptAlphabet if operation == "Enkripsi" else autokeyDecryptAlphabet
+    return runJob(fn, text, key, alphabet, outside), None
+
+def findKeyJob(plaintext, ciphertext, streaming):
+    """Find key; input besar memakai engine vektor tanpa tabel proses (df = None)."""
+    if streaming:
+        return runJob(findKeyFast, plaintext, ciphertext), None
+    return runJob(findKey, plaintext, ciphertext)
+
+def cipherBytes(data, key, decrypt, streaming):
+    """
+    Enkripsi/dekripsi biner; input besar diproses per potongan ke satu buffer
+    output, selebihnya memakai engine pilihan dispatcher.
+    """
+    if streaming:
+        return bytes(runJob(processBytesInto, data, key, bytearray(len(data)), decrypt))
+    return runJob(dispatchDecrypt if decrypt else dispatchEncrypt, data, key)
+
+# ======================================================
+# ADMISSION CONTROL (Batas job bersamaan & per sesi)
+# ======================================================
+@contextmanager
+def admitted(size):
+    """Tunggu giliran job; tampilkan posisi antrean dan info routing ke engine streaming."""
+    session_id = st.session_state.setdefault("session_id", uuid.uuid4().hex)
+    placeholder = st.empty()
+
+    def onWait(position):
+        placeholder.info(f"⏳ Server sedang sibuk — posisi antrean Anda: {position}")
+
+    with getController().admit(session_id, size, on_wait=onWait) as ticket:
+        if ticket.streaming:
+            placeholder.info("ℹ️ Input besar diproses dengan engine streaming (tanpa tabel proses)")
+        else:
+            placeholder.empty()
+        yield ticket
+
+# ======================================================
+# HASIL PER PANEL (Session state)
+# ======================================================
+# Setiap tab berjalan sebagai fragment: perubahan widget di dalamnya hanya
+# menjalankan ulang fragment itu, bukan header, CSS, sidebar, dan panduan.
+# Hasil proses disimpan di session state bersama input yang menghasilkannya,
+# jadi rerun berikutnya hanya menampilkan ulang hasil (tanpa menghitung ulang)
+# selama input masih sama, dan tidak mengirim apa pun jika input sudah berubah.
+def displayFrame(df):
+    """
+    Kolom tabel proses berisi angka dan '' (baris spasi). st.dataframe
+    memperbaikinya menjadi teks di setiap render; lakukan sekali saja.
+    """
+    if df is None:
+        return None
+    df = df.copy()
+    for column in df.columns[df.dtypes == object]:
+        if df[column].map(type).nunique() > 1:
+            df[column] = df[column].astype(str)
+    return df
+
+def storeResult(panel, inputs, df=None, **values):
+    st.session_state[f"result_{panel}"] = dict(values, df=displayFrame(df), inputs=inputs)
+    return st.session_state[f"result_{panel}"]
+
+def storedResult(panel, inputs):
+    """Hasil terakhir panel jika dihasilkan dari input yang sama dengan input saat ini."""
+    result = st.session_state.get(f"result_{panel}")
+    if result is not None and result["inputs"] == inputs:
+        return result
+    return None
+
+def clearResult(panel):
+    st.session_state.pop(f"result_{panel}", None)
+
+def downloadButton(label, data, filename, **kwargs):
+    """Download tanpa memicu rerun (on_click="ignore")."""
+    with stage("download_serialize"):
+        st.download_button(label, data, filename, use_container_width=True, on_click="ignore", **kwargs)
+
+# ======================================================
+# EKSPOR TRACE (Tabel proses lengkap)
+# ======================================================
+def _traceFile(operation, text, key_or_ciphertext, fmt):
+    """Tulis trace per potongan ke file sementara dan kembalikan file itu."""
+    f = tempfile.TemporaryFile()
+    try:
+        with stage("download_serialize"):
+            exportTrace(operation, text, key_or_ciphertext, f, fmt)
+        f.seek(0)
+    except BaseException:
+        f.close()
+        raise
+    return f
+
+def traceDownload(result, operation, text, key_or_ciphertext, basename):
+    """
+    Tombol download tabel proses lengkap (Parquet jika pyarrow tersedia, selain
+    itu CSV). File baru dibuat saat tombol diklik, ditulis per potongan ke file
+    sementara, jadi tidak ada salinan trace yang disimpan di session state.
+    """
+    if find_spec("pyarrow") is not None:
+        ext, mime = "parquet", "application/vnd.apache.parquet"
+    else:
+        ext, mime = "csv", "text/csv"
+    st.download_button(
+        f"💾 Download Tabel Proses Lengkap (.{ext})",
+        functools.partial(_traceFile, operation, text, key_or_ciphertext, ext),
+        f"{basename}_trace.{ext}",
+        mime=mime,
+        key=f"trace_download_{operation}_{basename}",
+        use_container_width=True,
+        on_click="ignore",
+    )
+
+# ======================================================
+# ANALISIS FREKUENSI (Find Key)
+# ======================================================
+def renderFrequencyAnalysis(stats):
+    labels = {"plaintext": "Plaintext", "ciphertext": "Ciphertext", "keystream": "Keystream"}
+    letters = [chr(ord("A") + i) for i in range(26)]
+
+    with st.expander("📈 Analisis Frekuensi Karakter"):
+        cols = st.columns(3)
+        for col, (name, label) in zip(cols, labels.items()):
+            col.metric(f"IoC {label}", f"{stats[name]['ioc']:.4f}")
+            col.caption(f"Entropy: {stats[name]['entropy']:.3f} bit · {stats[name]['total']} huruf")
+        st.caption("IoC acuan: Inggris ≈ 0.067, Indonesia ≈ 0.072, acak ≈ 0.038")
+
+        st.bar_chart(pd.DataFrame({label: stats[name]["frequency"] for name, label in labels.items()}, index=letters))
+
+        rows = []
+        for name, label in labels.items():
+            for n, title in ((2, "Bigram"), (3, "Trigram")):
+                top = topNgrams(stats[name][f"ngram{n}"], n, 26, limit=5, symbols="".join(letters))
+                rows.append({"Teks": label, "Jenis": title,
+                             "Teratas": ", ".join(f"{g} ({c})" for g, c in top)})
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+# ======================================================
+# TAMPILAN HASIL
+# ======================================================
+def renderTextResult(result, operation):
+    """Hasil mode Teks Manual."""
+    if operation == "Enkripsi":
+        st.success("✅ Enkripsi Berhasil!")
+        st.markdown("### 📤 Hasil Ciphertext:")
+    else:
+        st.success("✅ Dekripsi Berhasil!")
+        st.markdown("### 📥 Hasil Plaintext:")
+    st.code(result["result"], language=None)
+
+    downloadButton(
+        "💾 Download Ciphertext" if operation == "Enkripsi" else "💾 Download Plaintext",
+        result["result"],
+        "ciphertext.txt" if operation == "Enkripsi" else "plaintext.txt",
+    )
+
+    if result["df"] is not None:
+        with st.expander(f"📊 Lihat Detail Proses {operation}"):
+            with stage("render_dataframe"):
+                st.dataframe(result["df"], use_container_width=True)
+
+def renderTextFileResult(result, operation, key_input):
+    """Hasil mode File Teks: pratinjau 500 karakter, metrik, download, dan tabel proses."""
+    encrypt = operation == "Enkripsi"
+    st.success("✅ File Berhasil Dienkripsi!" if encrypt else "✅ File Berhasil Didekripsi!")
+
+    st.markdown("### 📤 Hasil Enkripsi:" if encrypt else "### 📥 Hasil Dekripsi:")
+    text = result["result"]
+    st.code(text[:500] + ("..." if len(text) > 500 else ""), language=None)
+
+    # Informasi hasil
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("📊 Panjang Original" if encrypt else "📊 Panjang Terenkripsi", f"{result['input_length']} karakter")
+    with col2:
+        st.metric("📊 Panjang Terenkripsi" if encrypt else "📊 Panjang Didekripsi", f"{len(text)} karakter")
+
+    downloadButton(
+        "💾 Download File Terenkripsi" if encrypt else "💾 Download File Hasil Dekripsi",
+        text,
+        f"{result['name']}_encrypted.txt" if encrypt else f"{result['name']}_decrypted.txt",
+    )
+
+    df = result["df"]
+    if df is not None:
+        with st.expander("📊 Lihat Detail Proses (100 baris pertama)"):
+            with stage("render_dataframe"):
+                st.dataframe(df.head(100), use_container_width=True)
+            st.info(f"ℹ️ Total {len(df)} baris proses {'enkripsi' if encrypt else 'dekripsi'}")
+            traceDownload(result, "encrypt" if encrypt else "decrypt", result["content"], key_input, result["name"])
+
+def renderBinaryResult(result, operation):
+    """Hasil mode File Biner (termasuk penolakan oleh pemeriksaan key)."""
+    check = result.get("check")
+    if result["data"] is None:
+        st.error(f"❌ Key kemungkinan besar salah (confidence {check.confidence:.0%}): "
+                 + "; ".join(check.reasons))
+        st.info("💡 Periksa kembali key, atau centang 'Lewati pemeriksaan key' "
+                "untuk tetap mendekripsi.")
+        return
+
+    codec = result["codec"]
+    if operation == "Enkripsi":
+        st.success("✅ File Berhasil Dienkripsi!")
+        st.markdown("""
+        <div class="success-box">
+            <strong>✨ Proses Enkripsi Selesai!</strong><br>
+            ✓ Seluruh byte file telah terenkripsi<br>
+            ✓ Header file tidak dapat dibaca<br>
+            ✓ File tidak bisa dibuka tanpa dekripsi<br>
+            ✓ Gunakan key yang sama untuk dekripsi
+        </div>
+        """, unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("📊 Ukuran Original", f"{result['input_size']} bytes")
+        with col2:
+            st.metric("📊 Ukuran Terenkripsi", f"{len(result['data'])} bytes")
+        if codec != "none":
+            st.caption(f"🗜️ Kompresi {codec}: "
+                       f"{len(result['data']) / max(1, result['input_size']):.1%} dari ukuran original")
+
+        downloadButton("💾 Download File Terenkripsi", result["data"], result["filename"])
+    else:
+        st.caption(f"🔎 Pemeriksaan key: {check.verdict} "
+                   f"(confidence {check.confidence:.0%}) — " + "; ".join(check.reasons))
+        st.success("✅ File Berhasil Didekripsi!")
+        st.markdown("""
+        <div class="success-box">
+            <strong>✨ Proses Dekripsi Selesai!</strong><br>
+            ✓ File telah dikembalikan ke kondisi semula<br>
+            ✓ Header file telah dipulihkan<br>
+            ✓ File sekarang dapat dibuka kembali
+        </div>
+        """, unsafe_allow_html=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("📊 Ukuran Terenkripsi", f"{result['input_size']} bytes")
+        with col2:
+            st.metric("📊 Ukuran Didekripsi", f"{len(result['data'])} bytes")
+        if codec != "none":
+            st.caption(f"🗜️ Data didekompresi ({codec})")
+
+        downloadButton("💾 Download File Hasil Dekripsi", result["data"], result["filename"])
+
+def renderFindKeyResult(result, from_file=False):
+    st.success("✅ Key Berhasil Ditemukan dari File!" if from_file else "✅ Key Berhasil Ditemukan!")
+
+    st.markdown("### 🔑 Key yang Ditemukan:")
+    st.code(result["key"], language=None)
+
+    downloadButton("💾 Download Key", result["key"], "found_key.txt")
+
+    renderFrequencyAnalysis(result["stats"])
+
+    df = result["df"]
+    if df is not None:
+        with st.expander("📊 Lihat Detail Analisis"):
+            with stage("render_dataframe"):
+                st.dataframe(df.head(100) if from_file else df, use_container_width=True)
+            if from_file:
+                traceDownload(result, "findKey", result["plaintext"], result["ciphertext"], result["name"])
+
+def renderBinaryKeyResult(result):
+    """Hasil serangan ciphertext-only pada file biner."""
+    guess = result["guess"]
+    key_text = guess.key_text
+    if guess.check and guess.check.rejected:
+        st.error("❌ Key tidak ditemukan: kandidat terbaik ditolak pemeriksaan key (hasil dekripsinya "
+                 "tidak cocok dengan format file).")
+    elif guess.confidence >= 0.7:
+        st.success("✅ Key Ditemukan dari Ciphertext!")
+    else:
+        st.warning(f"⚠️ Key belum pasti (confidence {guess.confidence:.0%}). File yang sebagian besar "
+                   "terkompresi atau acak hanya memberi sedikit informasi per posisi key.")
+
+    st.markdown("### 🔑 Key yang Ditemukan:")
+    st.code(key_text if key_text is not None else guess.key.hex(), language=None)
+    if key_text is None:
+        st.caption("Key bukan teks UTF-8; ditampilkan dalam heksadesimal.")
+    else:
+        downloadButton("💾 Download Key", key_text, "found_key.txt")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("📏 Panjang Key", f"{guess.key_length} byte")
+    with col2:
+        st.metric("📄 Format Terdeteksi", guess.format)
+    with col3:
+        st.metric("🎯 Confidence", f"{guess.confidence:.0%}")
+    if guess.check:
+        st.caption(f"🔎 Pemeriksaan key: {guess.check.verdict} "
+                   f"(confidence {guess.check.confidence:.0%}) — " + "; ".join(guess.check.reasons))
+
+    with st.expander("📊 Lihat Detail Analisis"):
+        st.caption(f"{guess.bits_per_byte:.2f} bit/byte hasil dekripsi sampel, {guess.elapsed_s:.2f} s")
+        st.bar_chart(pd.DataFrame({"bit/byte": guess.length_scores}).rename_axis("panjang key"))
+        st.dataframe(pd.DataFrame({"byte key": list(guess.key),
+                                   "confidence": guess.position_confidence}).rename_axis("posisi"),
+                     use_container_width=True)
+
 # ======================================================
 # MAIN CONTENT
 # ======================================================
@@ -73,24 +471,27 @@ tab1, tab2, tab3 = st.tabs(["🔐 Enkripsi/Dekripsi", "🔍 Find Key", "📖 Pan
 # ======================================================
 # TAB 1: ENKRIPSI/DEKRIPSI
 # ======================================================
-with tab1:
+@st.fragment
+def cipherTab():
     col1, col2 = st.columns([2, 1])
-    
+
     with col1:
         input_type = st.selectbox(
             "📥 Pilih Tipe Input:",
             ["Teks Manual", "File Teks (.txt)", "File Sembarang (PDF, DOCX, PNG, dll)"],
-            help="Pilih tipe input yang ingin Anda enkripsi/dekripsi"
+            help="Pilih tipe input yang ingin Anda enkripsi/dekripsi",
+            key="input_type"
         )
-    
+
     with col2:
         operation = st.selectbox(
             "⚙️ Pilih Operasi:",
-            ["Enkripsi", "Dekripsi"]
+            ["Enkripsi", "Dekripsi"],
+            key="operation"
         )
-    
+
     st.markdown("---")
-    
+
     # INPUT TEKS MANUAL
     if input_type == "Teks Manual":
         text_input = st.text_area(
@@ -98,55 +499,51 @@ with tab1:
             height=150,
             placeholder="Ketik atau paste teks Anda di sini..."
         )
-        
+
         key_input = st.text_input(
             "🔑 Masukkan Key (huruf A-Z saja):",
             placeholder="Contoh: SECRET",
             help="Key hanya boleh berisi huruf A-Z"
         )
-        
+
+        alphabet, outside = alphabetSelector("manual")
+
+        if operation == "Enkripsi" and alphabet is None:
+            live = st.toggle("⚡ Enkripsi langsung saat teks berubah", key="live_encrypt",
+                             help="Ciphertext diperbarui setiap kali teks diedit; hanya huruf yang terdampak yang dihitung ulang")
+            if live and text_input and key_input:
+                session = st.session_state.get("live_session")
+                if session is None or st.session_state.get("live_key") != key_input:
+                    session = AutokeyEditSession(key_input)
+                    st.session_state["live_session"] = session
+                    st.session_state["live_key"] = key_input
+                with stage("live_encrypt"):
+                    live_result = session.update(text_input)
+                st.markdown("### ⚡ Ciphertext (langsung):")
+                st.code(live_result, language=None)
+                st.caption(f"Huruf dihitung ulang: {session.changed[1] - session.changed[0]} dari {len(session.pt)}")
+
+        inputs = (operation, text_input, key_input, alphabet, outside)
         if st.button("🚀 Proses", use_container_width=True):
             if not text_input:
                 st.error("❌ Teks tidak boleh kosong!")
             elif not key_input:
                 st.error("❌ Key tidak boleh kosong!")
             else:
-                with st.spinner("Memproses..."):
-                    if operation == "Enkripsi":
-                        result, df = autokeyEncrypt(text_input, key_input)
-                        st.success("✅ Enkripsi Berhasil!")
-                        
-                        st.markdown("### 📤 Hasil Ciphertext:")
-                        st.code(result, language=None)
-                        
-                        st.download_button(
-                            "💾 Download Ciphertext",
-                            result,
-                            "ciphertext.txt",
-                            use_container_width=True
-                        )
-                        
-                        with st.expander("📊 Lihat Detail Proses Enkripsi"):
-                            st.dataframe(df, use_container_width=True)
-                    
-                    else:
-                        result, df = autokeyDecrypt(text_input, key_input)
-                        st.success("✅ Dekripsi Berhasil!")
-                        
-                        st.markdown("### 📥 Hasil Plaintext:")
-                        st.code(result, language=None)
-                        
-                        st.download_button(
-                            "💾 Download Plaintext",
-                            result,
-                            "plaintext.txt",
-                            use_container_width=True
-                        )
-                        
-                        with st.expander("📊 Lihat Detail Proses Dekripsi"):
-                            st.dataframe(df, use_container_width=True)
-    
-    # INPUT FILE TEKS 
+                clearResult("manual")
+                try:
+                    with st.spinner("Memproses..."), admitted(len(text_input.encode("utf-8"))) as ticket:
+                        result, df = cipherText(operation, text_input, key_input, alphabet, outside,
+                                                traced=not ticket.streaming)
+                        storeResult("manual", inputs, result=result, df=df)
+                except ValueError as e:
+                    st.error(f"❌ {str(e)}")
+
+        result = storedResult("manual", inputs)
+        if result is not None:
+            renderTextResult(result, operation)
+
+    # INPUT FILE TEKS
     elif input_type == "File Teks (.txt)":
         uploaded_file = st.file_uploader(
             "📁 Upload File Teks (.txt)",
@@ -154,279 +551,280 @@ with tab1:
             help="Upload file teks yang ingin diproses",
             key="txt_file_uploader"
         )
-        
-        # Preview file jika sudah diupload
+
+        # Preview file jika sudah diupload (hanya beberapa KB pertama yang dibaca)
+        preview_prefix = None
         if uploaded_file is not None:
-            # Baca file untuk preview
-            file_content = uploaded_file.read().decode("utf-8")
-            uploaded_file.seek(0)  # Reset pointer untuk dibaca lagi nanti
-            
-            st.markdown("**📄 Preview File:**")
-            preview_text = file_content[:500] + ("..." if len(file_content) > 500 else "")
-            st.markdown(f'<div class="preview-box"><pre>{preview_text}</pre></div>', 
-                    unsafe_allow_html=True)
-            
-            # Info file
+            try:
+                with stage("read_preview"):
+                    preview_prefix, truncated = readPreview(uploaded_file)
+
+                st.markdown("**📄 Preview File:**")
+                preview_text = preview_prefix + ("..." if truncated else "")
+                st.markdown(f'<div class="preview-box"><pre>{preview_text}</pre></div>',
+                        unsafe_allow_html=True)
+            except UnicodeDecodeError:
+                st.warning("⚠️ Awal file bukan teks UTF-8 yang valid; preview tidak tersedia.")
+
+            # Info file (ukuran dari metadata upload, tanpa decode)
             col1, col2 = st.columns(2)
             with col1:
                 st.info(f"📄 **Nama File:** {uploaded_file.name}")
             with col2:
-                st.info(f"📊 **Ukuran:** {len(file_content)} karakter")
-        
+                st.info(f"📊 **Ukuran:** {formatSize(uploaded_file.size)}")
+
         key_input = st.text_input(
             "🔑 Masukkan Key:",
             placeholder="Contoh: MYSECRET",
             key="txt_key_input"
         )
-        
+
+        alphabet, outside = alphabetSelector("txt")
+
+        inputs = (operation, uploaded_file and uploaded_file.file_id, key_input, alphabet, outside)
         if st.button("🚀 Proses File", use_container_width=True, key="txt_process_btn"):
             if uploaded_file is None:
                 st.error("❌ Upload file terlebih dahulu!")
             elif not key_input:
                 st.error("❌ Key tidak boleh kosong!")
             else:
+                clearResult("txt")
                 try:
-                    with st.spinner("Memproses file..."):
+                    with st.spinner("Memproses file..."), admitted(uploaded_file.size) as ticket:
+                        # Pratinjau hasil dari prefix saja, tampil selama job penuh berjalan
+                        preview_box = st.empty()
+                        if preview_prefix:
+                            with preview_box.container():
+                                st.markdown("**⚡ Pratinjau Hasil (awal file):**")
+                                st.code(previewCipher(preview_prefix, key_input, operation == "Dekripsi",
+                                                      alphabet, outside), language=None)
+
                         # Baca konten file
-                        content = uploaded_file.read().decode("utf-8")
-                        
-                        if operation == "Enkripsi":
-                            result, df = autokeyEncrypt(content, key_input)
-                            st.success("✅ File Berhasil Dienkripsi!")
-                            
-                            st.markdown("### 📤 Hasil Enkripsi:")
-                            preview_result = result[:500] + ("..." if len(result) > 500 else "")
-                            st.code(preview_result, language=None)
-                            
-                            # Informasi hasil
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("📊 Panjang Original", f"{len(content)} karakter")
-                            with col2:
-                                st.metric("📊 Panjang Terenkripsi", f"{len(result)} karakter")
-
-                            st.download_button(
-                                "💾 Download File Terenkripsi",
-                                result,
-                                f"{uploaded_file.name}_encrypted.txt",
-                                use_container_width=True
-                            )
-                            
-                            with st.expander("📊 Lihat Detail Proses (100 baris pertama)"):
-                                st.dataframe(df.head(100), use_container_width=True)
-                                st.info(f"ℹ️ Total {len(df)} baris proses enkripsi")
-                        
-                        else:  # Dekripsi
-                            result, df = autokeyDecrypt(content, key_input)
-                            st.success("✅ File Berhasil Didekripsi!")
-                            
-                            st.markdown("### 📥 Hasil Dekripsi:")
-                            preview_result = result[:500] + ("..." if len(result) > 500 else "")
-                            st.code(preview_result, language=None)
-                            
-                            # Informasi hasil
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("📊 Panjang Terenkripsi", f"{len(content)} karakter")
-                            with col2:
-                                st.metric("📊 Panjang Didekripsi", f"{len(result)} karakter")
-  
-                            output_filename = f"{uploaded_file.name}_decrypted.txt"
-                            
-                            st.download_button(
-                                "💾 Download File Hasil Dekripsi",
-                                result,
-                                output_filename,
-                                use_container_width=True
-                            )
-                            
-                            with st.expander("📊 Lihat Detail Proses (100 baris pertama)"):
-                                st.dataframe(df.head(100), use_container_width=True)
-                                st.info(f"ℹ️ Total {len(df)} baris proses dekripsi")
-                
+                        with stage("read_upload"):
+                            content = uploaded_file.read().decode("utf-8")
+
+                        result, df = cipherText(operation, content, key_input, alphabet, outside,
+                                                traced=not ticket.streaming)
+                        preview_box.empty()
+                        # teks asli hanya disimpan jika tabel proses (dan ekspor trace) tersedia
+                        storeResult("txt", inputs, result=result, df=df, input_length=len(content),
+                                    name=uploaded_file.name, content=content if df is not None else None)
+
                 except UnicodeDecodeError:
                     st.error("❌ File tidak dapat dibaca sebagai teks UTF-8. Pastikan file adalah file teks yang valid.")
                 except Exception as e:
                     st.error(f"❌ Terjadi kesalahan: {str(e)}")
 
+        result = storedResult("txt", inputs)
+        if result is not None:
+            renderTextFileResult(result, operation, key_input)
+
     # INPUT FILE SEMBARANG (File Biner)
     else:
         st.markdown(enkripsi_file_biner, unsafe_allow_html=True)
-        
+
         uploaded_file = st.file_uploader(
             "📁 Upload File Sembarang",
             type=None,
             help="Upload file apapun: dokumen, gambar, video, dll"
         )
-        
+
         if uploaded_file:
             file_details = {
                 "Nama File": uploaded_file.name,
                 "Tipe": uploaded_file.type if uploaded_file.type else "Unknown",
                 "Ukuran": f"{uploaded_file.size / 1024:.2f} KB"
             }
-            
+
             col1, col2, col3 = st.columns(3)
             col1.markdown(file_details_card.format(label="📄 Nama", value=file_details["Nama File"]), unsafe_allow_html=True)
             col2.markdown(file_details_card.format(label="📦 Tipe", value=file_details["Tipe"]), unsafe_allow_html=True)
             col3.markdown(file_details_card.format(label="💾 Ukuran", value=file_details["Ukuran"]), unsafe_allow_html=True)
-        
+
         key_input = st.text_input(
             "🔑 Masukkan Key untuk Enkripsi/Dekripsi:",
             placeholder="Contoh: STRONGKEY123",
             help="Key bisa berisi huruf, angka, dan simbol"
         )
-        
+
+        if operation == "Enkripsi":
+            codec = st.selectbox(
+                "🗜️ Kompresi sebelum enkripsi:",
+                ["none", "auto", "zlib", "lzma"],
+                format_func=lambda v: {"none": "Tanpa kompresi", "auto": "Otomatis (zlib jika lebih kecil)",
+                                       "zlib": "zlib (cepat)", "lzma": "lzma (lebih kecil, lebih lambat)"}[v],
+                help="Ciphertext tidak bisa dikompres, jadi kompresi dilakukan sebelum enkripsi. "
+                     "Saat dekripsi, kompresi dikenali otomatis dari header."
+            )
+        else:
+            skip_check = st.checkbox(
+                "Lewati pemeriksaan key",
+                help="Sebelum dekripsi penuh, beberapa KB pertama didekripsi dan diperiksa "
+                     "(signature format, teks, entropy) untuk mendeteksi key yang salah."
+            )
+
+        option = codec if operation == "Enkripsi" else skip_check
+        inputs = (operation, uploaded_file and uploaded_file.file_id, key_input, option)
         if st.button("🚀 Proses File", use_container_width=True):
             if not uploaded_file:
                 st.error("❌ Upload file terlebih dahulu!")
             elif not key_input:
                 st.error("❌ Key tidak boleh kosong!")
             else:
+                clearResult("binary")
                 try:
-                    with st.spinner(f"{'Mengenkripsi' if operation == 'Enkripsi' else 'Mendekripsi'} file..."):
-                        file_bytes = uploaded_file.read()
-                        
+                    with st.spinner(f"{'Mengenkripsi' if operation == 'Enkripsi' else 'Mendekripsi'} file..."), \
+                            admitted(uploaded_file.size) as ticket:
+                        with stage("read_upload"):
+                            # getbuffer(): memoryview atas isi upload, tanpa copy
+                            file_bytes = uploaded_file.getbuffer()
+
                         if operation == "Enkripsi":
-                            encrypted_bytes = autokeyEncryptBytes(file_bytes, key_input)
-                            
-                            st.success("✅ File Berhasil Dienkripsi!")
-                            st.markdown("""
-                            <div class="success-box">
-                                <strong>✨ Proses Enkripsi Selesai!</strong><br>
-                                ✓ Seluruh byte file telah terenkripsi<br>
-                                ✓ Header file tidak dapat dibaca<br>
-                                ✓ File tidak bisa dibuka tanpa dekripsi<br>
-                                ✓ Gunakan key yang sama untuk dekripsi
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            output_filename = f"{uploaded_file.name}.enc"
-                            
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("📊 Ukuran Original", f"{len(file_bytes)} bytes")
-                            with col2:
-                                st.metric("📊 Ukuran Terenkripsi", f"{len(encrypted_bytes)} bytes")
-                            
-                            st.download_button(
-                                "💾 Download File Terenkripsi",
-                                encrypted_bytes,
-                                output_filename,
-                                use_container_width=True
-                            )
-                        
+                            with stage("compress", codec=codec):
+                                payload = compressPayload(file_bytes, codec)
+                            encrypted_bytes = cipherBytes(payload, key_input, False, ticket.streaming)
+                            storeResult("binary", inputs, data=encrypted_bytes, input_size=len(file_bytes),
+                                        codec=codec if codec == "none" else payloadCodec(payload),
+                                        filename=f"{uploaded_file.name}.enc")
+
                         else:
-                            decrypted_bytes = autokeyDecryptBytes(file_bytes, key_input)
-                            
-                            st.success("✅ File Berhasil Didekripsi!")
-                            st.markdown("""
-                            <div class="success-box">
-                                <strong>✨ Proses Dekripsi Selesai!</strong><br>
-                                ✓ File telah dikembalikan ke kondisi semula<br>
-                                ✓ Header file telah dipulihkan<br>
-                                ✓ File sekarang dapat dibuka kembali
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            output_filename = uploaded_file.name.replace(".enc", "")
-                            
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("📊 Ukuran Terenkripsi", f"{len(file_bytes)} bytes")
-                            with col2:
-                                st.metric("📊 Ukuran Didekripsi", f"{len(decrypted_bytes)} bytes")
-                            
-                            st.download_button(
-                                "💾 Download File Hasil Dekripsi",
-                                decrypted_bytes,
-                                output_filename,
-                                use_container_width=True
-                            )
-                
+                            with stage("key_check"):
+                                check = checkDecryption(file_bytes, key_input, name=uploaded_file.name)
+                            if check.rejected and not skip_check:
+                                storeResult("binary", inputs, data=None, check=check)
+                            else:
+                                decrypted_bytes = cipherBytes(file_bytes, key_input, True, ticket.streaming)
+                                codec = payloadCodec(decrypted_bytes)
+                                with stage("decompress", codec=codec):
+                                    decrypted_bytes = decompressPayload(decrypted_bytes)
+                                storeResult("binary", inputs, data=decrypted_bytes, input_size=len(file_bytes),
+                                            codec=codec, check=check,
+                                            filename=uploaded_file.name.replace(".enc", ""))
+
+                except AdmissionError as e:
+                    # ditolak karena beban/batas server, bukan karena key
+                    st.error(f"❌ {str(e)}")
                 except Exception as e:
                     st.error(f"❌ Terjadi kesalahan: {str(e)}")
                     st.info("💡 Pastikan Anda menggunakan key yang benar untuk dekripsi!")
-            
+
+        result = storedResult("binary", inputs)
+        if result is not None:
+            renderBinaryResult(result, operation)
+
+with tab1:
+    cipherTab()
+
 # ======================================================
 # TAB 2: FIND KEY
 # ======================================================
-with tab2:
+@st.fragment
+def findKeyTab():
     st.markdown(key_recovery, unsafe_allow_html=True)
-    
+
     input_method = st.radio(
         "Pilih Metode Input:",
-        ["Input Manual", "Upload File .txt"]
+        ["Input Manual", "Upload File .txt", "File Biner Terenkripsi (tanpa plaintext)"],
+        key="findkey_method"
     )
-    
+
     if input_method == "Input Manual":
         plaintext = st.text_area(
             "📝 Masukkan Plaintext:",
             height=150,
             placeholder="Masukkan plaintext asli..."
         )
-        
+
         ciphertext = st.text_area(
             "🔐 Masukkan Ciphertext:",
             height=150,
             placeholder="Masukkan ciphertext yang sesuai..."
         )
-        
+
+        inputs = (plaintext, ciphertext)
         if st.button("🔍 Cari Key", use_container_width=True):
             if not plaintext or not ciphertext:
                 st.error("❌ Plaintext dan Ciphertext harus diisi!")
             else:
-                with st.spinner("Mencari key..."):
-                    found_key, df = findKey(plaintext, ciphertext)
-                    
-                    st.success("✅ Key Berhasil Ditemukan!")
-                    
-                    st.markdown("### 🔑 Key yang Ditemukan:")
-                    st.code(found_key, language=None)
-                    
-                    st.download_button(
-                        "💾 Download Key",
-                        found_key,
-                        "found_key.txt",
-                        use_container_width=True
-                    )
-                    
-                    with st.expander("📊 Lihat Detail Analisis"):
-                        st.dataframe(df, use_container_width=True)
-    
-    else:
+                clearResult("findkey")
+                try:
+                    with st.spinner("Mencari key..."), \
+                            admitted(len(plaintext.encode("utf-8")) + len(ciphertext.encode("utf-8"))) as ticket:
+                        found_key, df = findKeyJob(plaintext, ciphertext, ticket.streaming)
+                        storeResult("findkey", inputs, key=found_key, df=df,
+                                    stats=analyzeKeyRecovery(plaintext, ciphertext))
+                except AdmissionError as e:
+                    st.error(f"❌ {str(e)}")
+
+        result = storedResult("findkey", inputs)
+        if result is not None:
+            renderFindKeyResult(result)
+
+    elif input_method == "Upload File .txt":
         col1, col2 = st.columns(2)
-        
+
         with col1:
             pt_file = st.file_uploader("📁 Upload Plaintext File", type=["txt"], key="pt")
-        
+
         with col2:
             ct_file = st.file_uploader("📁 Upload Ciphertext File", type=["txt"], key="ct")
-        
+
+        inputs = (pt_file and pt_file.file_id, ct_file and ct_file.file_id)
         if st.button("🔍 Cari Key dari File", use_container_width=True):
             if not pt_file or not ct_file:
                 st.error("❌ Upload kedua file terlebih dahulu!")
             else:
-                with st.spinner("Menganalisis file..."):
-                    plaintext = pt_file.read().decode("utf-8")
-                    ciphertext = ct_file.read().decode("utf-8")
-                    
-                    found_key, df = findKey(plaintext, ciphertext)
-                    
-                    st.success("✅ Key Berhasil Ditemukan dari File!")
-                    
-                    st.markdown("### 🔑 Key yang Ditemukan:")
-                    st.code(found_key, language=None)
-                    
-                    st.download_button(
-                        "💾 Download Key",
-                        found_key,
-                        "found_key.txt",
-                        use_container_width=True
-                    )
-                    
-                    with st.expander("📊 Lihat Detail Analisis"):
-                        st.dataframe(df.head(100), use_container_width=True)
+                clearResult("findkey_file")
+                try:
+                    with st.spinner("Menganalisis file..."), admitted(pt_file.size + ct_file.size) as ticket:
+                        with stage("read_upload"):
+                            plaintext = pt_file.read().decode("utf-8")
+                        with stage("read_upload"):
+                            ciphertext = ct_file.read().decode("utf-8")
+
+                        found_key, df = findKeyJob(plaintext, ciphertext, ticket.streaming)
+                        traced = df is not None
+                        storeResult("findkey_file", inputs, key=found_key, df=df, name=pt_file.name,
+                                    stats=analyzeKeyRecovery(plaintext, ciphertext),
+                                    plaintext=plaintext if traced else None,
+                                    ciphertext=ciphertext if traced else None)
+                except AdmissionError as e:
+                    st.error(f"❌ {str(e)}")
+
+        result = storedResult("findkey_file", inputs)
+        if result is not None:
+            renderFindKeyResult(result, from_file=True)
+
+    else:
+        enc_file = st.file_uploader("📁 Upload File Terenkripsi (mis. laporan.pdf.enc)", key="enc")
+        printable_key = st.checkbox("Key hanya berisi karakter keyboard (ASCII)", value=True,
+                                    key="findkey_printable")
+
+        inputs = (enc_file and enc_file.file_id, printable_key)
+        if st.button("🔍 Cari Key dari Ciphertext", use_container_width=True):
+            if not enc_file:
+                st.error("❌ Upload file terenkripsi terlebih dahulu!")
+            else:
+                clearResult("findkey_binary")
+                try:
+                    with st.spinner("Menganalisis ciphertext..."), \
+                            admitted(min(enc_file.size, ATTACK_SAMPLE_BYTES)):
+                        with stage("read_upload"):
+                            # hanya awal file yang dianalisis
+                            sample = enc_file.read(ATTACK_SAMPLE_BYTES)
+                        guess = crackBytes(sample, name=enc_file.name, printable_key=printable_key)
+                        storeResult("findkey_binary", inputs, guess=guess)
+                except AdmissionError as e:
+                    st.error(f"❌ {str(e)}")
+                except ValueError as e:
+                    st.error(f"❌ {str(e)}")
+
+        result = storedResult("findkey_binary", inputs)
+        if result is not None:
+            renderBinaryKeyResult(result)
+
+with tab2:
+    findKeyTab()
 
 # ======================================================
 # TAB 3: PANDUAN
@@ -0,0 +1,159 @@
+"""
+Enkripsi inkremental (append-only) untuk file log yang terus bertambah.
+
+Keystream autokey pada posisi i hanya bergantung pada L byte plaintext
+sebelumnya (L = panjang key dalam byte). State kecil itu disimpan di
+samping output `.enc` (file `.enc.state`), sehingga run berikutnya cukup
+mengenkripsi byte yang baru ditambahkan: O(data baru), bukan O(ukuran total).
+
+File .enc yang dihasilkan identik dengan autokeyEncryptBytes(seluruh_file, key).
+
+Catatan: state berisi L byte plaintext terakhir; simpan dengan izin yang
+sama ketatnya dengan file sumber. Key hanya disimpan sebagai sidik jari
+PBKDF2 dengan salt acak per file.
+
+Contoh:
+    python append_mode.py app.log --key KUNCI                 # sekali jalan
+    python append_mode.py app.log --key KUNCI --follow 5      # tail tiap 5 detik
+"""
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import sys
+import tempfile
+import time
+from functools import lru_cache
+
+from autokey_fast import AutokeyByteStream
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+CHUNK_SIZE = 1024 * 1024
+STATE_SUFFIX = ".state"
+STATE_VERSION = 1
+SALT_BYTES = 16
+FINGERPRINT_ITERATIONS = 200_000
+
+
+def newSalt() -> str:
+    return base64.b64encode(os.urandom(SALT_BYTES)).decode("ascii")
+
+@lru_cache(maxsize=8)
+def keyFingerprint(key: str, salt: str) -> str:
+    """
+    Sidik jari key untuk mendeteksi pemakaian key yang berbeda. Memakai salt
+    acak per file dan PBKDF2, sehingga menebak key dari file state tidak
+    lebih murah daripada menyerang ciphertext-nya. Hasilnya di-cache: pada
+    --follow PBKDF2 cukup dihitung sekali per sesi, bukan setiap polling.
+    """
+    digest = hashlib.pbkdf2_hmac("sha256", key.encode("utf-8"), base64.b64decode(salt), FINGERPRINT_ITERATIONS)
+    return digest.hex()[:32]
+
+def statePath(enc_path: str) -> str:
+    return enc_path + STATE_SUFFIX
+
+def loadState(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def saveState(path: str, state: dict):
+    """Tulis state secara atomik (file sementara + rename)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+# ======================================================
+# APPEND
+# ======================================================
+def appendEncrypt(src_path: str, enc_path: str, key: str, restart: bool = False) -> dict:
+    """
+    Enkripsi byte baru di src_path dan tambahkan ke enc_path.
+    Kembalikan {"offset": total byte terenkripsi, "appended": byte baru}.
+    """
+    if not key:
+        raise ValueError("Key tidak boleh kosong!")
+    state_file = statePath(enc_path)
+    state = None if restart else loadState(state_file)
+    src_size = os.path.getsize(src_path)
+
+    if state is None:
+        stream = AutokeyByteStream(key)
+        offset = 0
+        salt = newSalt()
+        fingerprint = keyFingerprint(key, salt)
+    else:
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Versi state tidak dikenal: {state.get('version')}")
+        salt = state["key_salt"]
+        fingerprint = keyFingerprint(key, salt)
+        if not hmac.compare_digest(state["key_fingerprint"], fingerprint):
+            raise ValueError("Key berbeda dengan key yang dipakai sebelumnya!")
+        offset = state["offset"]
+        if src_size < offset:
+            raise ValueError("File sumber mengecil (rotasi/truncate?). Jalankan ulang dengan --restart.")
+        stream = AutokeyByteStream.fromState(base64.b64decode(state["tail"]))
+
+    mode = "r+b" if offset and os.path.exists(enc_path) else "wb"
+    if mode == "r+b" and os.path.getsize(enc_path) < offset:
+        raise ValueError("File .enc lebih pendek dari state. Jalankan ulang dengan --restart.")
+
+    appended = 0
+    with open(src_path, "rb") as src, open(enc_path, mode) as out:
+        # Buang sisa tulisan dari run yang terhenti sebelum state sempat disimpan
+        out.truncate(offset)
+        out.seek(offset)
+        src.seek(offset)
+        while True:
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            out.write(stream.update(chunk))
+            appended += len(chunk)
+        out.flush()
+        os.fsync(out.fileno())
+
+    offset += appended
+    saveState(state_file, {
+        "version": STATE_VERSION,
+        "offset": offset,
+        "tail": base64.b64encode(stream.stateBytes()).decode("ascii"),
+        "key_salt": salt,
+        "key_fingerprint": fingerprint,
+    })
+    return {"offset": offset, "appended": appended}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enkripsi inkremental untuk file yang terus bertambah")
+    parser.add_argument("source")
+    parser.add_argument("--output", help="File output (default: <source>.enc)")
+    parser.add_argument("--key", required=True)
+    parser.add_argument("--restart", action="store_true", help="Abaikan state lama, enkripsi dari awal")
+    parser.add_argument("--follow", type=float, metavar="DETIK",
+                        help="Terus pantau file dan enkripsi data baru setiap N detik")
+    args = parser.parse_args(argv)
+
+    enc_path = args.output or args.source + ".enc"
+    restart = args.restart
+    while True:
+        result = appendEncrypt(args.source, enc_path, args.key, restart=restart)
+        restart = False
+        if result["appended"] or not args.follow:
+            print(f"+{result['appended']} byte -> {enc_path} (total {result['offset']} byte)")
+        if not args.follow:
+            return 0
+        time.sleep(args.follow)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Enkripsi/dekripsi isi arsip ZIP atau TAR secara streaming, entry per entry,
+tanpa mengekstrak ke disk.
+
+Setiap member dienkripsi terpisah dengan semantik autokeyEncryptBytes
+(keystream dimulai lagi dari key), sehingga member hasil ekstraksi bisa
+didekripsi sendiri-sendiri di tab file biner. Nama, waktu, dan atribut member
+dipertahankan. Memori puncak dibatasi oleh ukuran potongan (CHUNK_SIZE) dan
+batch member kecil (BATCH_BYTES), bukan ukuran arsip.
+
+Contoh:
+    python archive_stream.py encrypt data.zip data.enc.zip --key KUNCI
+    python archive_stream.py decrypt data.enc.tar.gz data.tar.gz --key KUNCI
+"""
+import argparse
+import io
+import sys
+import tarfile
+import time
+import zipfile
+
+from autokey_fast import AutokeyByteStream, autokeyEncryptBytesMany, autokeyDecryptBytesFast
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+CHUNK_SIZE = 1024 * 1024          # potongan untuk member besar
+SMALL_MEMBER = 64 * 1024          # member <= ini dikumpulkan dalam batch
+BATCH_BYTES = 4 * 1024 * 1024     # total payload maksimum satu batch
+
+
+def cipherMany(payloads: list, key: str, decrypt: bool) -> list:
+    """Proses sekumpulan payload kecil; enkripsi dilakukan dalam satu operasi vektor."""
+    if decrypt:
+        return [autokeyDecryptBytesFast(p, key) if p else b"" for p in payloads]
+    return autokeyEncryptBytesMany(payloads, key)
+
+
+class CipherReader:
+    """File-like yang mengenkripsi/dekripsi isi fileobj saat dibaca."""
+
+    def __init__(self, fileobj, key: str, decrypt: bool):
+        self.fileobj = fileobj
+        self.stream = AutokeyByteStream(key, decrypt=decrypt)
+
+    def read(self, size=-1):
+        return self.stream.update(self.fileobj.read(size))
+
+
+def copyThrough(src, dst, key: str, decrypt: bool, chunk_size: int = CHUNK_SIZE) -> int:
+    stream = AutokeyByteStream(key, decrypt=decrypt)
+    total = 0
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            return total
+        dst.write(stream.update(chunk))
+        total += len(chunk)
+
+# ======================================================
+# ZIP
+# ======================================================
+def _zipInfoLike(info: zipfile.ZipInfo, compression: int) -> zipfile.ZipInfo:
+    out = zipfile.ZipInfo(info.filename, info.date_time)
+    out.external_attr = info.external_attr
+    out.create_system = info.create_system
+    out.comment = info.comment
+    out.compress_type = compression
+    out.file_size = info.file_size
+    return out
+
+def processZip(src_path: str, dst_path: str, key: str, decrypt: bool, compression: int = None) -> dict:
+    if compression is None:
+        # ciphertext autokey praktis tidak bisa dikompres; hasil dekripsi dikompres lagi
+        compression = zipfile.ZIP_DEFLATED if decrypt else zipfile.ZIP_STORED
+    stats = {"members": 0, "bytes": 0, "batches": 0}
+    batch = []
+
+    def flush(zout):
+        if not batch:
+            return
+        outputs = cipherMany([data for _, data in batch], key, decrypt)
+        for (info, _), data in zip(batch, outputs):
+            zout.writestr(_zipInfoLike(info, compression), data)
+        stats["batches"] += 1
+        batch.clear()
+
+    with zipfile.ZipFile(src_path) as zin, zipfile.ZipFile(dst_path, "w", allowZip64=True) as zout:
+        pending = 0
+        for info in zin.infolist():
+            if info.is_dir():
+                zout.writestr(_zipInfoLike(info, zipfile.ZIP_STORED), b"")
+                continue
+            stats["members"] += 1
+            stats["bytes"] += info.file_size
+            if info.file_size <= SMALL_MEMBER:
+                batch.append((info, zin.read(info)))
+                pending += info.file_size
+                if pending >= BATCH_BYTES:
+                    flush(zout)
+                    pending = 0
+                continue
+            flush(zout)
+            pending = 0
+            with zin.open(info) as src, zout.open(_zipInfoLike(info, compression), "w", force_zip64=True) as dst:
+                copyThrough(src, dst, key, decrypt)
+        flush(zout)
+    return stats
+
+# ======================================================
+# TAR
+# ======================================================
+def _tarWriteMode(path: str) -> str:
+    for suffix, mode in ((".tar.gz", "w|gz"), (".tgz", "w|gz"), (".tar.bz2", "w|bz2"), (".tar.xz", "w|xz")):
+        if path.endswith(suffix):
+            return mode
+    return "w|"
+
+def processTar(src_path: str, dst_path: str, key: str, decrypt: bool) -> dict:
+    stats = {"members": 0, "bytes": 0, "batches": 0}
+    batch = []
+
+    def flush(tout):
+        if not batch:
+            return
+        outputs = cipherMany([data for _, data in batch], key, decrypt)
+        for (member, _), data in zip(batch, outputs):
+            tout.addfile(member, io.BytesIO(data))
+        stats["batches"] += 1
+        batch.clear()
+
+    # mode "|" = stream murni: tidak ada seek, member dibaca berurutan
+    with open(src_path, "rb") as fin, open(dst_path, "wb") as fout, \
+            tarfile.open(fileobj=fin, mode="r|*") as tin, \
+            tarfile.open(fileobj=fout, mode=_tarWriteMode(dst_path)) as tout:
+        pending = 0
+        for member in tin:
+            if not member.isfile():
+                flush(tout)
+                pending = 0
+                tout.addfile(member)
+                continue
+            stats["members"] += 1
+            stats["bytes"] += member.size
+            src = tin.extractfile(member)
+            if member.size <= SMALL_MEMBER:
+                batch.append((member, src.read()))
+                pending += member.size
+                if pending >= BATCH_BYTES:
+                    flush(tout)
+                    pending = 0
+                continue
+            flush(tout)
+            pending = 0
+            tout.addfile(member, CipherReader(src, key, decrypt))
+        flush(tout)
+    return stats
+
+# ======================================================
+# ENTRY POINT
+# ======================================================
+def processArchive(src_path: str, dst_path: str, key: str, decrypt: bool = False) -> dict:
+    if not key:
+        raise ValueError("Key tidak boleh kosong!")
+    start = time.perf_counter()
+    if zipfile.is_zipfile(src_path):
+        stats = processZip(src_path, dst_path, key, decrypt)
+        stats["format"] = "zip"
+    elif tarfile.is_tarfile(src_path):
+        stats = processTar(src_path, dst_path, key, decrypt)
+        stats["format"] = "tar"
+    else:
+        raise ValueError(f"{src_path} bukan arsip ZIP/TAR")
+    stats["elapsed_s"] = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enkripsi/dekripsi isi arsip ZIP/TAR secara streaming")
+    parser.add_argument("operation", choices=["encrypt", "decrypt"])
+    parser.add_argument("source")
+    parser.add_argument("target")
+    parser.add_argument("--key", required=True)
+    args = parser.parse_args(argv)
+
+    stats = processArchive(args.source, args.target, args.key, args.operation == "decrypt")
+    mb = stats["bytes"] / (1024 * 1024)
+    print(f"{stats['format'].upper()}: {stats['members']} member, {mb:.2f} MB, "
+          f"{stats['batches']} batch member kecil, {stats['elapsed_s']:.2f} s "
+          f"({mb / stats['elapsed_s'] if stats['elapsed_s'] else 0:.2f} MB/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
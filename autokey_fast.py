@@ -0,0 +1,289 @@
+"""
+Engine Autokey Cipher versi vektor (NumPy).
+
+Hasilnya identik dengan fungsi referensi di autokey_functions.py, tetapi
+tanpa tabel proses per karakter sehingga cocok untuk input besar.
+"""
+import numpy as np
+
+from autokey_functions import normalizeText, onlyLettersUpper, prepareKey
+from instrumentation import timed
+
+# ======================================================
+# HELPER FUNCTIONS
+# ======================================================
+def textToCodes(s: str) -> np.ndarray:
+    """String -> array code point (uint32), tanpa loop Python."""
+    return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+
+def codesToText(codes: np.ndarray) -> str:
+    return np.ascontiguousarray(codes, dtype=np.uint32).tobytes().decode("utf-32-le")
+
+def alphaMask(codes: np.ndarray) -> np.ndarray:
+    """Setara dengan str.isalpha() per karakter."""
+    mask = ((codes >= 65) & (codes <= 90)) | ((codes >= 97) & (codes <= 122))
+    high = codes >= 128
+    if high.any():
+        # Karakter non-ASCII: cek isalpha() sekali per code point unik
+        uniq = np.unique(codes[high])
+        alpha = np.fromiter((chr(c).isalpha() for c in uniq.tolist()), dtype=bool, count=len(uniq))
+        mask[high] = np.isin(codes[high], uniq[alpha])
+    return mask
+
+def keyToNums(key) -> np.ndarray:
+    """Key teks -> array nilai 0-25 (hanya huruf A-Z, sama seperti referensi)."""
+    return prepareKey(key).nums
+
+def keyToBytes(key) -> np.ndarray:
+    schedule = prepareKey(key)
+    if not schedule.byteLength:
+        raise ValueError("Key tidak boleh kosong!")
+    return schedule.byteArray
+
+def asByteArray(data) -> np.ndarray:
+    """Objek buffer apa pun (bytes, bytearray, memoryview, mmap) -> view uint8 tanpa copy."""
+    return np.frombuffer(data, dtype=np.uint8)
+
+def asWritableByteArray(out, size: int) -> np.ndarray:
+    arr = np.frombuffer(out, dtype=np.uint8)
+    if not arr.flags.writeable:
+        raise ValueError("Buffer output harus writable (bytearray, memoryview, mmap)")
+    if len(arr) < size:
+        raise ValueError(f"Buffer output terlalu kecil: {len(arr)} < {size} byte")
+    return arr[:size]
+
+# ======================================================
+# KERNEL AUTOKEY
+# ======================================================
+def autokeyKeystream(values: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Keystream autokey untuk enkripsi: key diikuti plaintext itu sendiri."""
+    n, L = len(values), len(key)
+    ks = np.empty(n, dtype=values.dtype)
+    head = min(n, L)
+    ks[:head] = key[:head]
+    ks[head:] = values[:n - head]
+    return ks
+
+def autokeyRecover(ct: np.ndarray, key: np.ndarray, modulus: int) -> np.ndarray:
+    """
+    Dekripsi autokey tanpa loop: untuk setiap kelas residu posisi (i mod L),
+    P_j = C_j - P_(j-1), sehingga (-1)^j * P_j = -K + sum_(i<=j) (-1)^i * C_i.
+    """
+    n, L = len(ct), len(key)
+    if n == 0:
+        return ct.copy()
+    rows = -(-n // L)
+    grid = np.zeros(rows * L, dtype=ct.dtype)
+    grid[:n] = ct
+    grid = grid.reshape(rows, L)
+    grid[1::2] = -grid[1::2]
+    if modulus == 256:
+        # uint8 wrap-around = mod 256
+        q = np.cumsum(grid, axis=0, dtype=np.uint8) - key.astype(np.uint8)
+    else:
+        q = np.cumsum(grid, axis=0) - key
+    q[1::2] = -q[1::2]
+    if modulus != 256:
+        q %= modulus
+    return q.reshape(-1)[:n]
+
+# ======================================================
+# TEXT ENGINES
+# ======================================================
+def splitText(text: str):
+    """Code point teks ter-normalisasi, mask spasi dan mask huruf."""
+    codes = textToCodes(normalizeText(text).upper())
+    return codes, codes == 32, alphaMask(codes)
+
+@timed("cipher", op="encrypt", engine="vectorized")
+def autokeyEncryptFast(plaintext, key) -> str:
+    codes, spaces, letters = splitText(plaintext)
+    pt = codes[letters].astype(np.int64) - 65
+    keyNums = keyToNums(key)
+    if len(keyNums) == 0:
+        ct = pt % 26
+    else:
+        ct = (pt + autokeyKeystream(pt, keyNums)) % 26
+    out = codes.copy()
+    out[letters] = ct + 65
+    return codesToText(out[spaces | letters])
+
+@timed("cipher", op="decrypt", engine="vectorized")
+def autokeyDecryptFast(ciphertext, key) -> str:
+    codes, spaces, letters = splitText(ciphertext)
+    ct = (codes[letters].astype(np.int64) - 65) % 26
+    keyNums = keyToNums(key)
+    if len(keyNums) == 0:
+        pt = ct
+    else:
+        pt = autokeyRecover(ct, keyNums, 26)
+    out = codes.copy()
+    out[letters] = pt + 65
+    return codesToText(out[spaces | letters])
+
+def findKeystream(plaintext, ciphertext) -> np.ndarray:
+    """Nilai keystream (CT - PT) mod 26 di posisi yang keduanya huruf, seperti findKey."""
+    plaintext = normalizeText(plaintext).upper()
+    ciphertext = normalizeText(ciphertext).upper()
+    n = min(len(plaintext), len(ciphertext))
+    pt = textToCodes(plaintext[:n])
+    ct = textToCodes(ciphertext[:n])
+    both = alphaMask(pt) & alphaMask(ct)
+    return (ct[both].astype(np.int64) - pt[both].astype(np.int64)) % 26
+
+@timed("cipher", op="findKey", engine="vectorized")
+def findKeyFast(plaintext, ciphertext) -> str:
+    keystream = codesToText(findKeystream(plaintext, ciphertext) + 65)
+
+    plain_no_space = onlyLettersUpper(normalizeText(plaintext).upper())
+    idx = keystream.find(plain_no_space[:5])
+    return keystream[:idx] if idx != -1 else keystream
+
+# ======================================================
+# BINARY ENGINES
+# ======================================================
+@timed("cipher", op="encryptBytes", engine="vectorized")
+def autokeyEncryptBytesFast(data, key, out=None):
+    """
+    data boleh objek buffer apa pun. Jika out diberikan (buffer writable,
+    boleh sama dengan data untuk in-place), hasil ditulis ke sana per potongan
+    sehingga alokasi tambahan dibatasi ukuran potongan, dan out dikembalikan.
+    """
+    if out is not None:
+        return processBytesInto(data, key, out, decrypt=False)
+    keyBytes = keyToBytes(key)
+    pt = asByteArray(data)
+    return (pt + autokeyKeystream(pt, keyBytes)).tobytes()
+
+@timed("cipher", op="decryptBytes", engine="vectorized")
+def autokeyDecryptBytesFast(data, key, out=None):
+    """Lihat autokeyEncryptBytesFast untuk arti parameter out."""
+    if out is not None:
+        return processBytesInto(data, key, out, decrypt=True)
+    keyBytes = keyToBytes(key)
+    return autokeyRecover(asByteArray(data), keyBytes, 256).tobytes()
+
+def autokeyEncryptBytesMany(items, key) -> list:
+    """
+    Enkripsi banyak payload kecil dalam satu operasi vektor. Setiap payload
+    dienkripsi terpisah (keystream dimulai lagi dari key), setara dengan
+    [autokeyEncryptBytes(x, key) for x in items].
+    """
+    keyBytes = keyToBytes(key)
+    L = len(keyBytes)
+    sizes = [len(x) for x in items]
+    pt = np.frombuffer(b"".join(items), dtype=np.uint8)
+    ks = np.empty_like(pt)
+    ks[L:] = pt[:len(pt) - L] if len(pt) > L else pt[:0]
+    start = 0
+    for size in sizes:
+        head = min(size, L)
+        ks[start:start + head] = keyBytes[:head]
+        start += size
+    ct = (pt + ks).tobytes()
+    out, start = [], 0
+    for size in sizes:
+        out.append(ct[start:start + size])
+        start += size
+    return out
+
+INTO_CHUNK = 1 << 20
+
+def processBytesInto(data, key, out, decrypt: bool, chunk_size: int = INTO_CHUNK):
+    src = asByteArray(data)
+    dst = asWritableByteArray(out, len(src))
+    stream = AutokeyByteStream(key, decrypt=decrypt)
+    for start in range(0, len(src), chunk_size):
+        end = start + chunk_size
+        stream.updateInto(src[start:end], dst[start:end])
+    return out
+
+# ======================================================
+# CHUNKED STREAM (File Biner per potongan)
+# ======================================================
+class AutokeyByteStream:
+    """
+    Enkripsi/dekripsi biner per potongan (chunk). State yang dibawa antar
+    potongan hanya L byte terakhir dari (key + plaintext), dengan L = panjang key.
+    """
+
+    def __init__(self, key, decrypt: bool = False):
+        self.state = keyToBytes(key).copy()
+        self.decrypt = decrypt
+        self._scratch = None
+
+    @classmethod
+    def fromState(cls, state: bytes, decrypt: bool = False) -> "AutokeyByteStream":
+        """Lanjutkan stream dari state yang disimpan (lihat stateBytes())."""
+        stream = cls.__new__(cls)
+        stream.state = np.frombuffer(bytes(state), dtype=np.uint8).copy()
+        stream.decrypt = decrypt
+        stream._scratch = None
+        return stream
+
+    def stateBytes(self) -> bytes:
+        return self.state.tobytes()
+
+    def update(self, chunk) -> bytes:
+        return self._process(asByteArray(chunk)).tobytes()
+
+    def updateInto(self, chunk, out) -> int:
+        """
+        Seperti update(), tetapi hasil ditulis ke buffer out (boleh sama dengan
+        chunk). Memakai ulang satu buffer kerja, jadi tidak ada alokasi per
+        potongan setelah potongan terbesar pertama.
+        """
+        data = asByteArray(chunk)
+        dst = asWritableByteArray(out, len(data))
+        if len(data):
+            self._processInto(data, dst)
+        return len(data)
+
+    def _work(self, size: int) -> np.ndarray:
+        if self._scratch is None or len(self._scratch) < size:
+            self._scratch = np.empty(size, dtype=np.uint8)
+        return self._scratch[:size]
+
+    def _processInto(self, data: np.ndarray, dst: np.ndarray):
+        n, L = len(data), len(self.state)
+        if self.decrypt:
+            # autokeyRecover (modulus 256) di buffer kerja
+            rows = -(-n // L)
+            work = self._work(rows * L)
+            work[:n] = data
+            work[n:] = 0
+            grid = work.reshape(rows, L)
+            np.negative(grid[1::2], out=grid[1::2])
+            np.cumsum(grid, axis=0, dtype=np.uint8, out=grid)
+            grid -= self.state
+            np.negative(grid[1::2], out=grid[1::2])
+            pt = work[:n]
+            dst[:] = pt
+        else:
+            # plaintext disalin dulu karena dst boleh sama dengan data
+            pt = self._work(n)
+            pt[:] = data
+            head = min(n, L)
+            np.add(pt[:head], self.state[:head], out=dst[:head])
+            np.add(pt[head:], pt[:n - head], out=dst[head:])
+        if n >= L:
+            self.state[:] = pt[-L:]
+        else:
+            self.state[:L - n] = self.state[n:].copy()
+            self.state[L - n:] = pt
+
+    def _process(self, data: np.ndarray) -> np.ndarray:
+        if len(data) == 0:
+            return data
+        if self.decrypt:
+            pt = autokeyRecover(data, self.state, 256)
+            out = pt
+        else:
+            pt = data
+            out = pt + autokeyKeystream(pt, self.state)
+        L = len(self.state)
+        if len(pt) >= L:
+            self.state = pt[-L:].copy()
+        else:
+            self.state = np.concatenate([self.state[len(pt):], pt])
+        return out
@@ -1,5 +1,10 @@
+import numpy as np
 import pandas as pd
 import re
+from functools import lru_cache
+
+import instrumentation
+from instrumentation import stage, count
 
 # ======================================================
 # HELPER FUNCTIONS
@@ -18,12 +23,56 @@ def normalizeText(s: str) -> str:
 def onlyLettersUpper(s: str) -> str:
     return re.sub(r"[^A-Z]", "", s.upper())
 
+# ======================================================
+# KEY SCHEDULE (Key yang sudah disiapkan)
+# ======================================================
+KEY_CACHE_SIZE = 1024
+
+class KeySchedule:
+    """
+    Key yang sudah disiapkan untuk semua engine: huruf A-Z untuk cipher teks
+    (letters/nums) dan byte UTF-8 untuk cipher biner (bytes/byteArray).
+    Semua engine menerima KeySchedule atau string key biasa.
+    """
+    __slots__ = ("raw", "letters", "nums", "bytes", "byteArray", "length", "byteLength")
+
+    def __init__(self, key: str):
+        self.raw = key
+        self.letters = onlyLettersUpper(key)
+        self.nums = np.frombuffer(self.letters.encode("ascii"), dtype=np.uint8).astype(np.int64) - 65
+        self.bytes = key.encode("utf-8")
+        self.byteArray = np.frombuffer(self.bytes, dtype=np.uint8)
+        self.length = len(self.letters)
+        self.byteLength = len(self.bytes)
+        self.nums.flags.writeable = False
+
+    def __repr__(self):
+        return f"KeySchedule(length={self.length}, byteLength={self.byteLength})"
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _cachedKeySchedule(key: str) -> KeySchedule:
+    return KeySchedule(key)
+
+def prepareKey(key) -> KeySchedule:
+    """Ambil KeySchedule dari cache LRU (atau kembalikan apa adanya jika sudah disiapkan)."""
+    if isinstance(key, KeySchedule):
+        return key
+    if not instrumentation.isEnabled():
+        return _cachedKeySchedule(key)
+    hits = _cachedKeySchedule.cache_info().hits
+    with stage("key_prep"):
+        schedule = _cachedKeySchedule(key)
+    instrumentation.recordCacheLookup("key_schedule", _cachedKeySchedule.cache_info().hits > hits)
+    return schedule
+
 # ======================================================
 # TEXT ENCRYPTION (Autokey Cipher)
 # ======================================================
 def autokeyEncrypt(plaintext, key):
-    plaintext = normalizeText(plaintext).upper()
-    key = onlyLettersUpper(key)
+    with stage("normalize", op="encrypt"):
+        plaintext = normalizeText(plaintext).upper()
+        key = prepareKey(key).letters
+    count("chars_total", len(plaintext), op="encrypt")
 
     keyStream = list(key)
     ciphertext = ""
@@ -36,57 +85,62 @@ def autokeyEncrypt(plaintext, key):
         "KeyStream": []
     }
 
-    ki = 0
-    for c in plaintext:
-        if c == " ":
-            ciphertext += " "
-            table["PT"].append(" ")
-            table["n(PT)"].append("")
-            table["K"].append("")
-            table["n(K)"].append("")
-            table["(nPT+nK)%26"].append("")
-            table["CT"].append(" ")
-            table["n(CT)"].append("")
-            table["KeyStream"].append("".join(keyStream))
-            continue
-
-        if not c.isalpha():
-            continue
-
-        while ki < len(keyStream) and not keyStream[ki].isalpha():
+    with stage("cipher_loop", op="encrypt"):
+        ki = 0
+        for c in plaintext:
+            if c == " ":
+                ciphertext += " "
+                table["PT"].append(" ")
+                table["n(PT)"].append("")
+                table["K"].append("")
+                table["n(K)"].append("")
+                table["(nPT+nK)%26"].append("")
+                table["CT"].append(" ")
+                table["n(CT)"].append("")
+                table["KeyStream"].append("".join(keyStream))
+                continue
+
+            if not c.isalpha():
+                continue
+
+            while ki < len(keyStream) and not keyStream[ki].isalpha():
+                ki += 1
+
+            if ki < len(keyStream):
+                k = keyStream[ki]
+            else:
+                k = "A"
+
+            ptN = charToNum(c)
+            kN = charToNum(k)
+            ctN = (ptN + kN) % 26
+            ct = numToChar(ctN)
+
+            ciphertext += ct
+            keyStream.append(c)
             ki += 1
 
-        if ki < len(keyStream):
-            k = keyStream[ki]
-        else:
-            k = "A"
-
-        ptN = charToNum(c)
-        kN = charToNum(k)
-        ctN = (ptN + kN) % 26
-        ct = numToChar(ctN)
-
-        ciphertext += ct
-        keyStream.append(c)
-        ki += 1
-
-        table["PT"].append(c)
-        table["n(PT)"].append(ptN)
-        table["K"].append(k)
-        table["n(K)"].append(kN)
-        table["(nPT+nK)%26"].append(ctN)
-        table["CT"].append(ct)
-        table["n(CT)"].append(ctN)
-        table["KeyStream"].append("".join(keyStream))
+            table["PT"].append(c)
+            table["n(PT)"].append(ptN)
+            table["K"].append(k)
+            table["n(K)"].append(kN)
+            table["(nPT+nK)%26"].append(ctN)
+            table["CT"].append(ct)
+            table["n(CT)"].append(ctN)
+            table["KeyStream"].append("".join(keyStream))
 
-    return ciphertext, pd.DataFrame(table)
+    with stage("dataframe", op="encrypt"):
+        df = pd.DataFrame(table)
+    return ciphertext, df
 
 # ======================================================
 # TEXT DECRYPTION (Autokey Cipher)
 # ======================================================
 def autokeyDecrypt(ciphertext, key):
-    ciphertext = normalizeText(ciphertext).upper()
-    key = onlyLettersUpper(key)
+    with stage("normalize", op="decrypt"):
+        ciphertext = normalizeText(ciphertext).upper()
+        key = prepareKey(key).letters
+    count("chars_total", len(ciphertext), op="decrypt")
 
     keyStream = list(key)
     plaintext = ""
@@ -99,57 +153,62 @@ def autokeyDecrypt(ciphertext, key):
         "KeyStream": []
     }
 
-    ki = 0
-    for c in ciphertext:
-        if c == " ":
-            plaintext += " "
-            table["CT"].append(" ")
-            table["n(CT)"].append("")
-            table["K"].append("")
-            table["n(K)"].append("")
-            table["(nCT-nK)%26"].append("")
-            table["PT"].append(" ")
-            table["n(PT)"].append("")
-            table["KeyStream"].append("".join(keyStream))
-            continue
-
-        if not c.isalpha():
-            continue
-
-        while ki < len(keyStream) and not keyStream[ki].isalpha():
+    with stage("cipher_loop", op="decrypt"):
+        ki = 0
+        for c in ciphertext:
+            if c == " ":
+                plaintext += " "
+                table["CT"].append(" ")
+                table["n(CT)"].append("")
+                table["K"].append("")
+                table["n(K)"].append("")
+                table["(nCT-nK)%26"].append("")
+                table["PT"].append(" ")
+                table["n(PT)"].append("")
+                table["KeyStream"].append("".join(keyStream))
+                continue
+
+            if not c.isalpha():
+                continue
+
+            while ki < len(keyStream) and not keyStream[ki].isalpha():
+                ki += 1
+
+            if ki < len(keyStream):
+                k = keyStream[ki]
+            else:
+                k = "A"
+
+            ctN = charToNum(c)
+            kN = charToNum(k)
+            ptN = (ctN - kN) % 26
+            pt = numToChar(ptN)
+
+            plaintext += pt
+            keyStream.append(pt)
             ki += 1
 
-        if ki < len(keyStream):
-            k = keyStream[ki]
-        else:
-            k = "A"
-
-        ctN = charToNum(c)
-        kN = charToNum(k)
-        ptN = (ctN - kN) % 26
-        pt = numToChar(ptN)
-
-        plaintext += pt
-        keyStream.append(pt)
-        ki += 1
-
-        table["CT"].append(c)
-        table["n(CT)"].append(ctN)
-        table["K"].append(k)
-        table["n(K)"].append(kN)
-        table["(nCT-nK)%26"].append(ptN)
-        table["PT"].append(pt)
-        table["n(PT)"].append(ptN)
-        table["KeyStream"].append("".join(keyStream))
+            table["CT"].append(c)
+            table["n(CT)"].append(ctN)
+            table["K"].append(k)
+            table["n(K)"].append(kN)
+            table["(nCT-nK)%26"].append(ptN)
+            table["PT"].append(pt)
+            table["n(PT)"].append(ptN)
+            table["KeyStream"].append("".join(keyStream))
 
-    return plaintext, pd.DataFrame(table)
+    with stage("dataframe", op="decrypt"):
+        df = pd.DataFrame(table)
+    return plaintext, df
 
 # ======================================================
 # FIND KEY (Key Recovery Attack)
 # ======================================================
 def findKey(plaintext, ciphertext):
-    plaintext = normalizeText(plaintext).upper()
-    ciphertext = normalizeText(ciphertext).upper()
+    with stage("normalize", op="findKey"):
+        plaintext = normalizeText(plaintext).upper()
+        ciphertext = normalizeText(ciphertext).upper()
+    count("chars_total", len(plaintext), op="findKey")
 
     keystream = ""
     table = {
@@ -159,31 +218,32 @@ def findKey(plaintext, ciphertext):
         "Key": [], "n(Key)": []
     }
 
-    for pt, ct in zip(plaintext, ciphertext):
-        if not pt.isalpha() or not ct.isalpha():
+    with stage("cipher_loop", op="findKey"):
+        for pt, ct in zip(plaintext, ciphertext):
+            if not pt.isalpha() or not ct.isalpha():
+                table["PT"].append(pt)
+                table["n(PT)"].append("")
+                table["CT"].append(ct)
+                table["n(CT)"].append("")
+                table["(nCT-nPT)%26"].append("")
+                table["Key"].append(" ")
+                table["n(Key)"].append("")
+                continue
+
+            ptN = charToNum(pt)
+            ctN = charToNum(ct)
+            kN = (ctN - ptN) % 26
+            k = numToChar(kN)
+
+            keystream += k
+
             table["PT"].append(pt)
-            table["n(PT)"].append("")
+            table["n(PT)"].append(ptN)
             table["CT"].append(ct)
-            table["n(CT)"].append("")
-            table["(nCT-nPT)%26"].append("")
-            table["Key"].append(" ")
-            table["n(Key)"].append("")
-            continue
-
-        ptN = charToNum(pt)
-        ctN = charToNum(ct)
-        kN = (ctN - ptN) % 26
-        k = numToChar(kN)
-
-        keystream += k
-
-        table["PT"].append(pt)
-        table["n(PT)"].append(ptN)
-        table["CT"].append(ct)
-        table["n(CT)"].append(ctN)
-        table["(nCT-nPT)%26"].append(kN)
-        table["Key"].append(k)
-        table["n(Key)"].append(kN)
+            table["n(CT)"].append(ctN)
+            table["(nCT-nPT)%26"].append(kN)
+            table["Key"].append(k)
+            table["n(Key)"].append(kN)
 
     plain_no_space = onlyLettersUpper(plaintext)
     idx = keystream.find(plain_no_space[:5])
@@ -192,58 +252,84 @@ def findKey(plaintext, ciphertext):
     else:
         real_key = keystream
 
-    return real_key, pd.DataFrame(table)
+    with stage("dataframe", op="findKey"):
+        df = pd.DataFrame(table)
+    return real_key, df
 
 # ======================================================
 # BINARY FILE ENCRYPTION (File Biner Implementation)
 # ======================================================
-def autokeyEncryptBytes(data: bytes, key: str) -> bytes:
+def autokeyEncryptBytes(data, key, out=None):
     """
     Enkripsi file biner byte-per-byte menggunakan Autokey Cipher.
     Header file ikut terenkripsi sehingga file tidak bisa dibuka.
+
+    key boleh string atau KeySchedule dari prepareKey().
+    data boleh berupa objek buffer apa pun (bytes, bytearray, memoryview, mmap).
+    Jika out (buffer writable) diberikan, hasil ditulis ke out dan out dikembalikan;
+    out boleh sama dengan data untuk enkripsi in-place.
     """
-    if not key:
+    schedule = prepareKey(key)
+    if not schedule.byteLength:
         raise ValueError("Key tidak boleh kosong!")
     
-    key_bytes = key.encode("utf-8")
+    data = memoryview(data).cast("B")
+    count("bytes_total", len(data), op="encryptBytes")
+    key_bytes = schedule.bytes
     keyStream = bytearray(key_bytes)
-    result = bytearray()
-
-    for i, b in enumerate(data):
-        if i < len(keyStream):
-            k = keyStream[i]
-        else:
-            k = keyStream[i % len(key_bytes)]
+    result = bytearray() if out is None else memoryview(out).cast("B")
+    if out is not None and len(result) < len(data):
+        raise ValueError("Buffer output terlalu kecil!")
+
+    with stage("cipher_loop", op="encryptBytes"):
+        for i, b in enumerate(data):
+            if i < len(keyStream):
+                k = keyStream[i]
+            else:
+                k = keyStream[i % len(key_bytes)]
         
-        ct = (b + k) % 256
-        result.append(ct)
-        keyStream.append(b)
+            ct = (b + k) % 256
+            if out is None:
+                result.append(ct)
+            else:
+                result[i] = ct
+            keyStream.append(b)
 
-    return bytes(result)
+    return bytes(result) if out is None else out
 
 # ======================================================
 # BINARY FILE DECRYPTION (File Biner Implementation)
 # ======================================================
-def autokeyDecryptBytes(data: bytes, key: str) -> bytes:
+def autokeyDecryptBytes(data, key, out=None):
     """
     Dekripsi file biner byte-per-byte menggunakan Autokey Cipher.
     File akan kembali ke kondisi semula dan bisa dibuka.
+    Parameter data dan out sama seperti autokeyEncryptBytes.
     """
-    if not key:
+    schedule = prepareKey(key)
+    if not schedule.byteLength:
         raise ValueError("Key tidak boleh kosong!")
     
-    key_bytes = key.encode("utf-8")
+    data = memoryview(data).cast("B")
+    count("bytes_total", len(data), op="decryptBytes")
+    key_bytes = schedule.bytes
     keyStream = bytearray(key_bytes)
-    result = bytearray()
-
-    for i, b in enumerate(data):
-        if i < len(keyStream):
-            k = keyStream[i]
-        else:
-            k = keyStream[i % len(key_bytes)]
+    result = bytearray() if out is None else memoryview(out).cast("B")
+    if out is not None and len(result) < len(data):
+        raise ValueError("Buffer output terlalu kecil!")
+
+    with stage("cipher_loop", op="decryptBytes"):
+        for i, b in enumerate(data):
+            if i < len(keyStream):
+                k = keyStream[i]
+            else:
+                k = keyStream[i % len(key_bytes)]
         
-        pt = (b - k) % 256
-        result.append(pt)
-        keyStream.append(pt)
-
-    return bytes(result)
+            pt = (b - k) % 256
+            if out is None:
+                result.append(pt)
+            else:
+                result[i] = pt
+            keyStream.append(pt)
+
+    return bytes(result) if out is None else out
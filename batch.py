@@ -0,0 +1,234 @@
+"""
+Batch enkripsi/dekripsi file biner untuk satu folder (rekursif) atau manifest.
+
+Setiap file diproses dengan semantik autokeyEncryptBytes/autokeyDecryptBytes
+(key UTF-8, seluruh byte termasuk header), memakai worker pool seukuran
+jumlah core. Output ditulis atomik (file sementara + rename) dan file yang
+output-nya sudah lebih baru dari input akan dilewati.
+
+Contoh:
+    python batch.py encrypt dokumen/ --output-dir terenkripsi/ --key KUNCI
+    python batch.py decrypt terenkripsi/ --output-dir hasil/ --key-file sample/key.txt
+    python batch.py encrypt --manifest daftar.txt --output-dir out/ --key KUNCI
+"""
+import argparse
+import os
+import stat
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from autokey_fast import AutokeyByteStream
+from pipeline import pipelineCopy
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+CHUNK_SIZE = 4 * 1024 * 1024
+ENC_SUFFIX = ".enc"
+
+
+@dataclass
+class Job:
+    source: str
+    target: str
+
+
+@dataclass
+class JobResult:
+    source: str
+    target: str
+    status: str          # "ok", "skipped", "failed"
+    size: int = 0
+    error: str = ""
+
+# ======================================================
+# DAFTAR FILE
+# ======================================================
+def outputName(name: str, decrypt: bool) -> str:
+    if not decrypt:
+        return name + ENC_SUFFIX
+    if name.endswith(ENC_SUFFIX):
+        return name[:-len(ENC_SUFFIX)]
+    return name + ".dec"
+
+def walkDirectory(root: str):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            yield path, os.path.relpath(path, root)
+
+def manifestRelPath(source: str, base: str) -> str:
+    """
+    Path output untuk entri manifest: relatif terhadap folder manifest, atau
+    path absolut tanpa root (/data/a.log -> data/a.log) jika berada di luar
+    folder itu, sehingga struktur folder tetap terjaga di output_dir.
+    """
+    source = os.path.abspath(source)
+    try:
+        rel = os.path.relpath(source, base)
+    except ValueError:          # drive berbeda (Windows)
+        rel = os.pardir
+    if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+        drive, tail = os.path.splitdrive(source)
+        rel = os.path.join(drive.replace(":", ""), tail.lstrip("\\/"))
+    return rel
+
+def readManifest(path: str):
+    """Satu path per baris (relatif terhadap folder manifest); baris '#' diabaikan."""
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            source = line if os.path.isabs(line) else os.path.join(base, line)
+            yield source, manifestRelPath(source, base)
+
+def buildJobs(entries, output_dir: str, decrypt: bool) -> list:
+    """Buat job per file; ValueError jika dua file menghasilkan output yang sama."""
+    jobs = []
+    targets = {}
+    for source, rel in entries:
+        head, name = os.path.split(rel)
+        target = os.path.join(output_dir, head, outputName(name, decrypt))
+        key = os.path.normcase(os.path.normpath(target))
+        if key in targets:
+            raise ValueError(f"{targets[key]} dan {source} menghasilkan output yang sama: {target}")
+        targets[key] = source
+        jobs.append(Job(source, target))
+    return jobs
+
+def isUpToDate(job: Job) -> bool:
+    try:
+        return os.path.getmtime(job.target) >= os.path.getmtime(job.source)
+    except OSError:
+        return False
+
+# ======================================================
+# PROSES SATU FILE
+# ======================================================
+def processFile(job: Job, key: str, decrypt: bool, chunk_size: int = CHUNK_SIZE, depth: int = 0) -> JobResult:
+    """
+    Enkripsi/dekripsi satu file per potongan, tulis ke file sementara lalu rename.
+    depth > 0 memakai pipeline baca/cipher/tulis dengan depth buffer.
+    """
+    try:
+        target_dir = os.path.dirname(job.target) or "."
+        os.makedirs(target_dir, exist_ok=True)
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=target_dir)
+        try:
+            with os.fdopen(fd, "wb") as out, open(job.source, "rb") as src:
+                if depth:
+                    size = pipelineCopy(src, out, key, decrypt, chunk_size, depth)["bytes"]
+                else:
+                    stream = AutokeyByteStream(key, decrypt=decrypt)
+                    while True:
+                        chunk = src.read(chunk_size)
+                        if not chunk:
+                            break
+                        out.write(stream.update(chunk))
+                        size += len(chunk)
+                out.flush()
+                os.fsync(out.fileno())
+            # mkstemp membuat file 0600; samakan izin dengan file sumber
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(job.source).st_mode))
+            os.replace(tmp_path, job.target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return JobResult(job.source, job.target, "ok", size)
+    except Exception as e:
+        return JobResult(job.source, job.target, "failed", error=str(e))
+
+
+def runBatch(jobs: list, key: str, decrypt: bool, workers: int = None, use_threads: bool = False,
+             force: bool = False, log=print, chunk_size: int = CHUNK_SIZE, depth: int = 0) -> dict:
+    if not key:
+        raise ValueError("Key tidak boleh kosong!")
+    workers = workers or os.cpu_count() or 1
+    results = []
+    pending = []
+    for job in jobs:
+        if not force and isUpToDate(job):
+            results.append(JobResult(job.source, job.target, "skipped"))
+        else:
+            pending.append(job)
+
+    start = time.perf_counter()
+    Executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    if pending:
+        with Executor(max_workers=min(workers, len(pending))) as pool:
+            futures = [pool.submit(processFile, job, key, decrypt, chunk_size, depth) for job in pending]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                mark = {"ok": "✓", "failed": "✗"}[result.status]
+                log(f"  {mark} {result.source}" + (f" ({result.error})" if result.error else ""))
+    elapsed = time.perf_counter() - start
+
+    processed = sum(r.size for r in results if r.status == "ok")
+    return {
+        "results": results,
+        "ok": sum(r.status == "ok" for r in results),
+        "skipped": sum(r.status == "skipped" for r in results),
+        "failed": sum(r.status == "failed" for r in results),
+        "bytes": processed,
+        "elapsed_s": elapsed,
+        "throughput_mb_s": processed / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+        "workers": workers,
+    }
+
+# ======================================================
+# CLI
+# ======================================================
+def readKey(args) -> str:
+    if args.key_file:
+        with open(args.key_file, encoding="utf-8") as f:
+            return f.read().strip()
+    return args.key
+
+
+def main(argv=None):
+    from benchmark import parseSize
+
+    parser = argparse.ArgumentParser(description="Batch enkripsi/dekripsi file dengan Autokey Cipher")
+    parser.add_argument("operation", choices=["encrypt", "decrypt"])
+    parser.add_argument("input_dir", nargs="?", help="Folder input (diproses rekursif)")
+    parser.add_argument("--manifest", help="File berisi daftar path (alternatif input_dir)")
+    parser.add_argument("--output-dir", required=True)
+    key_group = parser.add_mutually_exclusive_group(required=True)
+    key_group.add_argument("--key")
+    key_group.add_argument("--key-file")
+    parser.add_argument("--workers", type=int, default=None, help="Default: jumlah core")
+    parser.add_argument("--threads", action="store_true", help="Pakai thread pool, bukan process pool")
+    parser.add_argument("--force", action="store_true", help="Proses ulang walau output sudah terbaru")
+    parser.add_argument("--chunk-size", default="4MB", help="Ukuran potongan per baca/tulis")
+    parser.add_argument("--queue-depth", type=int, default=0,
+                        help="> 0: baca, cipher, dan tulis berjalan bersamaan dengan N buffer (lihat pipeline.py)")
+    args = parser.parse_args(argv)
+
+    if bool(args.input_dir) == bool(args.manifest):
+        parser.error("Berikan tepat satu: input_dir atau --manifest")
+    entries = readManifest(args.manifest) if args.manifest else walkDirectory(args.input_dir)
+    decrypt = args.operation == "decrypt"
+    try:
+        jobs = buildJobs(entries, args.output_dir, decrypt)
+    except ValueError as e:
+        parser.error(str(e))
+
+    summary = runBatch(jobs, readKey(args), decrypt, args.workers, args.threads, args.force,
+                       chunk_size=parseSize(args.chunk_size), depth=args.queue_depth)
+    print(f"\nSelesai: {summary['ok']} diproses, {summary['skipped']} dilewati, "
+          f"{summary['failed']} gagal ({summary['workers']} worker)")
+    print(f"Total {summary['bytes'] / (1024 * 1024):.2f} MB dalam {summary['elapsed_s']:.2f} s "
+          f"= {summary['throughput_mb_s']:.2f} MB/s")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
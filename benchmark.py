@@ -0,0 +1,292 @@
+"""
+Benchmark suite untuk engine Autokey Cipher.
+
+Mengukur throughput, latency, dan peak memory untuk setiap engine
+(teks, find key, dan biner) pada berbagai ukuran input, menyimpan hasil
+sebagai JSON, dan membandingkannya dengan baseline yang tersimpan.
+
+Contoh:
+    python benchmark.py --sizes 1KB,64KB,1MB --output hasil.json
+    python benchmark.py --save-baseline benchmark_baseline.json
+    python benchmark.py --baseline benchmark_baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from autokey_functions import *
+from autokey_fast import *
+from alphabet import *
+from compression import encryptCompressed
+from dispatcher import getDispatcher
+from parallel_text import autokeyDecryptParallel
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+ALL_SIZES = ["1KB", "16KB", "64KB", "1MB", "16MB", "256MB", "1GB"]
+DEFAULT_SIZES = ["1KB", "16KB", "64KB", "1MB"]
+DEFAULT_KEY = "KUNCIRAHASIA"
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample")
+SAMPLE_FILES = ["plaintext.txt", "ciphertext.txt", "plaintext.pdf", "plaintext.jpg"]
+
+# Engine referensi yang membangun tabel proses hanya diukur sampai batas ini;
+# ukuran di atasnya dilaporkan "skipped". Tabel encrypt/decrypt menyimpan
+# KeyStream kumulatif per karakter (O(n^2): 64 KB sudah ±12 s dan 5 GB RSS);
+# tabel findKey linear tetapi ±350 byte RAM per karakter.
+SIZE_LIMITS = {
+    "autokeyEncrypt": 16 * 1024,
+    "autokeyDecrypt": 16 * 1024,
+    "findKey": 1024 * 1024,
+}
+
+
+def parseSize(text: str) -> int:
+    text = text.strip().upper()
+    for unit in ("GB", "MB", "KB", "B"):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * SIZE_UNITS[unit])
+    return int(text)
+
+
+def formatSize(n: int) -> str:
+    for unit in ("GB", "MB", "KB"):
+        if n >= SIZE_UNITS[unit] and n % SIZE_UNITS[unit] == 0:
+            return f"{n // SIZE_UNITS[unit]}{unit}"
+    return f"{n}B"
+
+
+# ======================================================
+# INPUT SINTETIS
+# ======================================================
+def syntheticText(size: int, seed: int = 0) -> str:
+    """Teks huruf A-Z dengan spasi (rata-rata kata 6 huruf)."""
+    rng = random.Random(seed)
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ     "
+    return "".join(rng.choices(letters, k=size))
+
+
+def syntheticBytes(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+# ======================================================
+# ENGINE YANG DIUKUR
+# ======================================================
+# kind menentukan input: "text" -> (teks, key), "bytes" -> (data, key),
+# "findkey" -> (plaintext, ciphertext)
+ENGINES = {
+    "autokeyEncrypt": ("text", lambda data, key: autokeyEncrypt(data, key)),
+    "autokeyDecrypt": ("text", lambda data, key: autokeyDecrypt(data, key)),
+    "findKey": ("findkey", lambda pair, key: findKey(*pair)),
+    "autokeyEncryptBytes": ("bytes", lambda data, key: autokeyEncryptBytes(data, key)),
+    "autokeyDecryptBytes": ("bytes", lambda data, key: autokeyDecryptBytes(data, key)),
+    "autokeyEncryptFast": ("text", lambda data, key: autokeyEncryptFast(data, key)),
+    "autokeyDecryptFast": ("text", lambda data, key: autokeyDecryptFast(data, key)),
+    "autokeyDecryptParallel": ("text", lambda data, key: autokeyDecryptParallel(data, key)),
+    "findKeyFast": ("findkey", lambda pair, key: findKeyFast(*pair)),
+    "autokeyEncryptBytesFast": ("bytes", lambda data, key: autokeyEncryptBytesFast(data, key)),
+    "autokeyDecryptBytesFast": ("bytes", lambda data, key: autokeyDecryptBytesFast(data, key)),
+    "autokeyEncryptAlphabet[latin]": ("text", lambda data, key: autokeyEncryptAlphabet(data, key, "latin")),
+    "autokeyEncryptAlphabet[latin-ext]": ("text", lambda data, key: autokeyEncryptAlphabet(data, key, "latin-ext")),
+    "encryptCompressed[zlib]": ("bytes", lambda data, key: encryptCompressed(data, key, "zlib")),
+    "encryptCompressed[lzma]": ("bytes", lambda data, key: encryptCompressed(data, key, "lzma")),
+    "dispatchEncrypt": ("text", lambda data, key: getDispatcher().encrypt(data, key)),
+    "dispatchDecrypt": ("text", lambda data, key: getDispatcher().decrypt(data, key)),
+    "dispatchEncryptBytes": ("bytes", lambda data, key: getDispatcher().encrypt(data, key)),
+    "dispatchDecryptBytes": ("bytes", lambda data, key: getDispatcher().decrypt(data, key)),
+}
+
+
+def buildInput(kind: str, source, key: str):
+    """Ubah sumber (str/bytes) menjadi argumen sesuai jenis engine."""
+    if kind == "bytes":
+        return source if isinstance(source, bytes) else source.encode("utf-8")
+    text = source if isinstance(source, str) else source.decode("utf-8", errors="ignore")
+    if kind == "findkey":
+        ciphertext = autokeyEncryptFast(text, key)
+        return (normalizeText(text).upper(), ciphertext)
+    return text
+
+
+def measure(fn, data, key: str, repeat: int, track_memory: bool) -> dict:
+    """Jalankan fn beberapa kali; latency dari run biasa, memori dari satu run terpisah."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data, key)
+        timings.append(time.perf_counter() - start)
+
+    peak = None
+    if track_memory:
+        # tracemalloc memperlambat eksekusi, jadi tidak dipakai untuk timing
+        tracemalloc.start()
+        fn(data, key)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "latency_min_s": min(timings),
+        "latency_median_s": statistics.median(timings),
+        "peak_memory_bytes": peak,
+    }
+
+
+def skipReason(name: str, size: int):
+    limit = SIZE_LIMITS.get(name)
+    if limit is not None and size > limit:
+        return f"> {formatSize(limit)} (tabel proses)"
+    return None
+
+
+def skippedCase(name: str, label: str, size: int, reason: str) -> dict:
+    return {"engine": name, "input": label, "size_bytes": size, "repeat": 0,
+            "latency_min_s": None, "latency_median_s": None, "peak_memory_bytes": None,
+            "throughput_mb_s": None, "skipped": reason}
+
+
+def runCase(name: str, label: str, source, key: str, repeat: int, track_memory: bool) -> dict:
+    kind, fn = ENGINES[name]
+    reason = skipReason(name, len(source))
+    if reason:
+        return skippedCase(name, label, len(source), reason)
+    data = buildInput(kind, source, key)
+    size = len(data[0]) if kind == "findkey" else len(data)
+    stats = measure(fn, data, key, repeat, track_memory)
+    median = stats["latency_median_s"]
+    stats["throughput_mb_s"] = (size / SIZE_UNITS["MB"]) / median if median > 0 else None
+    return {"engine": name, "input": label, "size_bytes": size, "repeat": repeat, **stats}
+
+
+def logResult(result: dict, log=print):
+    if result.get("skipped"):
+        log(f" {'skipped':>13}  {result['skipped']}")
+    else:
+        log(f" {result['latency_median_s'] * 1000:10.2f} ms")
+
+
+def runSuite(engines, sizes, key: str, repeat: int, track_memory: bool, include_samples: bool, log=print) -> list:
+    results = []
+    for name in engines:
+        kind, _ = ENGINES[name]
+        for size in sizes:
+            label = f"synthetic-{formatSize(size)}"
+            log(f"  {name:<34} {label:<22}", end="", flush=True)
+            reason = skipReason(name, size)
+            if reason:
+                result = skippedCase(name, label, size, reason)
+            else:
+                source = syntheticBytes(size) if kind == "bytes" else syntheticText(size)
+                result = runCase(name, label, source, key, repeat, track_memory)
+            logResult(result, log)
+            results.append(result)
+
+        if include_samples:
+            for filename in SAMPLE_FILES:
+                path = os.path.join(SAMPLE_DIR, filename)
+                if not os.path.exists(path):
+                    continue
+                if kind != "bytes" and not filename.endswith(".txt"):
+                    continue
+                with open(path, "rb") as f:
+                    source = f.read()
+                label = f"sample/{filename}"
+                log(f"  {name:<34} {label:<22}", end="", flush=True)
+                result = runCase(name, label, source, key, repeat, track_memory)
+                logResult(result, log)
+                results.append(result)
+    return results
+
+
+# ======================================================
+# BASELINE
+# ======================================================
+def compareBaseline(results: list, baseline: dict, tolerance: float) -> list:
+    """Kembalikan daftar regresi: throughput turun lebih dari `tolerance` (fraksi)."""
+    previous = {(r["engine"], r["input"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        old = previous.get((r["engine"], r["input"]))
+        if not old or not old.get("throughput_mb_s") or not r.get("throughput_mb_s"):
+            continue
+        ratio = r["throughput_mb_s"] / old["throughput_mb_s"]
+        if ratio < 1 - tolerance:
+            regressions.append({
+                "engine": r["engine"], "input": r["input"],
+                "baseline_mb_s": old["throughput_mb_s"],
+                "current_mb_s": r["throughput_mb_s"],
+                "ratio": ratio,
+            })
+    return regressions
+
+
+def environmentInfo() -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark engine Autokey Cipher")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        help=f"Daftar ukuran dipisah koma, atau 'all' ({','.join(ALL_SIZES)})")
+    parser.add_argument("--engines", default=",".join(ENGINES),
+                        help="Daftar engine dipisah koma")
+    parser.add_argument("--key", default=DEFAULT_KEY)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Lewati pengukuran peak memory")
+    parser.add_argument("--no-samples", action="store_true", help="Lewati file di folder sample/")
+    parser.add_argument("--output", help="Simpan hasil ke file JSON")
+    parser.add_argument("--baseline", help="Bandingkan dengan baseline JSON")
+    parser.add_argument("--save-baseline", help="Simpan hasil sebagai baseline baru")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Penurunan throughput yang masih ditoleransi (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    size_names = ALL_SIZES if args.sizes == "all" else args.sizes.split(",")
+    sizes = [parseSize(s) for s in size_names]
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    unknown = [e for e in engines if e not in ENGINES]
+    if unknown:
+        parser.error(f"Engine tidak dikenal: {', '.join(unknown)}")
+
+    if any(e.startswith("dispatch") for e in engines):
+        getDispatcher().models      # kalibrasi (atau baca cache) di luar pengukuran
+    print(f"Benchmark: {len(engines)} engine x {len(sizes)} ukuran (repeat={args.repeat})")
+    results = runSuite(engines, sizes, args.key, args.repeat,
+                       not args.no_memory, not args.no_samples)
+    report = {"environment": environmentInfo(), "results": results}
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"Hasil disimpan ke {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compareBaseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regresi terdeteksi:")
+            for r in regressions:
+                print(f"  {r['engine']} [{r['input']}]: "
+                      f"{r['baseline_mb_s']:.3f} -> {r['current_mb_s']:.3f} MB/s ({r['ratio']:.0%})")
+            return 1
+        print("\n✅ Tidak ada regresi dibanding baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
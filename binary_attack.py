@@ -0,0 +1,486 @@
+"""
+Serangan ciphertext-only pada file biner hasil autokeyEncryptBytes (tanpa
+plaintext sama sekali).
+
+Dekripsi dengan key nol memberi D = PT + k pada blok genap (blok = L byte)
+dan D = PT - k pada blok ganjil, terpisah untuk setiap posisi key r (kelas
+residu i mod L, lihat autokeyRecover). Untuk setiap kandidat panjang key L:
+1. D dihitung per kelas residu, lalu dibuat histogram blok genap dan ganjil
+   per kelas. Bagian ini dibagi ke proses worker per kelompok posisi key.
+2. Ke-256 kandidat byte key di setiap posisi dinilai sekaligus sebagai
+   log-likelihood hasil dekripsi di bawah distribusi byte plaintext q:
+   skor = histogram genap @ tabel geser(-k) + histogram ganjil @ tabel geser(+k).
+3. q dimulai dari model format (teks, PDF, ZIP, JPEG) lalu diperbarui dari
+   hasil dekripsi dengan key terbaik, bergantian dengan langkah 2 sampai
+   key stabil. Karena q dipelajari, isi yang tidak cocok dengan model umum
+   (mis. gambar dengan pola berulang) tetap bisa dipecahkan.
+4. Signature format (key_check.SIGNATURES) di awal file dinilai dan bisa
+   mengunci byte key yang dicakupnya (berguna untuk data terkompresi).
+5. Plaintext berpola (mis. gambar berwarna rata) menghasilkan ciphertext
+   berulang yang bisa lebih cocok dengan L yang salah. Jika banyak posisi
+   berulang, langkah 1-4 juga dijalankan pada posisi yang konteks
+   ciphertext-nya baru saja.
+6. Setiap kandidat diperiksa dengan key_check.checkDecryption; kandidat yang
+   dinilai "benar" didahulukan daripada kandidat dengan likelihood terbaik.
+Dengan L yang salah, D adalah jumlah berselang-seling byte yang tidak
+berhubungan (hampir seragam), jadi likelihood-nya jauh lebih rendah. Panjang
+key dipilih dari log-likelihood dikurangi biaya 12 bit per byte key.
+Confidence membandingkan semua panjang key dengan hipotesis "tidak ada
+struktur" (byte seragam); data acak/terkompresi memberi confidence rendah.
+Confidence hanya memakai sampel efektif (posisi yang konteks ciphertext-nya
+belum pernah muncul, karena pola berulang tidak menambah bukti) dan tidak
+pernah lebih tinggi dari confidence key_check.
+
+Batasan: file yang hampir seluruhnya terkompresi (ZIP, PNG, PDF dengan
+banyak stream) hanya memberi sedikit informasi per posisi key; periksa
+confidence dan position_confidence.
+
+Contoh:
+    python binary_attack.py laporan.pdf.enc --output laporan.pdf
+    guess = crackBytes(data, name="laporan.pdf.enc")
+    guess.key, guess.format, guess.confidence
+"""
+import argparse
+import functools
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from analysis import byteValues
+from autokey_fast import autokeyRecover
+from key_check import EXTENSIONS, SIGNATURES, KeyCheck, checkDecryption, detectSignature, expectedFormat
+from parallel_text import splitResidues
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+SAMPLE_BYTES = 512 * 1024     # hanya awal file yang dianalisis
+MAX_KEY_LENGTH = 64
+MIN_ROWS = 16                 # blok minimum per kelas residu agar histogram bermakna
+TOP_LENGTHS = 3               # panjang key terbaik yang dipecahkan ulang dengan semua model format
+MAX_ITERATIONS = 20
+PRIOR_WEIGHT = 64             # pseudo-count model format saat q diperbarui
+HEADER_MISS = 0.01            # peluang file tidak diawali signature yang dikenal
+KEY_BYTE_COST = 1.5 * math.log(256)     # 12 bit per byte key (MDL + cadangan terhadap overfit)
+MODEL_COST = 255.0            # nat untuk 255 parameter bebas q, dibandingkan dengan hipotesis data acak
+PRINTABLE_SHARE = 0.97        # prior: key diketik, byte-nya hampir selalu ASCII cetak
+PARALLEL_MIN_BYTES = 64 * 1024
+CONTEXT_BYTES = 8             # byte ciphertext yang dibandingkan untuk mengenali pola berulang
+FRESH_SHARE = 0.9             # di bawah rasio posisi baru ini, key juga dicari pada posisi baru saja
+
+FORMATS = ("text", "pdf", "zip", "jpeg")
+PRINTABLE = (np.arange(256) >= 32) & (np.arange(256) < 127)
+_SHIFT = np.arange(256)
+
+
+@dataclass
+class BinaryKeyGuess:
+    key: bytes
+    format: str
+    bits_per_byte: float              # -log2 likelihood rata-rata hasil dekripsi sampel (8 = acak)
+    confidence: float                 # peluang (menurut model) seluruh key benar, paling tinggi check.confidence
+    length_confidence: float = 0.0    # peluang panjang key benar (softmax skor semua L + hipotesis acak)
+    position_confidence: list = field(default_factory=list)
+    length_scores: dict = field(default_factory=dict)   # L -> bit/byte termasuk biaya key (kecil = baik)
+    check: KeyCheck = None
+    elapsed_s: float = 0.0
+
+    @property
+    def key_length(self) -> int:
+        return len(self.key)
+
+    @property
+    def key_text(self):
+        """Key sebagai string (bisa dipakai di autokeyDecryptBytes), None jika bukan UTF-8."""
+        try:
+            return self.key.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+# ======================================================
+# MODEL FORMAT
+# ======================================================
+def _letterWeights(language: str = None) -> np.ndarray:
+    """Frekuensi relatif A-Z dari model n-gram bahasa (jika ada), selain itu seragam."""
+    if language:
+        from ngram_model import loadModel
+        try:
+            return 10.0 ** loadModel(language).tables[1].astype(np.float64)
+        except (OSError, ValueError):
+            pass
+    return np.full(26, 1 / 26)
+
+def _textWeights(language: str = None) -> np.ndarray:
+    w = np.full(256, 0.01 / 256)
+    letters = _letterWeights(language)
+    letters = letters / letters.sum()
+    w[ord("a"):ord("z") + 1] += 0.55 * letters
+    w[ord("A"):ord("Z") + 1] += 0.07 * letters
+    w[ord(" ")] += 0.15
+    w[ord("0"):ord("9") + 1] += 0.04 / 10
+    w[[9, 10, 13]] += [0.005, 0.025, 0.01]
+    punctuation = list(b".,;:'\"!?-()/")
+    w[punctuation] += 0.06 / len(punctuation)
+    w[32:127] += 0.01 / 95
+    w[128:] += 0.065 / 128            # byte UTF-8 multi-byte
+    return w / w.sum()
+
+def _spikes(base: np.ndarray, spikes: dict) -> np.ndarray:
+    w = base * (1 - sum(spikes.values()))
+    for byte, p in spikes.items():
+        w[byte] += p
+    return w
+
+@functools.lru_cache(maxsize=None)
+def formatPrior(name: str, language: str = None) -> np.ndarray:
+    """Distribusi awal byte plaintext untuk satu format ("generic" = rata-rata semua format)."""
+    text = _textWeights(language)
+    uniform = np.full(256, 1 / 256)
+    if name == "text":
+        w = text
+    elif name == "pdf":
+        # objek/dictionary teks + stream terkompresi
+        w = 0.55 * text + 0.45 * uniform
+    elif name == "zip":
+        # data deflate + header lokal/central directory (banyak 0x00) + nama file
+        w = _spikes(0.95 * uniform + 0.05 * text, {0x00: 0.06})
+    elif name == "jpeg":
+        # data entropy-coded dengan marker 0xFF dan stuffing 0xFF 0x00
+        w = _spikes(uniform, {0xFF: 0.035, 0x00: 0.03})
+    elif name == "generic":
+        w = np.mean([formatPrior(f, language) for f in FORMATS], axis=0)
+    else:
+        raise ValueError(f"Format tidak dikenal: {name}")
+    w.flags.writeable = False
+    return w
+
+def keyPrior(printable_key: bool = False) -> np.ndarray:
+    """log P(byte key): ASCII cetak diutamakan (atau diwajibkan jika printable_key)."""
+    if printable_key:
+        return np.where(PRINTABLE, math.log(1 / PRINTABLE.sum()), -np.inf)
+    return np.where(PRINTABLE, math.log(PRINTABLE_SHARE / PRINTABLE.sum()),
+                    math.log((1 - PRINTABLE_SHARE) / (256 - PRINTABLE.sum())))
+
+# ======================================================
+# HISTOGRAM PER KELAS RESIDU (worker)
+# ======================================================
+def residueHistograms(ct: np.ndarray, L: int, residues, mask: np.ndarray = None) -> np.ndarray:
+    """
+    Histogram D (dekripsi dengan key nol) untuk kelas residu tertentu, blok
+    genap dan ganjil dipisah: array (2, len(residues), 256). Hanya kolom
+    kelas yang diminta yang didekripsi; mask (per byte) membatasi posisi
+    yang dihitung.
+    """
+    n = len(ct)
+    residues = np.asarray(residues)
+    R = len(residues)
+    rows = -(-n // L)
+    grid = np.zeros(rows * L, dtype=np.uint8)
+    grid[:n] = ct
+    # kolom terpilih berbentuk autokey dengan panjang key R
+    sub = grid.reshape(rows, L)[:, residues].reshape(-1)
+    d = autokeyRecover(sub, np.zeros(R, dtype=np.uint8), 256).reshape(rows, R).astype(np.int64)
+    block = np.arange(rows)[:, None]
+    position = block * L + residues[None, :]
+    valid = position < n
+    if mask is not None:
+        valid[valid] = mask[position[valid]]
+    index = ((block & 1) * R + np.arange(R)[None, :]) * 256 + d
+    return np.bincount(index[valid], minlength=2 * R * 256).reshape(2, R, 256)
+
+_worker_ct = None
+_worker_mask = None
+
+def _initWorker(sample: bytes, mask: np.ndarray = None):
+    global _worker_ct, _worker_mask
+    _worker_ct, _worker_mask = byteValues(sample), mask
+
+def _histogramJobs(jobs: list, ct: np.ndarray = None, mask: np.ndarray = None) -> list:
+    """Worker: histogram untuk daftar (L, kelas residu); sampel dikirim sekali lewat initializer."""
+    if ct is None:
+        ct, mask = _worker_ct, _worker_mask
+    return [residueHistograms(ct, L, residues, mask) for L, residues in jobs]
+
+def collectHistograms(sample: bytes, lengths: list, workers: int, mask: np.ndarray = None) -> dict:
+    """L -> histogram (2, L, 256) untuk semua L, posisi key dibagi ke `workers` proses."""
+    ct = byteValues(sample)
+    if workers < 2 or len(ct) < PARALLEL_MIN_BYTES:
+        return dict(zip(lengths, _histogramJobs([(L, range(L)) for L in lengths], ct, mask)))
+
+    per_worker = [[] for _ in range(workers)]
+    for L in lengths:
+        for w, residues in enumerate(splitResidues(L, workers)):
+            per_worker[w].append((L, residues))
+    hists = {L: np.zeros((2, L, 256), dtype=np.int64) for L in lengths}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initWorker, initargs=(sample, mask)) as pool:
+        futures = [(jobs, pool.submit(_histogramJobs, jobs)) for jobs in per_worker if jobs]
+        for jobs, future in futures:
+            for (L, residues), hist in zip(jobs, future.result()):
+                hists[L][:, residues] = hist
+    return hists
+
+# ======================================================
+# PEMILIHAN KEY
+# ======================================================
+def candidateScores(hist: np.ndarray, logq: np.ndarray, key_logprior: np.ndarray) -> np.ndarray:
+    """Skor (L, 256): log-likelihood kelas residu r untuk setiap kandidat byte key k."""
+    minus = logq[(_SHIFT[None, :] - _SHIFT[:, None]) % 256]    # blok genap: PT = D - k
+    plus = logq[(_SHIFT[None, :] + _SHIFT[:, None]) % 256]     # blok ganjil: PT = D + k
+    return hist[0] @ minus.T + hist[1] @ plus.T + key_logprior
+
+def alignedHistogram(hist: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Histogram plaintext (256) hasil dekripsi semua kelas dengan key."""
+    even = np.take_along_axis(hist[0], (_SHIFT[None, :] + key[:, None]) % 256, axis=1)
+    odd = np.take_along_axis(hist[1], (_SHIFT[None, :] - key[:, None]) % 256, axis=1)
+    return (even + odd).sum(axis=0)
+
+def fitKey(hist: np.ndarray, prior: np.ndarray, key_logprior: np.ndarray, key: np.ndarray = None,
+           fixed: list = ()):
+    """
+    Cari key dan distribusi plaintext q bergantian sampai key stabil. key
+    memberi titik awal; posisi di fixed tidak diubah.
+    Kembalikan (key, log q, log-likelihood sampel + log prior key).
+    """
+    hist = hist.astype(np.float64)
+    fixed = list(fixed)
+
+    def update(key):
+        counts = alignedHistogram(hist, key)
+        return np.log((counts + PRIOR_WEIGHT * prior) / (counts.sum() + PRIOR_WEIGHT))
+
+    logq = np.log(prior) if key is None else update(key)
+    for _ in range(MAX_ITERATIONS):
+        best = candidateScores(hist, logq, key_logprior).argmax(axis=1)
+        if fixed:
+            best[fixed] = key[fixed]
+        if key is not None and (best == key).all():
+            break
+        key = best
+        logq = update(key)
+    return key, logq, float(alignedHistogram(hist, key) @ logq + key_logprior[key].sum())
+
+def headerBytes(key: np.ndarray, head: np.ndarray) -> bytes:
+    """Dekripsi awal file dari D (key nol) dengan key kandidat."""
+    L = len(key)
+    i = np.arange(len(head))
+    sign = np.where((i // L) & 1, -1, 1)
+    return ((head.astype(np.int64) - sign * key[i % L]) % 256).astype(np.uint8).tobytes()
+
+def anchorKey(key: np.ndarray, head: np.ndarray, offset: int, magic: bytes):
+    """
+    Ganti byte key agar plaintext[offset:] == magic. Kembalikan (key, posisi
+    yang dikunci) atau None jika magic tidak konsisten dengan panjang key ini.
+    """
+    L = len(key)
+    key = key.copy()
+    fixed = {}
+    for p, byte in enumerate(magic, offset):
+        if p >= len(head):
+            return None
+        sign = -1 if (p // L) & 1 else 1
+        k = sign * (int(head[p]) - byte) % 256
+        if fixed.setdefault(p % L, k) != k:
+            return None
+        key[p % L] = k
+    return key, sorted(fixed)
+
+def headerScore(plain: bytes, logq: np.ndarray, signatures: list) -> float:
+    """
+    Header yang cocok dengan signature bernilai log(1 - HEADER_MISS) dan
+    menggantikan skor byte-nya di q; header lain bernilai log(HEADER_MISS).
+    """
+    for _, offset, magic in signatures:
+        if plain[offset:offset + len(magic)] == magic:
+            return math.log(1 - HEADER_MISS) - float(logq[list(magic)].sum())
+    return math.log(HEADER_MISS)
+
+def solveLength(hist: np.ndarray, head: np.ndarray, priors: list, key_logprior: np.ndarray, signatures: list):
+    """
+    Pecahkan satu panjang key: fitKey dari setiap model format, lalu ulangi
+    dari key yang dikunci ke setiap signature. Skor header hanya dipakai
+    untuk memilih di antara kandidat L ini: dengan L byte key bebas, header
+    sependek L byte selalu bisa dibuat cocok, jadi tidak dihitung sebagai
+    bukti saat membandingkan panjang key. Kembalikan semua kandidat
+    (key, log q, log-likelihood), yang terbaik lebih dulu.
+    """
+    fits = [fitKey(hist, prior, key_logprior) + (prior,) for prior in priors]
+    key, logq, loglik, prior = max(fits, key=lambda fit: fit[2])
+    candidates = [(key, logq, loglik)]
+    for _, offset, magic in signatures:
+        anchored = anchorKey(key, head, offset, magic)
+        if anchored is not None and (anchored[0] != key).any():
+            candidates.append(fitKey(hist, prior, key_logprior, *anchored))
+    return sorted(candidates, key=lambda c: c[2] + headerScore(headerBytes(c[0], head), c[1], signatures),
+                  reverse=True)
+
+def freshPositions(ct: np.ndarray, width: int = CONTEXT_BYTES) -> np.ndarray:
+    """
+    Mask posisi yang `width` byte ciphertext terakhirnya belum pernah muncul.
+    Plaintext berpola (mis. gambar berwarna rata) menghasilkan ciphertext
+    yang berulang; ulangan itu tidak menambah informasi tentang key.
+    """
+    fresh = np.ones(len(ct), dtype=bool)
+    if len(ct) <= width:
+        return fresh
+    contexts = np.zeros(len(ct) - width + 1, dtype=np.uint64)
+    for window in np.lib.stride_tricks.sliding_window_view(ct.astype(np.uint64), width).T:
+        contexts = (contexts << np.uint64(8)) | window
+    _, first = np.unique(contexts, return_index=True)
+    fresh[width - 1:] = False
+    fresh[first + width - 1] = True
+    return fresh
+
+def positionConfidence(scores: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Peluang (softmax atas 256 kandidat) byte key terpilih di setiap posisi."""
+    p = np.exp(scores - scores.max(axis=1, keepdims=True))
+    return p[np.arange(len(key)), key] / p.sum(axis=1)
+
+def decryptWithKeyBytes(data, key: bytes) -> bytes:
+    """autokeyDecryptBytes untuk key berupa byte mentah (tidak harus UTF-8)."""
+    return autokeyRecover(np.frombuffer(data, dtype=np.uint8), np.frombuffer(key, dtype=np.uint8), 256).tobytes()
+
+def guessFormat(plain_head: bytes, counts: np.ndarray, formats: tuple) -> str:
+    found = detectSignature(plain_head)
+    if found:
+        return found
+    return max(formats, key=lambda f: float(counts @ np.log(formatPrior(f))))
+
+# ======================================================
+# ENTRY POINT
+# ======================================================
+def crackBytes(data, max_key_length: int = MAX_KEY_LENGTH, key_length: int = None, formats=None,
+               name: str = None, language: str = None, printable_key: bool = False,
+               workers: int = None, sample_bytes: int = SAMPLE_BYTES) -> BinaryKeyGuess:
+    """
+    Perkirakan key dari ciphertext biner saja.
+
+    name (mis. "laporan.pdf.enc") membatasi model format dan signature ke
+    yang diharapkan dari ekstensinya. printable_key mewajibkan byte key
+    ASCII cetak. key_length melewati estimasi panjang key.
+    """
+    start = time.perf_counter()
+    sample = bytes(memoryview(data).cast("B")[:sample_bytes])
+    ct = byteValues(sample)
+    limit = len(ct) // MIN_ROWS
+    if limit < 1 or (key_length and key_length > limit):
+        raise ValueError(f"Ciphertext terlalu pendek: butuh minimal {MIN_ROWS} byte per posisi key")
+
+    expected = expectedFormat(name)
+    if formats is None:
+        formats = (expected,) if expected in FORMATS else FORMATS
+    formats = tuple(formats)
+    signatures = [s for s in SIGNATURES if s[0] == expected] if expected in EXTENSIONS.values() else SIGNATURES
+    lengths = [key_length] if key_length else list(range(1, min(max_key_length, limit) + 1))
+    key_logprior = keyPrior(printable_key)
+
+    # plaintext berpola (mis. gambar berwarna rata) menghasilkan ciphertext
+    # berulang yang bisa lebih cocok dengan L yang salah (mis. pola 4 byte
+    # cocok dengan L = 4); jika polanya banyak, setiap tahap juga dijalankan
+    # pada posisi "baru" saja (freshPositions)
+    workers = workers or os.cpu_count() or 1
+    fresh = freshPositions(ct)
+    variants = [collectHistograms(sample, lengths, workers)]
+    if fresh.mean() < FRESH_SHARE:
+        variants.append(collectHistograms(sample, lengths, workers, fresh))
+
+    # tahap 1: semua L dengan model umum
+    generic = formatPrior("generic", language)
+    scores = [{L: fitKey(hists[L], generic, key_logprior)[2] - L * KEY_BYTE_COST for L in lengths}
+              for hists in variants]
+
+    # tahap 2: L terbaik dengan setiap model format + signature
+    priors = [generic] + [formatPrior(f, language) for f in formats]
+    best, others = [], []
+    for hists, length_scores in zip(variants, scores):
+        fits = []
+        for L in sorted(lengths, key=length_scores.get, reverse=True)[:TOP_LENGTHS]:
+            head = autokeyRecover(ct[:64], np.zeros(L, dtype=np.uint8), 256)
+            solved = [(loglik - L * KEY_BYTE_COST, key, logq, head)
+                      for key, logq, loglik in solveLength(hists[L], head, priors, key_logprior, signatures)]
+            length_scores[L] = max(length_scores[L], solved[0][0])
+            fits.append(solved[0])
+            others += solved[1:]
+        best += sorted(fits, key=lambda c: c[0], reverse=True)
+    candidates = best + sorted(others, key=lambda c: c[0], reverse=True)
+
+    # likelihood tidak melihat struktur format: pada data berpola key yang
+    # salah bisa lebih cocok daripada key yang benar. Kandidat lain hanya
+    # dipilih jika key_check menilainya "benar"; signature yang dipaksakan
+    # anchorKey pada data acak paling tinggi "tidak pasti".
+    chosen = None
+    for candidate in candidates:
+        check = checkDecryption(data, candidate[1].astype(np.uint8).tobytes(), name)
+        if chosen is None or (check.verdict == "benar" and check.confidence > chosen[1].confidence):
+            chosen = (candidate, check)
+    (total, key, logq, head), check = chosen
+
+    # confidence dihitung dari sampel efektif saja: ulangan pola tidak menambah bukti
+    length_scores = scores[-1]
+    effective = variants[-1][len(key)].astype(np.float64)
+    length_scores[len(key)] = max(length_scores[len(key)], alignedHistogram(effective, key) @ logq
+                                  + key_logprior[key].sum() - len(key) * KEY_BYTE_COST)
+    positions = positionConfidence(candidateScores(effective, logq, key_logprior), key)
+    # hipotesis nol: hasil dekripsi tidak lebih teratur dari byte acak
+    totals = np.array(list(length_scores.values()) + [effective.sum() * math.log(1 / 256) + MODEL_COST])
+    gaps = totals - length_scores[len(key)]
+    length_confidence = np.exp(-gaps.max()) / np.exp(gaps - gaps.max()).sum()
+    counts = alignedHistogram(variants[0][len(key)], key)
+    guess = BinaryKeyGuess(
+        key=key.astype(np.uint8).tobytes(),
+        format=guessFormat(headerBytes(key, head), counts, formats),
+        bits_per_byte=-(total + len(key) * KEY_BYTE_COST) / len(ct) / math.log(2),
+        # key yang ditolak key_check tidak mungkin benar, seyakin apa pun modelnya
+        confidence=float(min(length_confidence * np.prod(positions), check.confidence)),
+        length_confidence=float(length_confidence),
+        position_confidence=[round(float(p), 4) for p in positions],
+        length_scores={L: round(-s / len(ct) / math.log(2), 4) for L, s in length_scores.items()},
+        check=check,
+    )
+    guess.elapsed_s = time.perf_counter() - start
+    return guess
+
+# ======================================================
+# CLI
+# ======================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pulihkan key autokey biner dari ciphertext saja")
+    parser.add_argument("input", help="File .enc hasil autokeyEncryptBytes")
+    parser.add_argument("--max-length", type=int, default=MAX_KEY_LENGTH)
+    parser.add_argument("--length", type=int, help="Panjang key (byte) jika sudah diketahui")
+    parser.add_argument("--format", choices=FORMATS, action="append", help="Batasi model format awal (bisa diulang)")
+    parser.add_argument("--language", help="Model n-gram untuk frekuensi huruf teks (lihat ngram_model.py)")
+    parser.add_argument("--printable-key", action="store_true", help="Byte key hanya ASCII cetak")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--sample", type=int, default=SAMPLE_BYTES, help="Byte awal yang dianalisis")
+    parser.add_argument("--output", help="Tulis hasil dekripsi dengan key yang ditemukan")
+    args = parser.parse_args(argv)
+
+    with open(args.input, "rb") as f:
+        data = f.read()
+    guess = crackBytes(data, args.max_length, args.length, args.format, os.path.basename(args.input),
+                       args.language, args.printable_key, args.workers, args.sample)
+
+    top = sorted(guess.length_scores.items(), key=lambda item: item[1])[:TOP_LENGTHS]
+    print("Panjang key (bit/byte): " + ", ".join(f"{L}={score:.3f}" for L, score in top))
+    print(f"Key      : {guess.key_text if guess.key_text is not None else guess.key.hex()} "
+          f"({guess.key_length} byte)")
+    print(f"Format   : {guess.format} ({guess.bits_per_byte:.2f} bit/byte)")
+    print(f"Confidence: {guess.confidence:.3f} (panjang key {guess.length_confidence:.3f}, "
+          f"posisi terlemah {min(guess.position_confidence):.3f})")
+    if guess.check:
+        print(f"Cek key  : {guess.check.verdict} ({guess.check.confidence:.2f}) - {'; '.join(guess.check.reasons)}")
+    print(f"Waktu    : {guess.elapsed_s:.2f} s")
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(decryptWithKeyBytes(data, guess.key))
+        print(f"✅ Hasil dekripsi ditulis ke {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Kompresi opsional sebelum enkripsi byte.
+
+Ciphertext autokey praktis tidak bisa dikompres, jadi kompresi harus terjadi
+sebelum enkripsi. Payload terkompresi diberi header kecil (ikut terenkripsi):
+
+    MAGIC (4 byte "AKZ\\x01") | codec (1 byte) | ukuran asli (8 byte, little-endian) | data
+
+Saat dekripsi, header dikenali otomatis; file tanpa header (hasil enkripsi
+lama atau codec "none") dikembalikan apa adanya, jadi formatnya kompatibel.
+
+Contoh:
+    encryptCompressed(data, "KUNCI", codec="zlib")
+    decryptCompressed(ciphertext, "KUNCI")
+    python compression.py --sizes 64KB,1MB          # benchmark titik impas
+"""
+import argparse
+import lzma
+import os
+import struct
+import sys
+import time
+import zlib
+
+from autokey_fast import autokeyDecryptBytesFast, autokeyEncryptBytesFast
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+MAGIC = b"AKZ\x01"
+HEADER = struct.Struct("<4sBQ")
+CODECS = {"none": 0, "zlib": 1, "lzma": 2}
+CODEC_NAMES = {v: k for k, v in CODECS.items()}
+DEFAULT_LEVEL = {"zlib": 6, "lzma": 1}
+
+
+def _compress(data, codec: str, level: int = None) -> bytes:
+    level = DEFAULT_LEVEL[codec] if level is None else level
+    if codec == "zlib":
+        return zlib.compress(data, level)
+    return lzma.compress(data, preset=level)
+
+def _decompress(data, codec: str, size: int):
+    """
+    Dekompres paling banyak size + 1 byte (size dari header), jadi payload
+    buatan yang mengembang tanpa batas berhenti di situ. None jika stream
+    belum selesai atau masih ada sisa input setelah akhir stream.
+    """
+    if codec == "zlib":
+        engine = zlib.decompressobj()
+        out = engine.decompress(data, size + 1)
+        leftover = engine.unconsumed_tail or engine.unused_data
+    else:
+        engine = lzma.LZMADecompressor()
+        out = engine.decompress(data, size + 1)
+        leftover = engine.unused_data
+    if not engine.eof or leftover:
+        return None
+    return out
+
+# ======================================================
+# HEADER + PAYLOAD
+# ======================================================
+def compressPayload(data, codec: str = "zlib", level: int = None) -> bytes:
+    """
+    Kompres data dan tambahkan header. codec "auto" memakai zlib hanya jika
+    hasilnya lebih kecil; "none" (atau auto yang tidak menguntungkan)
+    mengembalikan data tanpa header.
+    """
+    if codec not in CODECS and codec != "auto":
+        raise ValueError(f"Codec tidak dikenal: {codec}")
+    data = memoryview(data).cast("B")
+    if codec == "none" or len(data) == 0:
+        return bytes(data)
+    packed = _compress(data, "zlib" if codec == "auto" else codec, level)
+    if codec == "auto" and len(packed) + HEADER.size >= len(data):
+        return bytes(data)
+    return HEADER.pack(MAGIC, CODECS["zlib" if codec == "auto" else codec], len(data)) + packed
+
+def payloadCodec(data) -> str:
+    """Nama codec dari header payload, atau "none" jika tidak ada header."""
+    if len(data) < HEADER.size or bytes(data[:4]) != MAGIC:
+        return "none"
+    return CODEC_NAMES.get(data[4], "none")
+
+def decompressPayload(data) -> bytes:
+    """
+    Kebalikan compressPayload. Data tanpa header, atau yang isinya tidak
+    cocok dengan header (termasuk hasil dekompresi melebihi ukuran asli di
+    header), dikembalikan apa adanya.
+    """
+    codec = payloadCodec(data)
+    if codec == "none":
+        return bytes(data)
+    _, _, size = HEADER.unpack_from(data)
+    if size >= sys.maxsize:
+        return bytes(data)
+    try:
+        out = _decompress(memoryview(data)[HEADER.size:], codec, size)
+    except (zlib.error, lzma.LZMAError):
+        # plaintext asli yang kebetulan diawali MAGIC
+        return bytes(data)
+    # ukuran tidak cocok dengan header, stream terpotong, atau ada data sisa
+    if out is None or len(out) != size:
+        return bytes(data)
+    return out
+
+# ======================================================
+# PIPELINE
+# ======================================================
+def encryptCompressed(data, key, codec: str = "zlib", level: int = None) -> bytes:
+    return autokeyEncryptBytesFast(compressPayload(data, codec, level), key)
+
+def decryptCompressed(data, key) -> bytes:
+    return decompressPayload(autokeyDecryptBytesFast(data, key))
+
+# ======================================================
+# BENCHMARK TITIK IMPAS
+# ======================================================
+def breakEven(data: bytes, key: str, codec: str, level: int = None, repeat: int = 3) -> dict:
+    """
+    Bandingkan enkripsi biasa dengan kompresi + enkripsi. `break_even_mb_s`
+    adalah bandwidth I/O (unggah/simpan) di bawah mana kompresi lebih cepat
+    secara total: byte yang dihemat / waktu CPU tambahan.
+    """
+    def best(fn):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings), result
+
+    plain_s, plain_out = best(lambda: autokeyEncryptBytesFast(data, key))
+    packed_s, packed_out = best(lambda: encryptCompressed(data, key, codec, level))
+    unpack_s, restored = best(lambda: decryptCompressed(packed_out, key))
+    if restored != data:
+        raise AssertionError("Round-trip kompresi gagal")
+
+    saved = len(plain_out) - len(packed_out)
+    extra = packed_s - plain_s
+    return {
+        "codec": codec,
+        "size_bytes": len(data),
+        "compressed_bytes": len(packed_out),
+        "ratio": len(packed_out) / len(data) if data else 1.0,
+        "encrypt_s": plain_s,
+        "compress_encrypt_s": packed_s,
+        "decrypt_decompress_s": unpack_s,
+        "break_even_mb_s": _breakEvenRate(saved, extra),
+    }
+
+def _breakEvenRate(saved: int, extra_s: float):
+    if saved <= 0:
+        return None              # tidak ada byte yang dihemat: kompresi tidak pernah menguntungkan
+    if extra_s <= 0:
+        return float("inf")      # lebih kecil dan tidak lebih lambat: selalu menguntungkan
+    return (saved / (1024 * 1024)) / extra_s
+
+
+def main(argv=None):
+    # import di sini: benchmark.py juga mendaftarkan engine dari modul ini
+    from benchmark import DEFAULT_KEY, SAMPLE_DIR, SAMPLE_FILES, formatSize, parseSize, syntheticBytes, syntheticText
+
+    parser = argparse.ArgumentParser(description="Benchmark titik impas kompresi sebelum enkripsi")
+    parser.add_argument("--sizes", default="64KB,1MB,16MB")
+    parser.add_argument("--codecs", default="zlib,lzma")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    inputs = []
+    for size in (parseSize(s) for s in args.sizes.split(",")):
+        inputs.append((f"text-{formatSize(size)}", syntheticText(size).encode("ascii")))
+        inputs.append((f"random-{formatSize(size)}", syntheticBytes(size)))
+    for name in SAMPLE_FILES:
+        path = os.path.join(SAMPLE_DIR, name)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                inputs.append((name, f.read()))
+
+    print(f"{'input':<22} {'codec':<6} {'rasio':>7} {'enc (s)':>9} {'kompres+enc (s)':>16} {'impas (MB/s)':>13}")
+    for label, data in inputs:
+        for codec in args.codecs.split(","):
+            r = breakEven(data, DEFAULT_KEY, codec, repeat=args.repeat)
+            rate = r["break_even_mb_s"]
+            impas = "-" if rate is None else "selalu" if rate == float("inf") else f"{rate:.1f}"
+            print(f"{label:<22} {codec:<6} {r['ratio']:>7.3f} {r['encrypt_s']:>9.4f} "
+                  f"{r['compress_encrypt_s']:>16.4f} {impas:>13}")
+    print("\nimpas: kompresi menguntungkan jika bandwidth I/O lebih lambat dari angka ini")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+Dispatcher engine otomatis: memilih engine tercepat untuk setiap panggilan
+encrypt/decrypt berdasarkan ukuran input, panjang key, dan jumlah core.
+
+Engine yang tersedia (hasil semuanya identik):
+- teks : python (loop referensi), vectorized (NumPy), parallel (dekripsi
+         multi-proses per kelas residu)
+- biner: python, vectorized, streaming (per potongan 1 MB ke satu buffer)
+
+Kalibrasi: setiap engine diukur singkat di dua ukuran input dan dimodelkan
+sebagai waktu = overhead + ukuran x biaya per byte. Engine teks python
+menyambung keystream per karakter (O(n^2)), jadi diukur di tiga ukuran dan
+dimodelkan dengan suku kuadrat tambahan. Untuk engine parallel,
+biaya per byte dipecah menjadi bagian serial (normalisasi teks di proses
+utama) dan bagian yang dibagi ke min(core, panjang key) worker. Hasil
+kalibrasi disimpan sebagai JSON (AUTOKEY_DISPATCH_CACHE, default
+~/.cache/autokey/dispatch.json) dan dipakai ulang selama host, versi Python,
+NumPy, dan jumlah core tidak berubah.
+
+Contoh:
+    from dispatcher import encrypt, decrypt, explain
+    ct = encrypt(teks, "KUNCI")
+    explain("decrypt", 50_000_000, "KUNCIRAHASIA", kind="text")
+    # Decision(engine='parallel', predicted_s=..., throughput_mb_s=..., candidates={...})
+
+    python dispatcher.py calibrate --force
+    python dispatcher.py explain --op decrypt --kind text --size 50MB --key KUNCIRAHASIA
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+from autokey_functions import autokeyDecrypt, autokeyDecryptBytes, autokeyEncrypt, autokeyEncryptBytes, prepareKey
+from autokey_fast import (autokeyDecryptBytesFast, autokeyDecryptFast, autokeyEncryptBytesFast, autokeyEncryptFast,
+                          processBytesInto, splitText)
+from instrumentation import count
+from parallel_text import autokeyDecryptParallel
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+CALIBRATION_VERSION = 2
+CACHE_PATH = os.environ.get("AUTOKEY_DISPATCH_CACHE",
+                            os.path.join(os.path.expanduser("~"), ".cache", "autokey", "dispatch.json"))
+MAX_VECTOR_BYTES = 256 * 1024 * 1024   # di atas ini engine vektor biner (array sementara penuh) tidak dipakai
+CALIBRATION_KEY_LENGTH = 16
+REPEAT = 3
+
+# (jenis, operasi) -> {engine: fn(data, key, workers)}
+ENGINES = {
+    ("text", "encrypt"): {
+        "python": lambda data, key, workers: autokeyEncrypt(data, key)[0],
+        "vectorized": lambda data, key, workers: autokeyEncryptFast(data, key),
+    },
+    ("text", "decrypt"): {
+        "python": lambda data, key, workers: autokeyDecrypt(data, key)[0],
+        "vectorized": lambda data, key, workers: autokeyDecryptFast(data, key),
+        "parallel": lambda data, key, workers: autokeyDecryptParallel(data, key, workers, min_letters=0),
+    },
+    ("bytes", "encrypt"): {
+        "python": lambda data, key, workers: autokeyEncryptBytes(data, key),
+        "vectorized": lambda data, key, workers: autokeyEncryptBytesFast(data, key),
+        "streaming": lambda data, key, workers: bytes(processBytesInto(data, key, bytearray(len(data)), False)),
+    },
+    ("bytes", "decrypt"): {
+        "python": lambda data, key, workers: autokeyDecryptBytes(data, key),
+        "vectorized": lambda data, key, workers: autokeyDecryptBytesFast(data, key),
+        "streaming": lambda data, key, workers: bytes(processBytesInto(data, key, bytearray(len(data)), True)),
+    },
+}
+
+# ukuran kalibrasi per engine (dua titik untuk overhead + biaya per byte)
+CALIBRATION_SIZES = {
+    "python": (1024, 8 * 1024),
+    "vectorized": (16 * 1024, 1024 * 1024),
+    "streaming": (16 * 1024, 1024 * 1024),
+    "parallel": (256 * 1024, 2 * 1024 * 1024),
+}
+# (jenis, engine) dengan biaya kuadratik -> tiga ukuran kalibrasi
+QUADRATIC_ENGINES = {
+    ("text", "python"): (1024, 2 * 1024, 4 * 1024),
+}
+
+
+@dataclass
+class Decision:
+    kind: str                 # "text" / "bytes"
+    operation: str            # "encrypt" / "decrypt"
+    engine: str
+    size: int                 # karakter (teks) atau byte
+    key_length: int
+    workers: int
+    predicted_s: float
+    throughput_mb_s: float
+    candidates: dict = field(default_factory=dict)    # engine -> prediksi detik
+    reason: str = ""
+
+# ======================================================
+# KALIBRASI
+# ======================================================
+def hostFingerprint(cores: int) -> dict:
+    return {
+        "version": CALIBRATION_VERSION,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cores": cores,
+    }
+
+def _bestTime(fn, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _fit(sizes, times, quadratic: bool = False) -> dict:
+    """
+    waktu = a + b x ukuran (+ c x ukuran^2 jika quadratic), kuadrat terkecil.
+    Suku yang koefisiennya negatif (derau pengukuran) dibuang lalu dihitung ulang.
+    """
+    n = np.asarray(sizes, dtype=np.float64)
+    t = np.asarray(times, dtype=np.float64)
+    terms = {"b": n, "c": n ** 2} if quadratic else {"b": n}
+    while True:
+        coef = np.linalg.lstsq(np.column_stack([np.ones_like(n), *terms.values()]), t, rcond=None)[0]
+        fitted = dict(zip(terms, coef[1:]))
+        negative = [name for name, value in fitted.items() if value < 0]
+        if not negative or len(terms) == 1:
+            break
+        del terms[negative[0]]
+    model = {"a": max(float(coef[0]), 0.0), "b": max(float(fitted.get("b", 0.0)), 1e-12)}
+    if quadratic:
+        model["c"] = max(float(fitted.get("c", 0.0)), 0.0)
+    return model
+
+def calibrate(cores: int, log=None) -> dict:
+    """Ukur semua engine pada host ini; kembalikan model waktu per engine."""
+    from benchmark import syntheticBytes, syntheticText
+
+    key = "KUNCIRAHASIAABCDEFGHIJKLMNOPQRSTUVWXYZ"[:max(CALIBRATION_KEY_LENGTH, cores)]
+    workers = max(1, min(cores, len(key)))
+    models = {}
+    for (kind, operation), engines in ENGINES.items():
+        for engine, fn in engines.items():
+            if engine == "parallel" and workers < 2:
+                continue
+            quadratic = (kind, engine) in QUADRATIC_ENGINES
+            sizes = QUADRATIC_ENGINES.get((kind, engine), CALIBRATION_SIZES[engine])
+            times = []
+            for size in sizes:
+                data = syntheticText(size) if kind == "text" else syntheticBytes(size)
+                fn(data, key, workers)          # pemanasan (import, cache key, pool)
+                times.append(_bestTime(fn, data, key, workers))
+            model = _fit(sizes, times, quadratic)
+            if engine == "parallel":
+                # bagian serial: normalisasi + indeks huruf di proses utama
+                size = CALIBRATION_SIZES[engine][1]
+                serial = _bestTime(splitText, syntheticText(size)) / size
+                model.update(serial=min(serial, model["b"]), workers=workers,
+                             work=max(model["b"] - serial, 0.0) * workers)
+            models[f"{kind}/{operation}/{engine}"] = model
+            if log:
+                log(f"  {kind:<6}{operation:<9}{engine:<12}"
+                    f"overhead {model['a'] * 1000:8.3f} ms  {1 / model['b'] / 1024 ** 2:10.2f} MB/s"
+                    + (f"  + {model['c'] * 1e12:.3f} ps x ukuran^2" if "c" in model else ""))
+    return models
+
+# ======================================================
+# DISPATCHER
+# ======================================================
+class Dispatcher:
+    def __init__(self, cache_path: str = CACHE_PATH, cores: int = None, models: dict = None):
+        self.cache_path = cache_path
+        self.cores = cores or os.cpu_count() or 1
+        self._models = models
+        self._lock = threading.Lock()
+        self.lastDecision = None
+
+    @property
+    def models(self) -> dict:
+        if self._models is None:
+            with self._lock:
+                if self._models is None:
+                    self._models = self._loadCache() or self.recalibrate()
+        return self._models
+
+    def _loadCache(self):
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get("host") != hostFingerprint(self.cores):
+            return None
+        return cached.get("models")
+
+    def recalibrate(self, log=None) -> dict:
+        models = calibrate(self.cores, log)
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = f"{self.cache_path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"host": hostFingerprint(self.cores), "calibrated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                           "models": models}, f, indent=2)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass                                # cache hanya optimasi; tetap pakai hasil di memori
+        self._models = models
+        return models
+
+    def predict(self, kind: str, operation: str, engine: str, size: int, key_length: int, workers: int) -> float:
+        model = self.models.get(f"{kind}/{operation}/{engine}")
+        if model is None:
+            return float("inf")
+        if engine == "parallel":
+            return model["a"] + size * (model["serial"] + model["work"] / workers)
+        return model["a"] + size * model["b"] + size * size * model.get("c", 0.0)
+
+    def decide(self, operation: str, data_or_size, key, kind: str = None, workers: int = None) -> Decision:
+        """Pilih engine untuk input (atau ukuran input + kind) tanpa menjalankannya."""
+        if isinstance(data_or_size, int):
+            size, kind = data_or_size, kind or "bytes"
+        else:
+            kind = kind or ("text" if isinstance(data_or_size, str) else "bytes")
+            size = len(data_or_size) if kind == "text" else memoryview(data_or_size).nbytes
+        schedule = prepareKey(key)
+        key_length = schedule.length if kind == "text" else schedule.byteLength
+        workers = max(1, min(workers or self.cores, key_length or 1))
+
+        candidates = {}
+        reasons = []
+        for engine in ENGINES[(kind, operation)]:
+            if engine == "parallel" and workers < 2:
+                reasons.append("parallel butuh >= 2 core dan key >= 2 huruf")
+                continue
+            if engine == "vectorized" and kind == "bytes" and size > MAX_VECTOR_BYTES:
+                reasons.append(f"vectorized dilewati di atas {MAX_VECTOR_BYTES // 1024 ** 2} MB (memori)")
+                continue
+            candidates[engine] = self.predict(kind, operation, engine, size, key_length, workers)
+
+        engine = min(candidates, key=candidates.get)
+        predicted = candidates[engine]
+        return Decision(
+            kind=kind, operation=operation, engine=engine, size=size, key_length=key_length,
+            workers=workers if engine == "parallel" else 1,
+            predicted_s=predicted,
+            throughput_mb_s=size / 1024 ** 2 / predicted if predicted > 0 else float("inf"),
+            candidates=candidates,
+            reason="; ".join(reasons) or "prediksi waktu tercepat",
+        )
+
+    def run(self, operation: str, data, key, engine: str = None):
+        decision = self.decide(operation, data, key)
+        if engine is not None:
+            # paksa engine tertentu (debug/pengujian); prediksi tetap dilaporkan
+            decision.engine = engine
+            decision.reason = "dipaksa oleh pemanggil"
+        self.lastDecision = decision
+        count("dispatch_calls", engine=decision.engine, op=f"{decision.kind}-{operation}")
+        fn = ENGINES[(decision.kind, operation)][decision.engine]
+        return fn(data, key, decision.workers)
+
+    def encrypt(self, data, key, engine: str = None):
+        """Enkripsi teks (str) atau biner (objek buffer) dengan engine tercepat."""
+        return self.run("encrypt", data, key, engine)
+
+    def decrypt(self, data, key, engine: str = None):
+        return self.run("decrypt", data, key, engine)
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+def getDispatcher() -> Dispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = Dispatcher()
+    return _dispatcher
+
+def encrypt(data, key):
+    return getDispatcher().encrypt(data, key)
+
+def decrypt(data, key):
+    return getDispatcher().decrypt(data, key)
+
+def explain(operation: str, data_or_size, key, kind: str = None) -> Decision:
+    return getDispatcher().decide(operation, data_or_size, key, kind)
+
+# ======================================================
+# CLI
+# ======================================================
+def main(argv=None):
+    from benchmark import parseSize
+
+    parser = argparse.ArgumentParser(description="Kalibrasi dan keputusan dispatcher engine autokey")
+    sub = parser.add_subparsers(dest="command", required=True)
+    cal = sub.add_parser("calibrate", help="Ukur engine dan simpan hasilnya")
+    cal.add_argument("--force", action="store_true", help="Kalibrasi ulang walau cache masih berlaku")
+    exp = sub.add_parser("explain", help="Tampilkan engine yang dipilih untuk suatu input")
+    exp.add_argument("--op", choices=["encrypt", "decrypt"], default="encrypt")
+    exp.add_argument("--kind", choices=["text", "bytes"], default="text")
+    exp.add_argument("--size", default="1MB")
+    exp.add_argument("--key", default="KUNCIRAHASIA")
+    exp.add_argument("--workers", type=int)
+    for p in (cal, exp):
+        p.add_argument("--cache", default=CACHE_PATH)
+    args = parser.parse_args(argv)
+
+    dispatcher = Dispatcher(args.cache)
+    if args.command == "calibrate":
+        if args.force or dispatcher._loadCache() is None:
+            print(f"Kalibrasi ({dispatcher.cores} core)...")
+            dispatcher.recalibrate(log=print)
+            print(f"✅ Disimpan ke {args.cache}")
+        else:
+            print(f"Cache kalibrasi masih berlaku: {args.cache} (pakai --force untuk mengulang)")
+        return 0
+
+    decision = dispatcher.decide(args.op, parseSize(args.size), args.key, args.kind, args.workers)
+    print(json.dumps(asdict(decision), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
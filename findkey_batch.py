@@ -0,0 +1,272 @@
+"""
+Find Key massal: pulihkan key dari ribuan pasangan plaintext/ciphertext.
+
+Setiap pasangan diproses tanpa tabel proses: keystream = (CT - PT) dihitung
+vektor, lalu key = awal keystream sampai plaintext mulai muncul di dalamnya
+(autokey: keystream = key + plaintext). Hanya PREFIX_BYTES pertama dari
+kedua file yang dibaca; file dibaca penuh hanya jika batas key belum
+ditemukan di prefix. Dua mode:
+- text : semantik findKey (huruf A-Z, mod 26), untuk file .txt
+- bytes: semantik autokeyEncryptBytes (mod 256), untuk file biner/.enc
+
+Pasangan diambil dari folder (plaintext + ciphertext dengan nama yang sama
+atau berakhiran .enc, di folder yang sama atau --cipher-dir) atau dari
+manifest (dua path per baris, dipisah tab atau koma). Hasil dikelompokkan
+per key dan ditulis ke laporan CSV atau JSON, beserta throughput pasangan/detik.
+
+Contoh:
+    python findkey_batch.py audit/plain --cipher-dir audit/cipher --report hasil.csv
+    python findkey_batch.py --manifest pasangan.tsv --report hasil.json --workers 8
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from autokey_fast import codesToText, findKeystream
+from autokey_functions import normalizeText, onlyLettersUpper
+from batch import ENC_SUFFIX, walkDirectory
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+PREFIX_BYTES = 64 * 1024      # cukup untuk key sepanjang apa pun yang wajar
+TEXT_PROBE = 5                # sama dengan findKey: 5 huruf pertama plaintext
+BYTES_PROBE = 16
+VERIFY_LENGTH = 256           # keystream setelah key harus sama dengan plaintext sepanjang ini
+TEXT_EXTENSIONS = (".txt",)
+
+
+@dataclass
+class Pair:
+    plaintext: str
+    ciphertext: str
+    mode: str = "auto"       # "text", "bytes", atau "auto" (menurut ekstensi plaintext)
+
+
+@dataclass
+class PairResult:
+    plaintext: str
+    ciphertext: str
+    mode: str
+    status: str              # "ok", "unverified", "no-match", "missing", "failed"
+    key: str = ""
+    key_length: int = 0
+    bytes_read: int = 0
+    error: str = ""
+    group: str = ""
+
+# ======================================================
+# DAFTAR PASANGAN
+# ======================================================
+def pairsFromDirectory(plain_dir: str, cipher_dir: str = None, mode: str = "auto") -> list:
+    """
+    Setiap file di plain_dir dipasangkan dengan <nama>.enc atau <nama> di
+    cipher_dir (default: folder yang sama, jadi hanya <nama>.enc).
+    """
+    cipher_dir = cipher_dir or plain_dir
+    same = os.path.abspath(cipher_dir) == os.path.abspath(plain_dir)
+    pairs = []
+    for path, rel in walkDirectory(plain_dir):
+        if same and rel.endswith(ENC_SUFFIX):
+            continue
+        candidates = [rel + ENC_SUFFIX] if same else [rel + ENC_SUFFIX, rel]
+        target = next((os.path.join(cipher_dir, c) for c in candidates
+                       if os.path.exists(os.path.join(cipher_dir, c))), None)
+        pairs.append(Pair(path, target or os.path.join(cipher_dir, candidates[0]), mode))
+    return pairs
+
+def pairsFromManifest(path: str, mode: str = "auto") -> list:
+    """Dua path per baris (tab atau koma), relatif terhadap folder manifest; baris '#' diabaikan."""
+    base = os.path.dirname(os.path.abspath(path))
+    pairs = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = [p.strip() for p in (line.split("\t") if "\t" in line else line.split(","))]
+            if len(fields) != 2:
+                raise ValueError(f"{path}:{number}: butuh dua path (plaintext, ciphertext)")
+            pt, ct = (p if os.path.isabs(p) else os.path.join(base, p) for p in fields)
+            pairs.append(Pair(pt, ct, mode))
+    return pairs
+
+def pairMode(pair: Pair) -> str:
+    if pair.mode != "auto":
+        return pair.mode
+    return "text" if pair.plaintext.lower().endswith(TEXT_EXTENSIONS) else "bytes"
+
+# ======================================================
+# KEY DARI SATU PASANGAN
+# ======================================================
+def textKey(plaintext: str, ciphertext: str):
+    """
+    Key seperti findKey (keystream sampai 5 huruf pertama plaintext).
+    Bedanya: jika plaintext diawali key itu sendiri, findKey menemukan
+    probe di posisi 0 dan mengembalikan key kosong; di sini pencarian
+    mulai dari posisi 1. Kembalikan (key, ditemukan, terverifikasi).
+    """
+    keystream = codesToText(findKeystream(plaintext, ciphertext) + 65)
+    letters = onlyLettersUpper(normalizeText(plaintext).upper())
+    idx = keystream.find(letters[:TEXT_PROBE], 1)
+    if idx == -1:
+        return keystream, False, False
+    tail = keystream[idx:idx + VERIFY_LENGTH]
+    return keystream[:idx], True, tail == letters[:len(tail)]
+
+def bytesKey(plaintext: bytes, ciphertext: bytes):
+    """Key autokeyEncryptBytes: keystream (CT - PT) mod 256 sampai plaintext mulai muncul."""
+    n = min(len(plaintext), len(ciphertext))
+    pt = np.frombuffer(plaintext, dtype=np.uint8)[:n]
+    keystream = (np.frombuffer(ciphertext, dtype=np.uint8)[:n] - pt).tobytes()
+    # key tidak pernah kosong, jadi cari mulai posisi 1
+    idx = keystream.find(plaintext[:BYTES_PROBE], 1) if n > BYTES_PROBE else -1
+    if idx == -1:
+        return keystream, False, False
+    tail = keystream[idx:idx + VERIFY_LENGTH]
+    return keystream[:idx], True, tail == plaintext[:len(tail)]
+
+def _read(path: str, limit: int = None) -> bytes:
+    with open(path, "rb") as f:
+        return f.read(limit) if limit else f.read()
+
+def recoverPair(pair: Pair, prefix_bytes: int = PREFIX_BYTES) -> PairResult:
+    mode = pairMode(pair)
+    result = PairResult(pair.plaintext, pair.ciphertext, mode, "failed")
+    if not os.path.exists(pair.ciphertext) or not os.path.exists(pair.plaintext):
+        result.status = "missing"
+        return result
+    try:
+        limit = prefix_bytes
+        while True:
+            pt, ct = _read(pair.plaintext, limit), _read(pair.ciphertext, limit)
+            result.bytes_read += len(pt) + len(ct)
+            if mode == "text":
+                # prefix bisa memotong karakter UTF-8 di ujung
+                key, found, verified = textKey(pt.decode("utf-8", errors="ignore" if limit else "strict"),
+                                               ct.decode("utf-8", errors="ignore" if limit else "strict"))
+            else:
+                key, found, verified = bytesKey(pt, ct)
+            if found or not limit or (len(pt) < limit and len(ct) < limit):
+                break
+            limit = None                # batas key belum ada di prefix: baca penuh
+        if mode == "bytes":
+            try:
+                key = key.decode("utf-8")
+            except UnicodeDecodeError:
+                key = key.hex()
+                result.error = "key bukan UTF-8 (hex)"
+        result.status = "ok" if verified else "unverified" if found else "no-match"
+        result.key = key if found else ""
+        result.key_length = len(key) if found else 0
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+# ======================================================
+# BATCH
+# ======================================================
+def groupResults(results: list) -> list:
+    """Kelompokkan pasangan dengan key yang sama; kelompok terbesar mendapat id G1."""
+    members = {}
+    for r in results:
+        if r.status in ("ok", "unverified"):
+            members.setdefault(r.key, []).append(r)
+    groups = sorted(members.items(), key=lambda item: (-len(item[1]), item[0]))
+    for number, (_, rows) in enumerate(groups, 1):
+        for r in rows:
+            r.group = f"G{number}"
+    return [{"group": f"G{n}", "key": key, "pairs": len(rows)} for n, (key, rows) in enumerate(groups, 1)]
+
+def runFindKeyBatch(pairs: list, workers: int = None, use_threads: bool = False,
+                    prefix_bytes: int = PREFIX_BYTES) -> dict:
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if workers > 1 and len(pairs) > 1:
+        Executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        # banyak pasangan kecil: kirim per potongan agar overhead antar proses kecil
+        chunksize = max(1, len(pairs) // (workers * 8))
+        with Executor(max_workers=min(workers, len(pairs))) as pool:
+            results = list(pool.map(recoverPair, pairs, [prefix_bytes] * len(pairs), chunksize=chunksize))
+    else:
+        results = [recoverPair(pair, prefix_bytes) for pair in pairs]
+    elapsed = time.perf_counter() - start
+
+    groups = groupResults(results)
+    statuses = {}
+    for r in results:
+        statuses[r.status] = statuses.get(r.status, 0) + 1
+    read = sum(r.bytes_read for r in results)
+    return {
+        "results": results,
+        "groups": groups,
+        "status": statuses,
+        "pairs": len(results),
+        "bytes_read": read,
+        "elapsed_s": elapsed,
+        "pairs_per_s": len(results) / elapsed if elapsed > 0 else 0.0,
+        "throughput_mb_s": read / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+        "workers": workers,
+    }
+
+def writeReport(summary: dict, path: str):
+    """CSV: satu baris per pasangan. JSON: ringkasan, kelompok key, dan semua pasangan."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    rows = [asdict(r) for r in summary["results"]]
+    if path.lower().endswith(".json"):
+        meta = {k: v for k, v in summary.items() if k not in ("results", "groups")}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"summary": meta, "groups": summary["groups"], "pairs": rows}, f, indent=1)
+        return
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(PairResult.__dataclass_fields__))
+        writer.writeheader()
+        writer.writerows(rows)
+
+# ======================================================
+# CLI
+# ======================================================
+def main(argv=None):
+    from benchmark import parseSize
+
+    parser = argparse.ArgumentParser(description="Find Key massal untuk banyak pasangan plaintext/ciphertext")
+    parser.add_argument("plain_dir", nargs="?", help="Folder plaintext (rekursif)")
+    parser.add_argument("--cipher-dir", help="Folder ciphertext (default: <nama>.enc di folder plaintext)")
+    parser.add_argument("--manifest", help="File berisi pasangan path (alternatif plain_dir)")
+    parser.add_argument("--mode", choices=["auto", "text", "bytes"], default="auto",
+                        help="auto: .txt -> text, lainnya -> bytes")
+    parser.add_argument("--report", required=True, help="Path laporan .csv atau .json")
+    parser.add_argument("--workers", type=int, default=None, help="Default: jumlah core")
+    parser.add_argument("--threads", action="store_true", help="Pakai thread pool, bukan process pool")
+    parser.add_argument("--prefix", default="64KB", help="Bagian awal file yang dibaca lebih dulu")
+    args = parser.parse_args(argv)
+
+    if bool(args.plain_dir) == bool(args.manifest):
+        parser.error("Berikan tepat satu: plain_dir atau --manifest")
+    pairs = (pairsFromManifest(args.manifest, args.mode) if args.manifest
+             else pairsFromDirectory(args.plain_dir, args.cipher_dir, args.mode))
+
+    summary = runFindKeyBatch(pairs, args.workers, args.threads, parseSize(args.prefix))
+    writeReport(summary, args.report)
+
+    status = ", ".join(f"{count} {name}" for name, count in sorted(summary["status"].items()))
+    print(f"Selesai: {summary['pairs']} pasangan ({status}), {len(summary['groups'])} key berbeda")
+    for group in summary["groups"][:5]:
+        print(f"  {group['group']:<5} {group['pairs']:>6} pasangan  key={group['key']!r}")
+    print(f"{summary['pairs_per_s']:.0f} pasangan/s, {summary['throughput_mb_s']:.1f} MB/s dibaca "
+          f"({summary['workers']} worker, {summary['elapsed_s']:.2f} s)")
+    print(f"✅ Laporan ditulis ke {args.report}")
+    return 0 if summary["pairs"] and not summary["status"].get("failed") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Instrumentasi hot-path: timing per tahap, jumlah byte/karakter, dan cache hit.
+
+Nonaktif secara default (biaya ~satu pengecekan boolean per panggilan).
+Aktifkan dengan environment variable AUTOKEY_METRICS=1 atau enable().
+
+Contoh:
+    import instrumentation
+    instrumentation.enable()
+    instrumentation.addHook(lambda event: print(event))
+    autokeyEncrypt("HELLO WORLD", "SECRET")
+    print(instrumentation.prometheusText())
+"""
+import functools
+import os
+import threading
+import time
+from collections import defaultdict
+
+# ======================================================
+# STATE GLOBAL
+# ======================================================
+_enabled = os.environ.get("AUTOKEY_METRICS", "") not in ("", "0", "false")
+_hooks = []
+_lock = threading.Lock()
+_stage_seconds = defaultdict(float)   # (stage, labels) -> total detik
+_stage_count = defaultdict(int)       # (stage, labels) -> jumlah
+_counters = defaultdict(float)        # (nama, labels) -> nilai
+
+
+def isEnabled() -> bool:
+    return _enabled
+
+def enable(flag: bool = True):
+    global _enabled
+    _enabled = flag
+
+def disable():
+    enable(False)
+
+def addHook(fn):
+    """fn(event: dict) dipanggil setiap kali tahap selesai atau counter bertambah."""
+    _hooks.append(fn)
+
+def removeHook(fn):
+    if fn in _hooks:
+        _hooks.remove(fn)
+
+def reset():
+    with _lock:
+        _stage_seconds.clear()
+        _stage_count.clear()
+        _counters.clear()
+
+def _labelKey(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+def _emit(event: dict):
+    for hook in list(_hooks):
+        hook(event)
+
+# ======================================================
+# TIMING PER TAHAP
+# ======================================================
+class _NoopStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NOOP = _NoopStage()
+
+
+class _Stage:
+    __slots__ = ("name", "labels", "start")
+
+    def __init__(self, name: str, labels: dict):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        key = (self.name, _labelKey(self.labels))
+        with _lock:
+            _stage_seconds[key] += elapsed
+            _stage_count[key] += 1
+        if _hooks:
+            _emit({"type": "stage", "stage": self.name, "seconds": elapsed, **self.labels})
+        return False
+
+
+def stage(name: str, **labels):
+    """Context manager pengukur waktu satu tahap; no-op jika instrumentasi mati."""
+    if not _enabled:
+        return _NOOP
+    return _Stage(name, labels)
+
+def timed(name: str, **labels):
+    """Decorator: ukur seluruh pemanggilan fungsi sebagai satu tahap."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Stage(name, labels):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+# ======================================================
+# COUNTER
+# ======================================================
+def count(name: str, value: float = 1, **labels):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[(name, _labelKey(labels))] += value
+    if _hooks:
+        _emit({"type": "counter", "name": name, "value": value, **labels})
+
+def recordCacheLookup(cache: str, hit: bool):
+    count("cache_hits_total" if hit else "cache_misses_total", cache=cache)
+
+# ======================================================
+# EXPORT
+# ======================================================
+def snapshot() -> dict:
+    with _lock:
+        stages = {
+            (name, labels): {"seconds": _stage_seconds[(name, labels)], "count": _stage_count[(name, labels)]}
+            for name, labels in _stage_seconds
+        }
+        counters = dict(_counters)
+    return {"stages": stages, "counters": counters}
+
+def _escapeLabelValue(value) -> str:
+    """Escape nilai label sesuai format teks Prometheus: \\, " dan newline."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _formatLabels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    escaped = (f'{k}="{_escapeLabelValue(v)}"' for k, v in labels)
+    return "{" + ",".join(escaped) + "}"
+
+def prometheusText(prefix: str = "autokey") -> str:
+    """Dump semua metrik dalam format teks Prometheus."""
+    data = snapshot()
+    lines = [f"# TYPE {prefix}_stage_seconds summary"]
+    for (name, labels), value in sorted(data["stages"].items()):
+        label_str = _formatLabels((("stage", name),) + labels)
+        lines.append(f"{prefix}_stage_seconds_sum{label_str} {value['seconds']:.9f}")
+        lines.append(f"{prefix}_stage_seconds_count{label_str} {value['count']}")
+
+    by_name = defaultdict(list)
+    for (name, labels), value in data["counters"].items():
+        by_name[name].append((labels, value))
+    for name in sorted(by_name):
+        lines.append(f"# TYPE {prefix}_{name} counter")
+        for labels, value in sorted(by_name[name]):
+            lines.append(f"{prefix}_{name}{_formatLabels(labels)} {value:g}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,401 @@
+"""
+Deteksi dini key yang salah untuk dekripsi file biner.
+
+autokeyDecryptBytes selalu "berhasil", jadi key yang salah baru ketahuan
+setelah seluruh file didekripsi dan dibuka. Modul ini hanya mendekripsi
+beberapa KB pertama (autokey prefix-konsisten: hasilnya sama dengan awal
+dekripsi penuh) lalu menilai hasilnya:
+- signature format file (PDF, PNG, ZIP/DOCX, JPEG, ...) di offset yang benar
+- kecocokan signature dengan ekstensi nama file (mis. "laporan.pdf.enc")
+- teks: rasio karakter cetak dan validitas UTF-8
+- struktur di balik signature: stream gzip/ZIP/bzip2/xz harus bisa
+  didekompresi, chunk IHDR PNG dan segmen JPEG harus utuh, PDF memuat objek
+- konsistensi antar posisi key: byte key yang salah menggeser seluruh kelas
+  residunya ke arah berlawanan di blok genap dan ganjil
+- entropy byte: dekripsi yang benar biasanya jauh lebih teratur dari ciphertext
+
+Dengan key salah, setiap kelas residu (i mod L) tergeser konstanta ±d, jadi
+signature dan struktur teks rusak dan entropy naik. Key hanya ditolak jika
+ada bukti positif (geser yang jelas, stream rusak, entropy naik); signature
+yang tidak ditemukan atau encoding teks lain (UTF-16, cp1252) hanya membuat
+hasilnya "tidak pasti".
+
+Contoh:
+    check = checkDecryption(data, "KUNCI", name="laporan.pdf.enc")
+    check.confidence   # 0.0 (pasti salah) .. 1.0 (pasti benar)
+"""
+import bz2
+import lzma
+import os
+import re
+import struct
+import zlib
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from analysis import byteValues, entropy, histogram
+from autokey_fast import asByteArray, autokeyRecover, keyToBytes
+from compression import HEADER, MAGIC as COMPRESSED_MAGIC, payloadCodec
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+SAMPLE_BYTES = 16384
+REJECT_BELOW = 0.3        # confidence di bawah ini dianggap key salah
+MIN_BLOCKS = 64           # blok L byte minimum untuk uji geser per kelas residu
+SHIFT_EVIDENCE = 20.0     # bukti geser minimum (nat) agar kelas residu dianggap tergeser
+TEXT_SHIFT_EVIDENCE = 200.0   # bukti geser (nat) pada teks yang hanya bisa berasal dari key salah
+
+# (nama format, offset, magic)
+SIGNATURES = [
+    ("autokey-compressed", 0, COMPRESSED_MAGIC),
+    ("pdf", 0, b"%PDF-"),
+    ("png", 0, b"\x89PNG\r\n\x1a\n"),
+    ("jpeg", 0, b"\xff\xd8\xff"),
+    ("gif", 0, b"GIF87a"),
+    ("gif", 0, b"GIF89a"),
+    ("zip", 0, b"PK\x03\x04"),
+    ("zip", 0, b"PK\x05\x06"),
+    ("gzip", 0, b"\x1f\x8b\x08"),
+    ("7z", 0, b"7z\xbc\xaf\x27\x1c"),
+    ("rar", 0, b"Rar!\x1a\x07"),
+    ("ole", 0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"),
+    ("sqlite", 0, b"SQLite format 3\x00"),
+    ("elf", 0, b"\x7fELF"),
+    ("exe", 0, b"MZ"),
+    ("riff", 0, b"RIFF"),
+    ("mp4", 4, b"ftyp"),
+    ("mp3", 0, b"ID3"),
+    ("xz", 0, b"\xfd7zXZ\x00"),
+    ("bz2", 0, b"BZh"),
+    ("npy", 0, b"\x93NUMPY"),
+    ("utf8-bom", 0, b"\xef\xbb\xbf"),
+]
+
+# format yang isinya terkompresi: entropy tinggi setelah signature itu normal
+COMPRESSED_FORMATS = {"zip", "gzip", "7z", "rar", "xz", "bz2", "png", "jpeg", "gif", "mp4", "mp3", "pdf"}
+# format berisi record berukuran tetap (sampel audio, tabel, halaman): pola
+# geser bisa berasal dari datanya sendiri, jadi geser hanya menurunkan confidence
+RECORD_FORMATS = {"riff", "elf", "exe", "sqlite", "ole", "mp4", "npy", "utf8-bom"}
+ZIP_METHODS = {0, 8, 9, 12, 14, 93, 95, 98}    # metode kompresi ZIP yang terdaftar
+ZIP_UNUSED_FLAGS = 0xD780                      # bit flag ZIP yang tidak dipakai (harus 0)
+INFLATE_LIMIT = 1 << 22                        # batas hasil inflate saat memeriksa stream
+PDF_OBJECT = re.compile(rb"\d+\s+\d+\s+obj")
+
+# ekstensi -> format yang diharapkan
+EXTENSIONS = {
+    "pdf": "pdf", "png": "png", "jpg": "jpeg", "jpeg": "jpeg", "gif": "gif",
+    "zip": "zip", "docx": "zip", "xlsx": "zip", "pptx": "zip", "jar": "zip", "apk": "zip", "odt": "zip",
+    "ods": "zip", "odp": "zip", "epub": "zip", "whl": "zip",
+    "gz": "gzip", "tgz": "gzip", "7z": "7z", "rar": "rar",
+    "doc": "ole", "xls": "ole", "ppt": "ole", "msi": "ole",
+    "sqlite": "sqlite", "exe": "exe", "dll": "exe",
+    "wav": "riff", "avi": "riff", "webp": "riff", "mp4": "mp4", "m4a": "mp4", "mov": "mp4",
+    "xz": "xz", "bz2": "bz2", "npy": "npy",
+    "txt": "text", "csv": "text", "md": "text", "json": "text", "xml": "text",
+    "html": "text", "htm": "text", "py": "text", "log": "text", "svg": "text",
+}
+
+
+@dataclass
+class KeyCheck:
+    confidence: float                 # 0.0 (key salah) .. 1.0 (key benar)
+    format: str = "unknown"
+    entropy: float = 0.0              # bit per byte hasil dekripsi sampel
+    cipher_entropy: float = 0.0
+    reasons: list = field(default_factory=list)
+    structure: bool = None            # hasil streamIntact di balik signature (None = tidak diperiksa)
+
+    @property
+    def verdict(self) -> str:
+        if self.confidence < REJECT_BELOW:
+            return "salah"
+        if self.confidence >= 0.7:
+            return "benar"
+        return "tidak pasti"
+
+    @property
+    def rejected(self) -> bool:
+        return self.confidence < REJECT_BELOW
+
+# ======================================================
+# HEURISTIK
+# ======================================================
+def detectSignature(sample: bytes):
+    for name, offset, magic in SIGNATURES:
+        if sample[offset:offset + len(magic)] == magic:
+            return name
+    return None
+
+def signatureResidues(sample: bytes, L: int) -> set:
+    """Kelas residu yang byte key-nya sudah terbukti benar oleh signature yang cocok."""
+    for _, offset, magic in SIGNATURES:
+        if sample[offset:offset + len(magic)] == magic:
+            return {i % L for i in range(offset, offset + len(magic))}
+    return set()
+
+def expectedFormat(name: str):
+    """Format yang diharapkan dari nama file asli (".enc" diabaikan)."""
+    if not name:
+        return None
+    if name.endswith(".enc"):
+        name = name[:-4]
+    ext = os.path.splitext(name)[1].lstrip(".").lower()
+    return EXTENSIONS.get(ext)
+
+def textScore(sample: bytes) -> float:
+    """Rasio byte teks (ASCII cetak, whitespace, atau UTF-8 valid)."""
+    if not sample:
+        return 0.0
+    b = byteValues(sample)
+    text = ((b >= 32) & (b < 127)) | (b == 9) | (b == 10) | (b == 13)
+    if (b >= 128).any():
+        try:
+            # sampel bisa memutus karakter multi-byte di ujung
+            sample[:len(sample) - 3].decode("utf-8")
+            text = text | (b >= 128)
+        except UnicodeDecodeError:
+            pass
+    return float(text.mean())
+
+def byteEntropy(sample) -> float:
+    return entropy(histogram(byteValues(sample), 256))
+
+def shiftEvidence(sample: bytes, L: int):
+    """
+    Bukti (nat) per kelas residu (i mod L) bahwa byte key-nya salah. Jika
+    byte key ke-r salah sebesar d, hasil dekripsi di kelas r menjadi PT - d
+    pada blok genap (blok = L byte) dan PT + d pada blok ganjil. Untuk setiap
+    geser s dihitung log-likelihood blok genap + s dan blok ganjil - s
+    terhadap distribusi byte kelas lain (FFT, semua s sekaligus). Geser
+    searah (keduanya + s) tidak mungkin berasal dari key salah, jadi
+    keuntungannya dipakai sebagai ukuran derau: data acak/terkompresi atau
+    berpola tetap mendapat bukti mendekati 0.
+    Kembalikan None jika sampel terlalu pendek untuk diuji.
+    """
+    b = byteValues(sample)
+    rows = len(b) // L if L else 0
+    if rows < 2 * MIN_BLOCKS or L < 2:
+        return None
+    grid = b[:rows * L].reshape(rows, L).astype(np.int64)
+    offsets = np.arange(L) * 256
+
+    def classHistograms(blocks):
+        return np.bincount((blocks + offsets).ravel(), minlength=256 * L).reshape(L, 256).astype(float)
+
+    even, odd = classHistograms(grid[0::2]), classHistograms(grid[1::2])
+    others = (even + odd).sum(axis=0) - even - odd
+    logp = np.fft.rfft(np.log((others + 0.5) / (others + 0.5).sum(axis=1, keepdims=True)), axis=1)
+    evenUp = np.fft.irfft(np.conj(np.fft.rfft(even, axis=1)) * logp, n=256, axis=1)
+    oddUp = np.fft.irfft(np.conj(np.fft.rfft(odd, axis=1)) * logp, n=256, axis=1)
+    oddDown = np.fft.irfft(np.fft.rfft(odd, axis=1) * np.conj(logp), n=256, axis=1)
+    opposite, same = evenUp + oddDown, evenUp + oddUp
+    gain = (opposite.max(axis=1) - opposite[:, 0]) - (same.max(axis=1) - same[:, 0])
+    return np.maximum(gain, 0.0)
+
+def shiftedResidues(sample: bytes, L: int, verified=(), threshold: float = SHIFT_EVIDENCE):
+    """Kelas residu (di luar verified) dengan bukti geser >= threshold; None jika sampel terlalu pendek."""
+    evidence = shiftEvidence(sample, L)
+    if evidence is None:
+        return None
+    return [r for r in np.flatnonzero(evidence >= threshold).tolist() if r not in verified]
+
+def compressedIntact(sample: bytes) -> bool:
+    """Awal stream terkompresi (setelah header) harus bisa didekompresi tanpa error."""
+    codec = payloadCodec(sample)
+    if codec == "none":
+        return False                     # compressPayload tidak pernah menulis header tanpa codec
+    try:
+        if codec == "zlib":
+            zlib.decompressobj().decompress(sample[HEADER.size:])
+        elif codec == "lzma":
+            lzma.LZMADecompressor().decompress(sample[HEADER.size:])
+        return True
+    except (zlib.error, lzma.LZMAError):
+        return False
+
+def _inflate(data, wbits: int = zlib.MAX_WBITS):
+    """Inflate data (hasil dibatasi INFLATE_LIMIT); None jika stream rusak."""
+    try:
+        return zlib.decompressobj(wbits).decompress(data, INFLATE_LIMIT)
+    except zlib.error:
+        return None
+
+def _zipIntact(sample: bytes) -> bool:
+    """
+    Setiap local header ZIP di sampel harus masuk akal (metode, flag, nama
+    berupa teks), data deflate harus bisa di-inflate, dan CRC entri yang utuh
+    harus cocok.
+    """
+    if sample[:4] == b"PK\x05\x06":
+        # ZIP kosong: hanya record akhir dengan nol entri
+        return len(sample) >= 22 and not any(struct.unpack_from("<HHHHII", sample, 4))
+    pos = 0
+    while pos + 30 <= len(sample) and sample[pos:pos + 4] == b"PK\x03\x04":
+        flags, method, _, _, crc, size, _, name_len, extra_len = struct.unpack_from("<HHHHIIIHH", sample, pos + 6)
+        name = sample[pos + 30:pos + 30 + name_len]
+        if method not in ZIP_METHODS or flags & ZIP_UNUSED_FLAGS or not name_len or any(c < 32 for c in name):
+            return False
+        start = pos + 30 + name_len + extra_len
+        if flags & 1 or method not in (0, 8):
+            return True                   # terenkripsi/metode lain: isi tidak bisa diperiksa
+        if flags & 8 or start + size > len(sample):
+            # ukuran ada di data descriptor atau entri terpotong sampel: cukup awal stream-nya
+            return method == 0 or _inflate(sample[start:], -zlib.MAX_WBITS) is not None
+        data = sample[start:start + size]
+        if method == 8:
+            data = _inflate(data, -zlib.MAX_WBITS)
+            if data is None:
+                return False
+            if len(data) >= INFLATE_LIMIT:
+                return True
+        if zlib.crc32(data) != crc:
+            return False
+        pos = start + size
+    return True
+
+def _pngIntact(sample: bytes) -> bool:
+    """Chunk IHDR harus menjadi chunk pertama dengan CRC yang cocok."""
+    if len(sample) < 33:
+        return True
+    return sample[12:16] == b"IHDR" and zlib.crc32(sample[12:29]) == struct.unpack_from(">I", sample, 29)[0]
+
+def _jpegIntact(sample: bytes) -> bool:
+    """
+    Rantai segmen JPEG (FF marker + panjang) harus utuh sampai SOS, dengan
+    nama ASCII di awal segmen APPn; setelah itu FF di data gambar hanya boleh
+    diikuti 00 (byte stuffing) atau marker.
+    """
+    pos = 2
+    while pos + 4 <= len(sample):
+        marker = sample[pos + 1]
+        if sample[pos] != 0xFF or marker < 0xC0 or 0xD0 <= marker <= 0xD8:
+            return False                 # RSTn dan SOI tidak muncul sebelum SOS
+        if marker == 0xDA:
+            b = byteValues(sample[pos + 2:])
+            follow = b[np.flatnonzero(b[:-1] == 0xFF) + 1]
+            return not ((follow > 0) & (follow < 0xC0)).any()
+        if marker == 0xFF:               # byte pengisi sebelum marker
+            pos += 1
+            continue
+        length, = struct.unpack_from(">H", sample, pos + 2)
+        # segmen APPn diawali nama ASCII (JFIF, Exif, ICC_PROFILE, ...)
+        name = sample[pos + 4:pos + min(length, 6) + 2].split(b"\0")[0]
+        if 0xE0 <= marker <= 0xEF and length >= 6 and (len(name) < 2 or not all(32 <= c < 127 for c in name)):
+            return False
+        pos += 2 + length
+    return True
+
+def _pdfIntact(sample: bytes) -> bool:
+    """PDF diawali objek "N G obj" yang dictionary-nya berupa teks."""
+    match = PDF_OBJECT.search(sample, 0, 1024)
+    if match is None:
+        return len(sample) < 1024
+    return textScore(sample[match.end():match.end() + 64].split(b"stream")[0]) >= 0.9
+
+def streamIntact(sample: bytes, fmt: str):
+    """
+    Periksa struktur di balik signature: stream gzip/bzip2/xz dan entri ZIP
+    pertama harus bisa didekompresi, chunk IHDR PNG dan segmen JPEG harus
+    utuh, PDF harus memuat objek. None jika format ini tidak punya pemeriksaan.
+    """
+    if fmt == "gzip":
+        return _inflate(sample, 16 + zlib.MAX_WBITS) is not None
+    if fmt in ("bz2", "xz"):
+        engine = bz2.BZ2Decompressor() if fmt == "bz2" else lzma.LZMADecompressor(lzma.FORMAT_XZ)
+        try:
+            engine.decompress(sample, INFLATE_LIMIT)
+            return True
+        except (OSError, lzma.LZMAError):
+            return False
+    checks = {"zip": _zipIntact, "png": _pngIntact, "jpeg": _jpegIntact, "pdf": _pdfIntact}
+    return checks[fmt](sample) if fmt in checks else None
+
+# ======================================================
+# ENTRY POINT
+# ======================================================
+def checkDecryption(data, key, name: str = None, sample_bytes: int = SAMPLE_BYTES) -> KeyCheck:
+    """
+    Dekripsi sampel awal data dan nilai kemungkinan key benar. key berupa
+    string, atau bytes mentah (mis. key hasil binary_attack yang bukan UTF-8).
+    """
+    keyBytes = np.frombuffer(key, dtype=np.uint8) if isinstance(key, (bytes, bytearray)) else keyToBytes(key)
+    L = len(keyBytes)
+    head = bytes(memoryview(data).cast("B")[:max(sample_bytes, 2 * MIN_BLOCKS * L)])
+    if not head:
+        return KeyCheck(0.5, reasons=["File kosong"])
+    sample = autokeyRecover(asByteArray(head), keyBytes, 256).tobytes()
+    check = KeyCheck(0.0, entropy=byteEntropy(sample), cipher_entropy=byteEntropy(head))
+    expected = expectedFormat(name)
+    found = detectSignature(sample)
+    check.format = found or expected or "unknown"
+
+    def verdict(confidence, reason):
+        check.confidence = confidence
+        check.reasons.append(reason)
+        return check
+
+    if found == "autokey-compressed":
+        if compressedIntact(sample):
+            return verdict(0.99, "Header kompresi dikenali dan stream terkompresi valid")
+        return verdict(0.02, "Header kompresi ditemukan, tetapi stream terkompresi rusak")
+
+    verified = signatureResidues(sample, L) if found else set()
+    shifted = shiftedResidues(sample, L, verified)
+    shiftReason = (f"{len(shifted or ())} dari {L} posisi key menghasilkan data yang tergeser ke arah "
+                   f"berlawanan di blok genap/ganjil")
+    short = len(sample) < 2 * MIN_BLOCKS * L      # terlalu pendek untuk uji geser
+    rise = check.entropy - check.cipher_entropy
+    text = textScore(sample)
+
+    # bukti positif key salah. Record biner (mis. deret aritmetika float64) bisa
+    # menyerupai geser, tetapi teks tidak: di teks geser yang kuat pasti dari key
+    if (expected == "text" or text >= 0.8) and shiftedResidues(sample, L, verified, TEXT_SHIFT_EVIDENCE):
+        return verdict(0.05, f"Hasil berupa teks, tetapi {shiftReason} (byte key salah)")
+
+    if found:
+        if expected and expected not in (found, "text"):
+            return verdict(0.5, f"Signature {found} ditemukan, tetapi ekstensi mengarah ke {expected}")
+        intact = check.structure = streamIntact(sample, found)
+        if intact is False:
+            return verdict(0.05, f"Signature {found} ditemukan, tetapi struktur setelahnya rusak")
+        if shifted:
+            return verdict(0.5 if found in RECORD_FORMATS else 0.1, f"Signature {found} ditemukan, tetapi {shiftReason}")
+        if found not in COMPRESSED_FORMATS and not intact and rise >= -0.05:
+            return verdict(0.4, f"Signature {found} ditemukan, tetapi isi setelahnya tampak acak (panjang key salah?)")
+        if intact is None and rise > 0.3:
+            # signature pendek tanpa pemeriksaan struktur bisa cocok secara kebetulan
+            return verdict(0.5, f"Signature {found} ditemukan, tetapi entropy naik {rise:.2f} bit/byte setelah dekripsi")
+        if intact is None and check.entropy >= 7.5 and len(verified) < L:
+            # isi terkompresi: uji geser tidak punya pegangan untuk posisi key di luar signature
+            return verdict(0.6, f"Signature {found} ditemukan, tetapi isinya terkompresi: hanya "
+                                f"{len(verified)} dari {L} posisi key yang terverifikasi")
+        return verdict(0.6 if short else 0.98, f"Signature {found} ditemukan di awal file")
+
+    if rise > 0.3 and (check.entropy >= 7.5 or 2 * len(shifted or ()) > L):
+        # hasil lebih acak dari ciphertext: key salah, kecuali record yang membuat
+        # ciphertext autokey sedikit lebih teratur (maka hanya sedikit posisi tergeser)
+        return verdict(0.1, f"Entropy naik {rise:.2f} bit/byte setelah dekripsi")
+
+    # tanpa bukti positif, signature atau teks yang tidak dikenali hanya berarti
+    # "tidak pasti": .mov tanpa ftyp, teks UTF-16/cp1252, dan sebagainya
+    if text >= 0.95:
+        check.format = "text"
+        if short:
+            return verdict(0.6, "Hasil berupa teks, tetapi file terlalu pendek untuk memastikan key")
+        if shifted:
+            return verdict(0.5, f"Hasil berupa teks, tetapi {shiftReason}")
+        return verdict(0.9, f"{text:.0%} byte berupa teks yang valid")
+    if expected == "text":
+        return verdict(0.4, f"Ekstensi teks, tetapi hanya {text:.0%} byte berupa ASCII/UTF-8 (encoding lain?)")
+    if expected:
+        return verdict(0.4, f"Signature {expected} tidak ditemukan pada hasil dekripsi (varian tanpa signature?)")
+    if shifted:
+        return verdict(0.5, shiftReason)
+    if check.entropy >= 7.9:
+        # data acak/terkompresi tanpa signature: uji geser tidak punya pegangan
+        return verdict(0.5, f"Entropy tinggi ({check.entropy:.2f} bit/byte) tanpa signature yang dikenal")
+    if shifted is None:
+        return verdict(0.5, "Tidak ada signature, dan file terlalu pendek (atau key 1 byte) untuk uji geser")
+    return verdict(0.75, "Struktur byte konsisten di semua posisi key")
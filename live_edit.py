@@ -0,0 +1,84 @@
+"""
+Enkripsi inkremental untuk teks yang sedang diedit (mode Teks Manual).
+
+Pada enkripsi autokey, CT_j = PT_j + K_j dengan K_j = PT_(j-L) untuk j >= L.
+Mengubah huruf ke-i hanya memengaruhi CT_i dan CT_(i+L). Menyisipkan atau
+menghapus huruf memang menggeser posisi, tetapi pasangan (PT_j, PT_(j-L))
+di belakang area edit tetap sama setelah L huruf, jadi ciphertext-nya cukup
+digeser, bukan dihitung ulang.
+
+AutokeyEditSession menyimpan huruf dan ciphertext versi sebelumnya; setiap
+update mencari prefix/suffix yang sama (operasi vektor), lalu menghitung
+ulang hanya huruf [awal edit, akhir edit + L).
+
+Contoh:
+    session = AutokeyEditSession("KUNCI")
+    session.update("HALO DUNIA")        # -> ciphertext, sama dengan autokeyEncrypt(...)[0]
+    session.update("HALO DUNIA BARU")   # hanya huruf baru (+L) yang dihitung
+"""
+import numpy as np
+
+from autokey_fast import alphaMask, codesToText, keyToNums, textToCodes
+from autokey_functions import normalizeText
+
+
+class AutokeyEditSession:
+    def __init__(self, key, text: str = ""):
+        self.key = keyToNums(key).astype(np.int64)
+        self.rows = np.zeros(0, dtype=np.uint32)       # kode baris output (spasi + huruf)
+        self.pt = np.zeros(0, dtype=np.int64)          # nilai huruf (ord - 65)
+        self.ct = np.zeros(0, dtype=np.int64)          # nilai ciphertext 0-25
+        self.changed = (0, 0)                          # rentang huruf yang dihitung ulang terakhir
+        self.ciphertext = ""
+        if text:
+            self.update(text)
+
+    def _rows(self, text: str):
+        codes = textToCodes(normalizeText(text).upper())
+        letters = alphaMask(codes)
+        keep = letters | (codes == 32)
+        return codes[keep], letters[keep]
+
+    def _cipher(self, pt: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """CT untuk huruf [start, stop) dari array plaintext lengkap."""
+        j = np.arange(start, stop)
+        L = len(self.key)
+        if L == 0:
+            k = np.zeros(len(j), dtype=np.int64)       # referensi memakai 'A'
+        else:
+            k = np.where(j < L, self.key[np.minimum(j, L - 1)], pt[np.maximum(j - L, 0)])
+        return (pt[start:stop] + k) % 26
+
+    def update(self, text: str) -> str:
+        rows, isLetter = self._rows(text)
+        old = self.rows
+
+        # prefix dan suffix baris yang sama dengan versi sebelumnya
+        m = min(len(old), len(rows))
+        diff = np.flatnonzero(old[:m] != rows[:m])
+        prefix = int(diff[0]) if len(diff) else m
+        tail = min(len(old), len(rows)) - prefix
+        diff = np.flatnonzero(old[len(old) - tail:][::-1] != rows[len(rows) - tail:][::-1])
+        suffix = int(diff[0]) if len(diff) else tail
+
+        pt = rows[isLetter].astype(np.int64) - 65
+        n, nOld = len(pt), len(self.pt)
+        start = int(isLetter[:prefix].sum())                   # huruf pertama yang berubah
+        suffixLetters = int(isLetter[len(rows) - suffix:].sum())
+        stop = min(n, n - suffixLetters + len(self.key))       # + L huruf yang keystream-nya berubah
+        stop = max(stop, start)
+        reuse = n - stop                                       # ekor yang hanya bergeser
+
+        self.ct = np.concatenate([
+            self.ct[:start],
+            self._cipher(pt, start, stop),
+            self.ct[nOld - reuse:] if reuse else self.ct[:0],
+        ])
+        self.pt = pt
+        self.rows = rows
+        self.changed = (start, stop)
+
+        out = rows.copy()
+        out[isLetter] = self.ct + 65
+        self.ciphertext = codesToText(out)
+        return self.ciphertext
@@ -0,0 +1,111 @@
+"""
+Uji beban lokal untuk admission control: beberapa sesi simulasi mengirim job
+bersamaan ke AdmissionController yang sama, memakai engine yang sama dengan
+aplikasi Streamlit (engine streaming untuk input besar).
+
+Melaporkan latency (p50/p95), waktu antre, job yang ditolak per alasan,
+dan puncak job bersamaan — yang tidak boleh melebihi --max-jobs.
+
+Contoh:
+    python load_test.py --sessions 16 --jobs 5 --size 4MB --max-jobs 2
+    python load_test.py --sessions 8 --jobs 20 --rate 10      # uji rate limit
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from admission import AdmissionController, AdmissionError, MB
+from autokey_fast import autokeyEncryptBytesFast, processBytesInto
+from benchmark import parseSize
+
+DEFAULT_KEY = "KUNCIRAHASIA"
+
+
+def runSession(controller, session: str, jobs: int, size: int, report: dict, lock: threading.Lock, active: list):
+    rng = random.Random(session)
+    for _ in range(jobs):
+        # ukuran bervariasi 25%-200% dari --size
+        n = int(size * rng.uniform(0.25, 2.0))
+        data = rng.randbytes(n)
+        start = time.perf_counter()
+        try:
+            with controller.admit(session, n) as ticket:
+                with lock:
+                    active[0] += 1
+                    active[1] = max(active[1], active[0])
+                try:
+                    if ticket.streaming:
+                        processBytesInto(data, DEFAULT_KEY, bytearray(n), False)
+                    else:
+                        autokeyEncryptBytesFast(data, DEFAULT_KEY)
+                finally:
+                    with lock:
+                        active[0] -= 1
+            with lock:
+                report["latency"].append(time.perf_counter() - start)
+                report["wait"].append(ticket.waited)
+                report["streaming"] += ticket.streaming
+                report["bytes"] += n
+        except AdmissionError as e:
+            with lock:
+                report["rejected"][e.reason] += 1
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji beban admission control dengan banyak sesi")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--jobs", type=int, default=5, help="Job per sesi")
+    parser.add_argument("--size", default="2MB", help="Ukuran rata-rata input per job")
+    parser.add_argument("--max-jobs", type=int, default=2, help="Job bersamaan (semaphore global)")
+    parser.add_argument("--max-upload", default="64MB")
+    parser.add_argument("--rate", type=int, default=60, help="Job per menit per sesi")
+    parser.add_argument("--stream", default="3MB", help="Ambang routing ke engine streaming")
+    args = parser.parse_args(argv)
+
+    controller = AdmissionController(
+        max_jobs=args.max_jobs,
+        max_job_bytes=parseSize(args.max_upload),
+        max_session_bytes=2 * parseSize(args.max_upload),
+        rate_limit=args.rate,
+        streaming_bytes=parseSize(args.stream),
+    )
+    report = {"latency": [], "wait": [], "streaming": 0, "bytes": 0, "rejected": Counter()}
+    lock = threading.Lock()
+    active = [0, 0]   # [sedang berjalan, puncak]
+
+    threads = [threading.Thread(target=runSession,
+                                args=(controller, f"sesi-{i}", args.jobs, parseSize(args.size), report, lock, active))
+               for i in range(args.sessions)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    done = len(report["latency"])
+    print(f"{args.sessions} sesi x {args.jobs} job, max {args.max_jobs} job bersamaan")
+    print(f"  selesai        : {done} job ({report['streaming']} lewat engine streaming)")
+    print(f"  ditolak        : {dict(report['rejected']) or 0}")
+    print(f"  latency p50/p95: {percentile(report['latency'], 0.5):.3f} / {percentile(report['latency'], 0.95):.3f} s")
+    print(f"  antre p50/p95  : {percentile(report['wait'], 0.5):.3f} / {percentile(report['wait'], 0.95):.3f} s")
+    print(f"  throughput     : {report['bytes'] / MB / elapsed:.1f} MB/s dalam {elapsed:.2f} s")
+    print(f"  puncak bersamaan: {active[1]}")
+    if active[1] > args.max_jobs:
+        print("❌ Batas job bersamaan terlampaui!")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Model bahasa n-gram (unigram s.d. quadgram huruf A-Z) dalam format biner
+ringkas yang dibuka dengan mmap.
+
+Setiap tabel berupa array float32 padat berisi log10 P(n-gram), diindeks
+dengan kode n-gram (sama dengan analysis.ngramCodes: v0*26^(n-1) + ... + v(n-1)).
+N-gram yang tidak muncul di korpus mendapat nilai floor log10(0.01 / total).
+Quadgram = 26^4 x 4 byte = 1.8 MB; seluruh model < 2 MB.
+
+Format file (.ngm, little-endian):
+    header   : magic "AKNG", versi, ukuran alfabet, n maksimum, bahasa (16 byte)
+    per n    : offset tabel, jumlah n-gram di korpus
+    tabel    : float32[26^n] untuk n = 1..n maksimum, offset kelipatan 64 byte
+
+loadModel() hanya membaca header; tabel dipetakan (np.memmap, read-only),
+jadi worker siap seketika dan semua proses berbagi halaman yang sama di
+page cache.
+
+Contoh:
+    python ngram_model.py build korpus_id/*.txt --language indonesian --output models/indonesian.ngm
+    python ngram_model.py score models/indonesian.ngm "SELAMAT PAGI DUNIA"
+
+    model = loadModel("models/indonesian.ngm")
+    model.scoreText("SELAMAT PAGI")        # log10 probabilitas (quadgram)
+"""
+import argparse
+import functools
+import glob
+import os
+import struct
+import sys
+
+import numpy as np
+
+from analysis import LETTERS, analyzeFile, letterValues, ngramCodes
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+MAGIC = b"AKNG"
+VERSION = 1
+MAX_N = 4
+ALIGN = 64
+HEADER = struct.Struct("<4sHHB3x16s")     # magic, versi, alfabet, n maksimum, bahasa
+TABLE = struct.Struct("<QQ")              # offset tabel, jumlah n-gram
+MODEL_DIR = os.environ.get("AUTOKEY_MODEL_DIR", "models")
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+def logProbabilities(counts: np.ndarray) -> np.ndarray:
+    """log10(count / total); n-gram yang tidak muncul diberi floor log10(0.01 / total)."""
+    total = max(1, int(counts.sum()))
+    with np.errstate(divide="ignore"):
+        logp = np.log10(counts / total)
+    logp[counts == 0] = np.log10(0.01 / total)
+    return logp.astype("<f4")
+
+
+class NgramModel:
+    """Tabel log10 P(n-gram) untuk n = 1..max_n (array read-only, biasanya memmap)."""
+
+    def __init__(self, tables: dict, totals: dict, language: str = ""):
+        self.tables = tables
+        self.totals = totals
+        self.language = language
+        self.max_n = max(tables)
+
+    def floor(self, n: int) -> float:
+        return float(np.log10(0.01 / max(1, self.totals[n])))
+
+    def score(self, values: np.ndarray, n: int = None) -> float:
+        """Jumlah log10 P untuk semua n-gram dalam nilai huruf 0-25."""
+        n = n or self.max_n
+        return float(self.tables[n][ngramCodes(values, n, LETTERS)].sum(dtype=np.float64))
+
+    def scoreRows(self, values: np.ndarray, n: int = None) -> np.ndarray:
+        """Skor setiap baris matriks kandidat (baris x huruf) sekaligus."""
+        n = n or self.max_n
+        rows, width = values.shape
+        if width < n:
+            return np.zeros(rows)
+        codes = np.zeros((rows, width - n + 1), dtype=np.int64)
+        for j in range(n):
+            codes = codes * LETTERS + values[:, j:width - n + 1 + j]
+        return self.tables[n][codes].sum(axis=1, dtype=np.float64)
+
+    def scoreText(self, text: str, n: int = None) -> float:
+        return self.score(letterValues(text), n)
+
+    def meanScore(self, text: str, n: int = None) -> float:
+        """Skor rata-rata per n-gram (bisa dibandingkan antar panjang teks)."""
+        n = n or self.max_n
+        values = letterValues(text)
+        return self.score(values, n) / max(1, len(values) - n + 1)
+
+# ======================================================
+# BUILD & SIMPAN
+# ======================================================
+def buildModel(paths, language: str = "", max_n: int = MAX_N) -> NgramModel:
+    """
+    Hitung n-gram huruf dari file korpus (dibaca per potongan, huruf ASCII
+    saja). N-gram tidak melintasi batas file.
+    """
+    if not 1 <= max_n <= MAX_N:
+        raise ValueError(f"max_n harus 1..{MAX_N}")
+    counts = {n: np.zeros(LETTERS ** n, dtype=np.int64) for n in range(1, max_n + 1)}
+    for path in paths:
+        stats = analyzeFile(path, kind="letters", ngrams=tuple(range(2, max_n + 1)))
+        counts[1] += stats["histogram"]
+        for n in range(2, max_n + 1):
+            counts[n] += stats[f"ngram{n}"]
+    if counts[1].sum() < max_n:
+        raise ValueError("Korpus tidak berisi cukup huruf A-Z")
+    return NgramModel({n: logProbabilities(c) for n, c in counts.items()},
+                      {n: int(c.sum()) for n, c in counts.items()}, language)
+
+def saveModel(model: NgramModel, path: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    offset = _align(HEADER.size + TABLE.size * model.max_n)
+    layout = []
+    for n in range(1, model.max_n + 1):
+        layout.append((offset, model.totals[n]))
+        offset = _align(offset + LETTERS ** n * 4)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, LETTERS, model.max_n, model.language.encode("ascii")[:16]))
+        for entry in layout:
+            f.write(TABLE.pack(*entry))
+        for n, (start, _) in enumerate(layout, 1):
+            f.write(b"\x00" * (start - f.tell()))
+            f.write(np.ascontiguousarray(model.tables[n], dtype="<f4").tobytes())
+
+# ======================================================
+# LOAD (mmap)
+# ======================================================
+def openModel(path: str) -> NgramModel:
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path}: bukan file model n-gram")
+    magic, version, size, max_n, language = HEADER.unpack(raw[:HEADER.size].tobytes())
+    if magic != MAGIC:
+        raise ValueError(f"{path}: bukan file model n-gram")
+    if version != VERSION or size != LETTERS or not 1 <= max_n <= MAX_N:
+        raise ValueError(f"{path}: versi/format model tidak didukung (versi {version}, alfabet {size})")
+
+    tables, totals = {}, {}
+    for n in range(1, max_n + 1):
+        start = HEADER.size + TABLE.size * (n - 1)
+        offset, total = TABLE.unpack(raw[start:start + TABLE.size].tobytes())
+        end = offset + LETTERS ** n * 4
+        if end > len(raw):
+            raise ValueError(f"{path}: file model terpotong")
+        tables[n] = raw[offset:end].view("<f4")
+        totals[n] = total
+    return NgramModel(tables, totals, language.rstrip(b"\x00").decode("ascii"))
+
+@functools.lru_cache(maxsize=None)
+def loadModel(path_or_language: str) -> NgramModel:
+    """
+    Buka model sekali per proses. Argumen berupa path file .ngm atau nama
+    bahasa (dicari sebagai MODEL_DIR/<bahasa>.ngm).
+    """
+    path = path_or_language
+    if not os.path.exists(path) and not path.endswith(".ngm"):
+        path = os.path.join(MODEL_DIR, f"{path_or_language}.ngm")
+    return openModel(path)
+
+# ======================================================
+# CLI
+# ======================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bangun dan pakai model n-gram huruf (mmap)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Bangun model dari file korpus teks")
+    build.add_argument("corpus", nargs="+", help="File atau pola glob korpus")
+    build.add_argument("--output", required=True)
+    build.add_argument("--language", default="")
+    build.add_argument("--max-n", type=int, default=MAX_N)
+
+    info = sub.add_parser("info", help="Tampilkan isi header model")
+    info.add_argument("model")
+
+    score = sub.add_parser("score", help="Skor teks dengan model")
+    score.add_argument("model")
+    score.add_argument("text")
+    score.add_argument("--n", type=int)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        paths = sorted({p for pattern in args.corpus for p in (glob.glob(pattern) or [pattern])})
+        model = buildModel(paths, args.language, args.max_n)
+        saveModel(model, args.output)
+        print(f"✅ {args.output}: {len(paths)} file, {model.totals[1]} huruf, "
+              f"{os.path.getsize(args.output) / (1024 * 1024):.2f} MB")
+    elif args.command == "info":
+        model = openModel(args.model)
+        print(f"bahasa: {model.language or '-'}")
+        for n in range(1, model.max_n + 1):
+            seen = int((model.tables[n] > np.float32(model.floor(n))).sum())
+            print(f"  {n}-gram: {model.totals[n]} di korpus, {seen}/{LETTERS ** n} muncul")
+    else:
+        model = openModel(args.model)
+        n = args.n or model.max_n
+        print(f"{model.scoreText(args.text, n):.3f} (per {n}-gram: {model.meanScore(args.text, n):.3f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Dekripsi teks autokey multi-core untuk korpus besar.
+
+Pada dekripsi, huruf plaintext ke-j hanya bergantung pada huruf plaintext
+ke-(j-L) (L = panjang key), jadi posisi huruf terbagi menjadi L kelas residu
+(j mod L) yang sepenuhnya independen. Modul ini:
+1. menormalisasi teks dan mengindeks posisi huruf sekali (di proses utama)
+2. menaruh nilai ciphertext di shared memory
+3. membagi kelas residu ke beberapa proses worker; setiap kelas dipecahkan
+   dengan autokeyRecover dan ditulis langsung ke buffer output bersama
+4. mengembalikan spasi ke posisinya
+
+Hasilnya identik dengan autokeyDecrypt / autokeyDecryptFast. Paralelisme
+dibatasi oleh L: key 1 huruf hanya punya satu kelas residu.
+
+Contoh:
+    python parallel_text.py korpus.enc.txt --key KUNCI --workers 8 --output korpus.txt
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from autokey_fast import autokeyDecryptFast, autokeyRecover, codesToText, keyToNums, splitText
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+PARALLEL_MIN_LETTERS = 4 * 1024 * 1024   # di bawah ini overhead proses lebih besar dari hasilnya
+
+
+def _decryptResidues(in_name: str, out_name: str, n: int, key: list, residues: list) -> int:
+    """Worker: pecahkan kelas residu tertentu, baca/tulis lewat shared memory."""
+    shm_in = shared_memory.SharedMemory(name=in_name)
+    shm_out = shared_memory.SharedMemory(name=out_name)
+    try:
+        ct = np.ndarray(n, dtype=np.uint8, buffer=shm_in.buf)
+        pt = np.ndarray(n, dtype=np.uint8, buffer=shm_out.buf)
+        L = len(key)
+        for r in residues:
+            column = ct[r::L].astype(np.int64)
+            pt[r::L] = autokeyRecover(column, np.array([key[r]], dtype=np.int64), 26)
+        del ct, pt          # lepas view sebelum shared memory ditutup
+        return len(residues)
+    finally:
+        shm_in.close()
+        shm_out.close()
+
+
+def splitResidues(L: int, workers: int) -> list:
+    """Bagi kelas residu 0..L-1 ke `workers` kelompok (round-robin)."""
+    groups = [list(range(w, L, workers)) for w in range(min(workers, L))]
+    return [g for g in groups if g]
+
+
+def recoverParallel(ct: np.ndarray, keyNums: np.ndarray, workers: int, executor=None) -> np.ndarray:
+    """autokeyRecover(ct, key, 26) dengan kelas residu dibagi ke proses worker."""
+    n = len(ct)
+    shm_in = shared_memory.SharedMemory(create=True, size=max(1, n))
+    shm_out = shared_memory.SharedMemory(create=True, size=max(1, n))
+    own = executor is None
+    try:
+        np.ndarray(n, dtype=np.uint8, buffer=shm_in.buf)[:] = ct
+        groups = splitResidues(len(keyNums), workers)
+        pool = executor or ProcessPoolExecutor(max_workers=len(groups))
+        try:
+            key = keyNums.tolist()
+            futures = [pool.submit(_decryptResidues, shm_in.name, shm_out.name, n, key, g) for g in groups]
+            for future in futures:
+                future.result()
+        finally:
+            if own:
+                pool.shutdown()
+        return np.ndarray(n, dtype=np.uint8, buffer=shm_out.buf).copy()
+    finally:
+        shm_in.close()
+        shm_in.unlink()
+        shm_out.close()
+        shm_out.unlink()
+
+
+def autokeyDecryptParallel(ciphertext, key, workers: int = None, min_letters: int = PARALLEL_MIN_LETTERS,
+                           executor=None) -> str:
+    """
+    Dekripsi teks dengan kelas residu dibagi ke beberapa proses. Input kecil,
+    key kosong, atau workers=1 memakai autokeyDecryptFast (hasil sama).
+    `executor` (ProcessPoolExecutor) bisa dipakai ulang antar panggilan.
+    """
+    workers = workers or os.cpu_count() or 1
+    keyNums = keyToNums(key)
+    codes, spaces, letters = splitText(ciphertext)
+    n = int(letters.sum())
+    if workers <= 1 or len(keyNums) <= 1 or n < min_letters:
+        return autokeyDecryptFast(ciphertext, key)
+
+    ct = ((codes[letters].astype(np.int64) - 65) % 26).astype(np.uint8)
+    pt = recoverParallel(ct, keyNums, workers, executor)
+    out = codes.copy()
+    out[letters] = pt.astype(np.uint32) + 65
+    return codesToText(out[spaces | letters])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dekripsi teks autokey multi-core per kelas residu")
+    parser.add_argument("input")
+    parser.add_argument("--key", required=True)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", help="File output (default: tidak ditulis, hanya waktu)")
+    parser.add_argument("--compare", action="store_true", help="Bandingkan waktu dan hasil dengan autokeyDecryptFast")
+    args = parser.parse_args(argv)
+
+    with open(args.input, encoding="utf-8") as f:
+        text = f.read()
+
+    start = time.perf_counter()
+    result = autokeyDecryptParallel(text, args.key, args.workers, min_letters=0)
+    elapsed = time.perf_counter() - start
+    mb = len(text) / (1024 * 1024)
+    print(f"paralel ({args.workers} worker): {elapsed:.3f} s ({mb / elapsed if elapsed else 0:.1f} MB/s)")
+
+    if args.compare:
+        start = time.perf_counter()
+        expected = autokeyDecryptFast(text, args.key)
+        elapsed = time.perf_counter() - start
+        print(f"vektor (1 proses)     : {elapsed:.3f} s ({mb / elapsed if elapsed else 0:.1f} MB/s)")
+        if expected != result:
+            print("❌ Hasil berbeda!")
+            return 1
+        print("✅ Hasil identik")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Enkripsi/dekripsi file dengan tahap baca, cipher, dan tulis yang berjalan
+bersamaan (pipelined).
+
+Tiga thread dihubungkan oleh antrean berbatas:
+
+    reader --(antrean)--> cipher --(antrean)--> writer
+       ^                                           |
+       +---------------- buffer bebas -------------+
+
+Sebanyak `depth` buffer berukuran `chunk_size` dipakai bergantian (double/
+triple buffering): reader mengisi buffer dengan readinto, cipher memproses
+buffer di tempat (AutokeyByteStream.updateInto), writer menulisnya lalu
+mengembalikan buffer ke antrean bebas. updateInto memakai satu buffer kerja
+yang dipakai ulang, jadi tidak ada alokasi per potongan; memori puncak =
+(depth + 1) x chunk_size. I/O file dan kernel NumPy melepas GIL,
+sehingga disk dan CPU bekerja bersamaan dan throughput mendekati tahap yang
+paling lambat.
+
+Contoh:
+    python pipeline.py encrypt video.mp4 video.mp4.enc --key KUNCI --chunk-size 8MB --depth 3
+"""
+import argparse
+import queue
+import sys
+import threading
+import time
+
+from autokey_fast import AutokeyByteStream
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+CHUNK_SIZE = 4 * 1024 * 1024
+QUEUE_DEPTH = 3
+_POLL = 0.1          # detik; interval cek pembatalan saat menunggu antrean
+_END = None          # penanda akhir stream
+
+
+class _Stage:
+    """Status bersama antar thread: pembatalan, error pertama, dan waktu sibuk per tahap."""
+
+    def __init__(self):
+        self.stop = threading.Event()
+        self.error = None
+        self.busy = {"read": 0.0, "cipher": 0.0, "write": 0.0}
+
+    def fail(self, error: BaseException):
+        if self.error is None:
+            self.error = error
+        self.stop.set()
+
+    def put(self, q: queue.Queue, item) -> bool:
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=_POLL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(self, q: queue.Queue):
+        while not self.stop.is_set():
+            try:
+                return q.get(timeout=_POLL)
+            except queue.Empty:
+                pass
+        return _END
+
+
+def _reader(src, free: queue.Queue, out: queue.Queue, state: _Stage):
+    try:
+        while True:
+            buf = state.get(free)
+            if buf is _END:
+                return
+            start = time.perf_counter()
+            n = src.readinto(buf)
+            state.busy["read"] += time.perf_counter() - start
+            if not n:
+                state.put(out, _END)
+                return
+            if not state.put(out, (buf, n)):
+                return
+    except BaseException as e:
+        state.fail(e)
+
+def _cipher(stream: AutokeyByteStream, inbox: queue.Queue, out: queue.Queue, state: _Stage):
+    try:
+        while True:
+            item = state.get(inbox)
+            if item is _END:
+                state.put(out, _END)
+                return
+            buf, n = item
+            view = memoryview(buf)[:n]
+            start = time.perf_counter()
+            stream.updateInto(view, view)
+            state.busy["cipher"] += time.perf_counter() - start
+            view.release()
+            if not state.put(out, (buf, n)):
+                return
+    except BaseException as e:
+        state.fail(e)
+
+def _writeAll(dst, view: memoryview):
+    """Tulis seluruh view; file raw (buffering=0) boleh menulis sebagian."""
+    while view:
+        written = dst.write(view)
+        if written is None:
+            raise BlockingIOError("dst non-blocking belum siap ditulis")
+        view = view[written:]
+
+# ======================================================
+# PIPELINE
+# ======================================================
+def pipelineCopy(src, dst, key, decrypt: bool = False, chunk_size: int = CHUNK_SIZE,
+                 depth: int = QUEUE_DEPTH) -> dict:
+    """
+    Baca src (file biner dengan readinto), enkripsi/dekripsi, tulis ke dst.
+    Writer berjalan di thread pemanggil. Kembalikan statistik byte, waktu,
+    dan waktu sibuk tiap tahap (untuk melihat tahap mana yang jadi bottleneck).
+    """
+    if chunk_size <= 0 or depth < 1:
+        raise ValueError("chunk_size harus > 0 dan depth >= 1")
+    stream = AutokeyByteStream(key, decrypt=decrypt)
+    state = _Stage()
+    free = queue.Queue()
+    for _ in range(depth):
+        free.put(bytearray(chunk_size))
+    toCipher = queue.Queue(maxsize=depth)
+    toWrite = queue.Queue(maxsize=depth)
+
+    threads = [
+        threading.Thread(target=_reader, args=(src, free, toCipher, state), name="autokey-reader", daemon=True),
+        threading.Thread(target=_cipher, args=(stream, toCipher, toWrite, state), name="autokey-cipher", daemon=True),
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+
+    total = 0
+    try:
+        while True:
+            item = state.get(toWrite)
+            if item is _END:
+                break
+            buf, n = item
+            t0 = time.perf_counter()
+            with memoryview(buf)[:n] as view:
+                _writeAll(dst, view)
+            state.busy["write"] += time.perf_counter() - t0
+            total += n
+            free.put(buf)
+    except BaseException as e:
+        state.fail(e)
+    finally:
+        state.stop.set()
+        for t in threads:
+            t.join()
+    if state.error is not None:
+        raise state.error
+
+    elapsed = time.perf_counter() - start
+    return {
+        "bytes": total,
+        "elapsed_s": elapsed,
+        "throughput_mb_s": total / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+        "busy_s": dict(state.busy),
+        "chunk_size": chunk_size,
+        "depth": depth,
+    }
+
+def pipelineFile(src_path: str, dst_path: str, key, decrypt: bool = False,
+                 chunk_size: int = CHUNK_SIZE, depth: int = QUEUE_DEPTH) -> dict:
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        return pipelineCopy(src, dst, key, decrypt, chunk_size, depth)
+
+# ======================================================
+# CLI
+# ======================================================
+def main(argv=None):
+    from benchmark import parseSize
+
+    parser = argparse.ArgumentParser(description="Enkripsi/dekripsi file dengan pipeline baca/cipher/tulis")
+    parser.add_argument("operation", choices=["encrypt", "decrypt"])
+    parser.add_argument("source")
+    parser.add_argument("target")
+    parser.add_argument("--key", required=True)
+    parser.add_argument("--chunk-size", default="4MB")
+    parser.add_argument("--depth", type=int, default=QUEUE_DEPTH, help="Jumlah buffer / kedalaman antrean")
+    args = parser.parse_args(argv)
+
+    stats = pipelineFile(args.source, args.target, args.key, args.operation == "decrypt",
+                         parseSize(args.chunk_size), args.depth)
+    busy = ", ".join(f"{name} {seconds:.2f} s" for name, seconds in stats["busy_s"].items())
+    print(f"{stats['bytes'] / (1024 * 1024):.2f} MB dalam {stats['elapsed_s']:.2f} s "
+          f"= {stats['throughput_mb_s']:.2f} MB/s (sibuk: {busy})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
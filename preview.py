@@ -0,0 +1,48 @@
+"""
+Pratinjau cepat untuk file teks tanpa men-decode seluruh file.
+
+readPreview hanya membaca beberapa KB pertama dan men-decode-nya dengan
+decoder UTF-8 inkremental, sehingga karakter multi-byte yang terpotong di
+batas bacaan tidak dianggap error (byte sisanya ditahan decoder). Ukuran
+file diambil dari metadata (byte), bukan dari len() hasil decode.
+
+previewCipher mengenkripsi/dekripsi prefix itu saja. Autokey bersifat
+prefix-konsisten — output untuk prefix input sama dengan prefix output
+penuh — jadi pratinjau bisa ditampilkan sebelum job penuh selesai.
+"""
+import codecs
+
+from autokey_fast import autokeyDecryptFast, autokeyEncryptFast
+from alphabet import autokeyDecryptAlphabet, autokeyEncryptAlphabet
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+PREVIEW_BYTES = 4 * 1024
+PREVIEW_CHARS = 500
+
+
+def readPreview(fileobj, max_chars: int = PREVIEW_CHARS, max_bytes: int = PREVIEW_BYTES):
+    """
+    Baca maksimal max_bytes dari awal fileobj dan kembalikan (teks, terpotong).
+    Posisi file dikembalikan ke awal. UnicodeDecodeError hanya muncul untuk
+    byte yang memang tidak valid, bukan karena potongan di tengah karakter.
+    """
+    head = fileobj.read(max_bytes)
+    more = bool(fileobj.read(1)) if len(head) == max_bytes else False
+    fileobj.seek(0)
+    text = codecs.getincrementaldecoder("utf-8")().decode(head, final=not more)
+    return text[:max_chars], more or len(text) > max_chars
+
+def formatSize(n: int) -> str:
+    for unit, size in (("MB", 1024 ** 2), ("KB", 1024)):
+        if n >= size:
+            return f"{n / size:.2f} {unit}"
+    return f"{n} byte"
+
+def previewCipher(prefix: str, key, decrypt: bool, alphabet=None, outside: str = "keep") -> str:
+    """Enkripsi/dekripsi prefix teks dengan engine vektor (tanpa tabel proses)."""
+    if alphabet is None:
+        return (autokeyDecryptFast if decrypt else autokeyEncryptFast)(prefix, key)
+    fn = autokeyDecryptAlphabet if decrypt else autokeyEncryptAlphabet
+    return fn(prefix, key, alphabet, outside)
@@ -0,0 +1,181 @@
+"""
+Mode profiling untuk satu kali proses encrypt, decrypt, atau findKey.
+
+Dua mode:
+- "deterministic": cProfile, output file .pstats (buka dengan snakeviz/pstats)
+- "sampling": sampler berbasis thread, output collapsed stack
+  (format "a;b;c 42", siap untuk flamegraph.pl / speedscope)
+
+Contoh CLI:
+    python profiling.py encrypt --input sample/plaintext.txt --key KUNCI
+    python profiling.py decryptBytes --input file.pdf.enc --key KUNCI --mode sampling --output prof.txt
+"""
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from autokey_functions import *
+
+# ======================================================
+# OPERASI YANG BISA DIPROFILE
+# ======================================================
+# nama -> (fungsi, input biner?)
+OPERATIONS = {
+    "encrypt": (autokeyEncrypt, False),
+    "decrypt": (autokeyDecrypt, False),
+    "findKey": (findKey, False),
+    "encryptBytes": (autokeyEncryptBytes, True),
+    "decryptBytes": (autokeyDecryptBytes, True),
+}
+
+
+@dataclass
+class ProfileResult:
+    result: object
+    mode: str
+    elapsed: float
+    output: bytes                      # isi file pstats atau collapsed stack
+    top: list = field(default_factory=list)  # [(fungsi, self_detik_atau_sampel, total)]
+
+    @property
+    def filename(self) -> str:
+        return "profile.pstats" if self.mode == "deterministic" else "profile.collapsed.txt"
+
+    def summary(self, limit: int = 15) -> str:
+        unit = "detik" if self.mode == "deterministic" else "sampel"
+        lines = [f"Total waktu: {self.elapsed:.4f} s ({self.mode}, satuan: {unit})",
+                 f"{'self':>10} {'total':>10}  fungsi"]
+        for name, own, total in self.top[:limit]:
+            lines.append(f"{own:>10.4g} {total:>10.4g}  {name}")
+        return "\n".join(lines)
+
+# ======================================================
+# DETERMINISTIC (cProfile)
+# ======================================================
+def _funcLabel(code) -> str:
+    filename, line, name = code
+    if filename == "~":
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+def _profileDeterministic(fn, args, kwargs):
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    result = profiler.runcall(fn, *args, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profile.pstats")
+        stats.dump_stats(path)
+        with open(path, "rb") as f:
+            output = f.read()
+
+    rows = [(_funcLabel(func), tt, ct) for func, (cc, nc, tt, ct, callers) in stats.stats.items()]
+    rows.sort(key=lambda r: r[1], reverse=True)
+    return ProfileResult(result, "deterministic", elapsed, output, rows)
+
+# ======================================================
+# SAMPLING (collapsed stack)
+# ======================================================
+def _frameLabel(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def _profileSampling(fn, args, kwargs, interval: float):
+    target = threading.get_ident()
+    own_code = sys._getframe().f_code
+    stacks = Counter()
+    done = threading.Event()
+
+    def sampler():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            # berhenti di frame profiler agar stack hanya berisi pekerjaan fn
+            while frame is not None and frame.f_code is not own_code:
+                stack.append(_frameLabel(frame))
+                frame = frame.f_back
+            if stack:
+                stacks[";".join(reversed(stack))] += 1
+
+    thread = threading.Thread(target=sampler, daemon=True)
+    # switch interval diperkecil agar thread sampler mendapat GIL tepat waktu
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    start = time.perf_counter()
+    thread.start()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    elapsed = time.perf_counter() - start
+
+    own, total = Counter(), Counter()
+    for stack, n in stacks.items():
+        frames = stack.split(";")
+        own[frames[-1]] += n
+        for name in set(frames):
+            total[name] += n
+    rows = sorted(((name, own[name], total[name]) for name in total), key=lambda r: r[1], reverse=True)
+    output = "".join(f"{stack} {n}\n" for stack, n in stacks.most_common()).encode("utf-8")
+    return ProfileResult(result, "sampling", elapsed, output, rows)
+
+
+def profileRun(fn, *args, mode: str = "deterministic", interval: float = 0.001, **kwargs) -> ProfileResult:
+    """Jalankan fn(*args) di bawah profiler dan kembalikan hasil + output profil."""
+    if mode == "deterministic":
+        return _profileDeterministic(fn, args, kwargs)
+    if mode == "sampling":
+        return _profileSampling(fn, args, kwargs, interval)
+    raise ValueError(f"Mode profiling tidak dikenal: {mode}")
+
+# ======================================================
+# CLI
+# ======================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile satu proses Autokey Cipher")
+    parser.add_argument("operation", choices=list(OPERATIONS))
+    parser.add_argument("--input", required=True, help="File input (plaintext untuk findKey)")
+    parser.add_argument("--key", help="Key (encrypt/decrypt)")
+    parser.add_argument("--ciphertext", help="File ciphertext (khusus findKey)")
+    parser.add_argument("--mode", choices=["deterministic", "sampling"], default="deterministic")
+    parser.add_argument("--interval", type=float, default=0.001, help="Interval sampling (detik)")
+    parser.add_argument("--output", help="File output profil (default: profile.pstats / profile.collapsed.txt)")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    fn, binary = OPERATIONS[args.operation]
+    with open(args.input, "rb") as f:
+        data = f.read()
+    if args.operation == "findKey":
+        if not args.ciphertext:
+            parser.error("findKey membutuhkan --ciphertext")
+        with open(args.ciphertext, encoding="utf-8") as f:
+            call_args = (data.decode("utf-8"), f.read())
+    else:
+        if not args.key:
+            parser.error(f"{args.operation} membutuhkan --key")
+        call_args = (data if binary else data.decode("utf-8"), args.key)
+
+    profile = profileRun(fn, *call_args, mode=args.mode, interval=args.interval)
+    output = args.output or profile.filename
+    with open(output, "wb") as f:
+        f.write(profile.output)
+    print(profile.summary(args.top))
+    print(f"\nProfil disimpan ke {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
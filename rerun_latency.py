@@ -0,0 +1,126 @@
+"""
+Ukur latensi rerun aplikasi Streamlit untuk interaksi widget umum.
+
+Setiap perubahan widget menjalankan ulang skrip. Tanpa fragment, yang
+dijalankan adalah seluruh app3.py (CSS, header, sidebar, ketiga tab, dan
+panduan). Dengan st.fragment, server hanya menjalankan fragment tempat widget
+itu berada. Skrip ini menjalankan aplikasi dengan AppTest (yang selalu
+menjalankan seluruh skrip) dan mengukur dua angka per interaksi:
+- skrip penuh : waktu at.run(), yaitu biaya rerun tanpa fragment
+- fragment    : waktu badan fragment pemilik widget (st.fragment dibungkus
+                timer), yaitu biaya rerun di server sungguhan. Jika aplikasi
+                tidak memakai fragment, kolom ini sama dengan skrip penuh.
+
+Sebelum skenario dijalankan, mode Teks Manual memproses teks sebesar --chars
+huruf, sehingga ada hasil besar (tabel proses) di halaman.
+
+Contoh (sebelum vs sesudah; app harus berada di folder yang sama dengan modulnya):
+    git show <commit>:app3.py > app3_before.py
+    python rerun_latency.py --app app3_before.py
+    python rerun_latency.py --app app3.py
+"""
+import argparse
+import functools
+import os
+import statistics
+import sys
+import time
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+REPEAT = 5
+TEXT_CHARS = 5000
+
+
+def _widget(elements, label_prefix):
+    """Cari widget dari awal labelnya (aplikasi lama tidak memakai key widget)."""
+    for element in elements:
+        if element.label.startswith(label_prefix):
+            return element
+    raise LookupError(f"Widget '{label_prefix}' tidak ditemukan")
+
+def _toggle(elements, label_prefix, a, b):
+    def action(at):
+        widget = _widget(elements(at), label_prefix)
+        widget.set_value(b if widget.value == a else a)
+    return action
+
+# (nama interaksi, fragment pemilik widget, aksi)
+SCENARIO = [
+    ("ganti operasi", "cipherTab", _toggle(lambda at: at.selectbox, "⚙️", "Enkripsi", "Dekripsi")),
+    ("ganti tipe input", "cipherTab",
+     _toggle(lambda at: at.selectbox, "📥", "Teks Manual", "File Teks (.txt)")),
+    ("ubah key", "cipherTab", _toggle(lambda at: at.text_input, "🔑", "KUNCI", "KUNCIX")),
+    ("ganti metode find key", "findKeyTab",
+     _toggle(lambda at: at.radio, "Pilih Metode", "Input Manual", "Upload File .txt")),
+]
+
+
+def _timedFragment(original, timings: list):
+    """Pengganti st.fragment yang mencatat (nama fungsi, detik) setiap kali fragment berjalan."""
+    def fragment(func=None, **kwargs):
+        def wrap(f):
+            @functools.wraps(f)
+            def timed(*args, **kw):
+                start = time.perf_counter()
+                try:
+                    return f(*args, **kw)
+                finally:
+                    timings.append((f.__name__, time.perf_counter() - start))
+            return original(timed, **kwargs)
+        return wrap(func) if func is not None else wrap
+    return fragment
+
+
+def measure(app: str, repeat: int = REPEAT, text_chars: int = TEXT_CHARS) -> list:
+    """Kembalikan [(interaksi, median skrip penuh, median fragment)] dalam detik."""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    timings = []
+    original = st.fragment
+    st.fragment = _timedFragment(original, timings)
+    try:
+        at = AppTest.from_file(os.path.abspath(app), default_timeout=300).run()
+        text = ("HALO DUNIA INI TEKS UJI " * (text_chars // 24 + 1))[:text_chars]
+        _widget(at.text_area, "📝").set_value(text)
+        _widget(at.text_input, "🔑").set_value("KUNCI")
+        _widget(at.button, "🚀").click()
+        at.run()
+
+        rows = []
+        for name, owner, action in SCENARIO:
+            full, partial = [], []
+            for _ in range(repeat):
+                action(at)
+                timings.clear()
+                start = time.perf_counter()
+                at.run()
+                full.append(time.perf_counter() - start)
+                spent = [seconds for fragment, seconds in timings if fragment == owner]
+                partial.append(spent[-1] if spent else full[-1])
+            rows.append((name, statistics.median(full), statistics.median(partial)))
+        return rows
+    finally:
+        st.fragment = original
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ukur latensi rerun Streamlit per interaksi widget")
+    parser.add_argument("--app", default="app3.py")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--chars", type=int, default=TEXT_CHARS, help="Panjang teks yang diproses sebelum skenario")
+    args = parser.parse_args(argv)
+
+    # app3.py mengimpor modul lain dari folder yang sama
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.app)))
+    rows = measure(args.app, args.repeat, args.chars)
+    print(f"{'interaksi':<24}{'skrip penuh':>14}{'fragment':>12}")
+    for name, full, partial in rows:
+        print(f"{name:<24}{full * 1000:>11.1f} ms{partial * 1000:>9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
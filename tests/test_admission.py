@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from admission import AdmissionController, AdmissionError
+
+
+def test_idle_sessions_expire():
+    controller = AdmissionController(max_jobs=2, rate_window=0.05)
+    for n in range(50):
+        with controller.admit(f"sesi-{n}", 1024):
+            pass
+    assert controller.status()["sessions"] > 0
+
+    time.sleep(0.1)
+    assert controller.status()["sessions"] == 0
+
+
+def test_session_with_job_in_flight_is_kept():
+    controller = AdmissionController(max_jobs=2, rate_window=0.05)
+    with controller.admit("aktif", 1024):
+        time.sleep(0.1)
+        with controller.admit("lain", 1024):
+            pass
+        assert controller.status()["sessions"] >= 1
+        assert "aktif" in controller._sessions
+    time.sleep(0.1)
+    assert controller.status()["sessions"] == 0
+
+
+def test_rate_limit_still_applies_within_window():
+    controller = AdmissionController(max_jobs=1, rate_limit=2, rate_window=60)
+    for _ in range(2):
+        with controller.admit("sesi", 10):
+            pass
+    with pytest.raises(AdmissionError) as error:
+        with controller.admit("sesi", 10):
+            pass
+    assert error.value.reason == "rate"
@@ -0,0 +1,21 @@
+import pytest
+
+from alphabet import Alphabet, autokeyAlphabetReference, autokeyDecryptAlphabet, autokeyEncryptAlphabet
+
+GREEK = "ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ"
+TEXT = "Halo ΑΒΓ dunia 😀 ΩΨ \U0010FFFF é"
+
+
+@pytest.mark.parametrize("alphabet", ["latin", "latin-ext", "alnum", GREEK, "a😀\U0010FFFFé"])
+@pytest.mark.parametrize("outside", ["keep", "drop"])
+def test_non_ascii_alphabet_matches_reference(alphabet, outside):
+    key = "Β😀aé"
+    assert autokeyEncryptAlphabet(TEXT, key, alphabet, outside) == autokeyAlphabetReference(TEXT, key, alphabet, outside)
+    assert autokeyDecryptAlphabet(TEXT, key, alphabet, outside) == \
+        autokeyAlphabetReference(TEXT, key, alphabet, outside, decrypt=True)
+
+
+def test_table_size_follows_symbols_not_code_points():
+    alpha = Alphabet("a\U0010FFFF")
+    tables = (alpha.index, alpha.form, alpha.wide_codes, alpha.wide_index, alpha.wide_form, alpha.reverse)
+    assert sum(t.nbytes for t in tables) < 4096
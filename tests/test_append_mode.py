@@ -0,0 +1,55 @@
+import hashlib
+import json
+
+import pytest
+
+from append_mode import appendEncrypt, statePath
+from autokey_fast import autokeyEncryptBytesFast
+
+
+def _state(enc):
+    with open(statePath(str(enc)), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_state_fingerprint_is_salted(tmp_path):
+    key = "KUNCI"
+    for name in ("a.log", "b.log"):
+        (tmp_path / name).write_bytes(b"baris log\n" * 10)
+        appendEncrypt(str(tmp_path / name), str(tmp_path / (name + ".enc")), key)
+    a, b = _state(tmp_path / "a.log.enc"), _state(tmp_path / "b.log.enc")
+
+    assert a["key_salt"] != b["key_salt"]
+    assert a["key_fingerprint"] != b["key_fingerprint"]
+    unsalted = hashlib.sha256(key.encode()).hexdigest()
+    assert not unsalted.startswith(a["key_fingerprint"][:16])
+
+
+def test_append_checks_key_and_keeps_output_identical(tmp_path):
+    src, enc = tmp_path / "app.log", tmp_path / "app.log.enc"
+    src.write_bytes(b"baris pertama\n")
+    appendEncrypt(str(src), str(enc), "KUNCI")
+    salt = _state(enc)["key_salt"]
+    with open(src, "ab") as f:
+        f.write(b"baris kedua\n")
+
+    with pytest.raises(ValueError):
+        appendEncrypt(str(src), str(enc), "KUNCX")
+    appendEncrypt(str(src), str(enc), "KUNCI")
+
+    assert _state(enc)["key_salt"] == salt
+    assert enc.read_bytes() == bytes(autokeyEncryptBytesFast(src.read_bytes(), "KUNCI"))
+
+
+def test_fingerprint_computed_once_per_session(tmp_path, monkeypatch):
+    calls = []
+    pbkdf2 = hashlib.pbkdf2_hmac
+    monkeypatch.setattr(hashlib, "pbkdf2_hmac", lambda *a: calls.append(a) or pbkdf2(*a))
+    src, enc = tmp_path / "app.log", tmp_path / "app.log.enc"
+    src.write_bytes(b"baris pertama\n")
+    for _ in range(3):
+        with open(src, "ab") as f:
+            f.write(b"baris baru\n")
+        appendEncrypt(str(src), str(enc), "KUNCI")
+
+    assert len(calls) == 1
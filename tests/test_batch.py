@@ -0,0 +1,53 @@
+import os
+import stat
+
+import pytest
+
+from batch import Job, buildJobs, processFile, readManifest
+
+
+def test_output_keeps_source_mode(tmp_path):
+    source = tmp_path / "data.bin"
+    source.write_bytes(b"isi file rahasia" * 100)
+    os.chmod(source, 0o644)
+    encrypted = tmp_path / "out" / "data.bin.enc"
+    decrypted = tmp_path / "out" / "data.bin"
+
+    assert processFile(Job(str(source), str(encrypted)), "KUNCI", decrypt=False).status == "ok"
+    assert processFile(Job(str(encrypted), str(decrypted)), "KUNCI", decrypt=True).status == "ok"
+
+    assert stat.S_IMODE(os.stat(encrypted).st_mode) == 0o644
+    assert stat.S_IMODE(os.stat(decrypted).st_mode) == 0o644
+    assert decrypted.read_bytes() == source.read_bytes()
+
+
+def test_pipelined_output_keeps_source_mode(tmp_path):
+    source = tmp_path / "data.bin"
+    source.write_bytes(os.urandom(300_000))
+    os.chmod(source, 0o640)
+    target = tmp_path / "data.bin.enc"
+
+    result = processFile(Job(str(source), str(target)), "KUNCI", decrypt=False, chunk_size=65536, depth=2)
+    assert result.status == "ok"
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
+
+
+def test_manifest_keeps_directory_structure(tmp_path):
+    outside = tmp_path / "lain"
+    for folder in ("a", "b"):
+        (outside / folder).mkdir(parents=True)
+        (outside / folder / "app.log").write_bytes(b"log")
+    manifest = tmp_path / "proyek" / "daftar.txt"
+    manifest.parent.mkdir()
+    manifest.write_text(f"{outside / 'a' / 'app.log'}\n../lain/b/app.log\n", encoding="utf-8")
+
+    jobs = buildJobs(readManifest(str(manifest)), "out", decrypt=False)
+    targets = [job.target for job in jobs]
+    assert len(set(targets)) == 2
+    assert all(os.path.basename(t) == "app.log.enc" and ".." not in t for t in targets)
+
+
+def test_colliding_outputs_are_rejected():
+    entries = [("x.dec.enc", "x.dec.enc"), ("x", "x")]
+    with pytest.raises(ValueError):
+        buildJobs(entries, "out", decrypt=True)
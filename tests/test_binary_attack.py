@@ -0,0 +1,28 @@
+import os
+
+import numpy as np
+import pytest
+
+from autokey_fast import autokeyEncryptBytesFast
+from binary_attack import crackBytes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+with open(os.path.join(ROOT, "sample", "plaintext.jpg"), "rb") as f:
+    JPEG = f.read()
+
+
+@pytest.mark.parametrize("name", [None, "plaintext.jpg.enc"])
+@pytest.mark.parametrize("key", ["K", "ab", "KUNCI", "SECRETKEY", "Tr0ngK3y!2024", "RahasiaSekali123"])
+def test_jpeg_key_is_recovered(key, name):
+    # 3/4 gambar ini berupa pola 4 byte yang berulang, yang juga cocok dengan L = 4
+    guess = crackBytes(autokeyEncryptBytesFast(JPEG, key), name=name, workers=1)
+    assert guess.key == key.encode(), (guess.key, guess.check.reasons)
+    assert guess.confidence >= 0.7
+
+
+def test_wrong_guess_is_not_reported_as_found():
+    # data acak: key apa pun yang ditebak tidak boleh tampil sebagai "Key Ditemukan"
+    data = np.random.default_rng(0).integers(0, 256, 64 * 1024, dtype=np.uint8).tobytes()
+    guess = crackBytes(autokeyEncryptBytesFast(data, "KUNCI"), workers=1)
+    assert guess.confidence < 0.3
@@ -0,0 +1,59 @@
+import lzma
+import tracemalloc
+import zlib
+
+import pytest
+
+from compression import HEADER, MAGIC, CODECS, compressPayload, decompressPayload, decryptCompressed, encryptCompressed
+
+
+def _payload(codec: str, size: int, packed: bytes) -> bytes:
+    return HEADER.pack(MAGIC, CODECS[codec], size) + packed
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    return zlib.compress(data) if codec == "zlib" else lzma.compress(data)
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_round_trip(codec):
+    data = b"baris log yang berulang\n" * 5000
+    assert decompressPayload(compressPayload(data, codec)) == data
+    assert decryptCompressed(encryptCompressed(data, "KUNCI", codec), "KUNCI") == data
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_output_larger_than_header_is_rejected(codec):
+    # 64 MB nol terkompres jadi beberapa KB, tetapi header hanya mengaku 16 byte
+    payload = _payload(codec, 16, _compress(codec, bytes(64 * 1024 * 1024)))
+    tracemalloc.start()
+    try:
+        result = decompressPayload(payload)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert result == payload
+    assert peak < 16 * 1024 * 1024      # tanpa batas: 64 MB (lzma sendiri butuh kamus 8 MB)
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_output_smaller_than_header_is_rejected(codec):
+    payload = _payload(codec, 1000, _compress(codec, b"x" * 999))
+    assert decompressPayload(payload) == payload
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_leftover_data_is_rejected(codec):
+    payload = _payload(codec, 100, _compress(codec, b"y" * 100) + b"sisa data")
+    assert decompressPayload(payload) == payload
+
+
+def test_truncated_stream_is_rejected():
+    packed = zlib.compress(bytes(range(256)) * 40)
+    payload = _payload("zlib", 256 * 40, packed[:len(packed) // 2])
+    assert decompressPayload(payload) == payload
+
+
+def test_huge_header_size_is_rejected():
+    payload = _payload("zlib", 2 ** 64 - 1, zlib.compress(b"abc"))
+    assert decompressPayload(payload) == payload
@@ -0,0 +1,43 @@
+import pytest
+
+from dispatcher import Dispatcher, _fit
+
+
+def test_fit_recovers_quadratic_cost():
+    sizes = (1024, 2048, 4096)
+    model = _fit(sizes, [1e-3 + 2e-6 * n + 5e-9 * n * n for n in sizes], quadratic=True)
+    assert model["a"] == pytest.approx(1e-3)
+    assert model["b"] == pytest.approx(2e-6)
+    assert model["c"] == pytest.approx(5e-9)
+
+
+def test_fit_drops_negative_terms():
+    sizes = (1024, 2048, 4096)
+    model = _fit(sizes, [3e-9 * n * n for n in sizes], quadratic=True)
+    assert model["c"] == pytest.approx(3e-9)
+    assert model["b"] > 0
+    linear = _fit((16, 32), [2.0, 1.0])
+    assert linear["b"] > 0 and linear["a"] >= 0
+
+
+def test_quadratic_engine_is_not_chosen_for_large_text():
+    # python lebih cepat di input kecil, tapi O(n^2) membuatnya kalah di input besar
+    models = {
+        "text/encrypt/python": {"a": 0.0, "b": 1e-7, "c": 1e-9},
+        "text/encrypt/vectorized": {"a": 1e-3, "b": 1e-7},
+    }
+    dispatcher = Dispatcher(models=models, cores=1)
+    assert dispatcher.decide("encrypt", 100, "KUNCI", kind="text").engine == "python"
+    assert dispatcher.decide("encrypt", 100_000, "KUNCI", kind="text").engine == "vectorized"
+
+
+@pytest.mark.parametrize("data", ["Halo Dunia, ini teks rahasia!", b"\x00\x01biner\xff" * 50])
+def test_forced_engines_agree(data):
+    models = {f"{kind}/{op}/{engine}": {"a": 0.0, "b": 1e-9}
+              for kind in ("text", "bytes") for op in ("encrypt", "decrypt")
+              for engine in ("python", "vectorized", "streaming")}
+    dispatcher = Dispatcher(models=models, cores=1)
+    engines = ("python", "vectorized") if isinstance(data, str) else ("python", "vectorized", "streaming")
+    for run in (dispatcher.encrypt, dispatcher.decrypt):
+        results = [run(data, "KUNCI", engine) for engine in engines]
+        assert all(result == results[0] for result in results)
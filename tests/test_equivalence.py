@@ -0,0 +1,330 @@
+"""
+Differential equivalence harness: setiap engine cepat harus menghasilkan
+output yang identik dengan fungsi referensi di autokey_functions.py.
+
+Input dibangkitkan secara acak (teks Unicode campuran, key dengan panjang
+dan isi acak, batas chunk acak). Jika ada perbedaan, input yang gagal
+diperkecil (bisection: potongan teks/data/key dibuang selama perbedaan tetap
+muncul), lalu seed dan input minimal dicetak untuk reproduksi.
+
+pytest menjalankan ITERATIONS kasus dengan SEED tetap. Untuk pencarian lebih
+luas, jalankan sebagai script:
+    python tests/test_equivalence.py --iterations 5000 --seed 42
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autokey_functions import *
+from autokey_fast import *
+from alphabet import *
+from parallel_text import autokeyDecryptParallel
+from live_edit import AutokeyEditSession
+from concurrent.futures import ProcessPoolExecutor
+
+SEED = 20240517
+ITERATIONS = 200
+
+# ======================================================
+# GENERATOR INPUT ACAK
+# ======================================================
+# Kelompok karakter yang memicu quirk referensi: spasi dipertahankan,
+# whitespace lain dinormalisasi, non-huruf dibuang, huruf non-ASCII tetap
+# dianggap huruf oleh isalpha(), dan upper() bisa memperpanjang string (ß -> SS).
+CHAR_POOLS = [
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "abcdefghijklmnopqrstuvwxyz",
+    "     \t\n\r\r\n",
+    "0123456789",
+    ".,;:!?'\"-()[]{}@#$%^&*_+=/\\|<>~`",
+    "àáâãäåæçèéêëìíîïñòóôõöøùúûüýÿßÀÉÑ",
+    "αβγδεζηθλμπσωΩΣ",
+    "абвгдежзийклмнЖЯ",
+    "中文字符日本語한국어",
+    "🔐😀✓€°  ​́",
+]
+
+
+def randomText(rng: random.Random, max_len: int) -> str:
+    weights = [30, 20, 15, 5, 5, 8, 4, 4, 4, 5]
+    n = rng.randint(0, max_len)
+    return "".join(rng.choice(rng.choices(CHAR_POOLS, weights)[0]) for _ in range(n))
+
+
+def randomKey(rng: random.Random, allow_empty: bool) -> str:
+    key = randomText(rng, rng.choice([1, 3, 8, 20, 60]))
+    if not key and not allow_empty:
+        key = rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    return key
+
+
+def randomSplits(rng: random.Random, n: int) -> list:
+    """Batas chunk acak, termasuk chunk kosong dan chunk 1 byte."""
+    cuts = sorted(rng.randint(0, n) for _ in range(rng.randint(0, 8)))
+    bounds = [0] + cuts + [n]
+    return list(zip(bounds, bounds[1:]))
+
+
+def clampSplits(splits: list, n: int) -> list:
+    """Sesuaikan batas chunk dengan data yang sudah diperkecil; chunk terakhir berakhir di n."""
+    clamped = [(min(a, n), min(b, n)) for a, b in splits]
+    return clamped[:-1] + [(clamped[-1][0], n)]
+
+
+# ======================================================
+# ENGINE YANG DIBANDINGKAN
+# ======================================================
+def chunked(decrypt: bool):
+    def run(data, key, splits):
+        stream = AutokeyByteStream(key, decrypt=decrypt)
+        return b"".join(stream.update(data[a:b]) for a, b in splits)
+    return run
+
+
+def resumed(decrypt: bool):
+    """Seperti chunked(), tetapi stream disimpan-dipulihkan dari state di setiap batas."""
+    def run(data, key, splits):
+        stream = AutokeyByteStream(key, decrypt=decrypt)
+        out = []
+        for a, b in splits:
+            stream = AutokeyByteStream.fromState(stream.stateBytes(), decrypt=decrypt)
+            out.append(stream.update(data[a:b]))
+        return b"".join(out)
+    return run
+
+
+def intoBuffer(fn, inplace: bool, **kwargs):
+    """Jalankan fn dengan out= (buffer terpisah atau in-place) lalu kembalikan bytes."""
+    def run(data, key, splits):
+        buf = bytearray(data) if inplace else bytearray(len(data))
+        src = memoryview(buf) if inplace else memoryview(data)
+        fn(src, key, out=buf, **kwargs)
+        return bytes(buf)
+    return run
+
+
+# Setiap operasi: (referensi, {nama_engine: fungsi}). Fungsi teks menerima
+# (input, key), fungsi biner menerima (data, key, splits).
+_executor = None
+
+def _pool():
+    """Satu pool proses untuk seluruh run, agar tiap kasus tidak membuat proses baru."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=3)
+    return _executor
+
+TEXT_ENGINES = {
+    "encrypt": (lambda t, k: autokeyEncrypt(t, k)[0], {
+        "vectorized": autokeyEncryptFast,
+        "prepared-key": lambda t, k: autokeyEncryptFast(t, prepareKey(k)),
+        # sesi edit: mulai dari separuh teks, lalu update ke teks penuh
+        "live-edit": lambda t, k: AutokeyEditSession(k, t[:len(t) // 2]).update(t),
+    }),
+    "decrypt": (lambda t, k: autokeyDecrypt(t, k)[0], {
+        "vectorized": autokeyDecryptFast,
+        "prepared-key": lambda t, k: autokeyDecryptFast(t, prepareKey(k)),
+        # min_letters=0 memaksa jalur multi-proses walau input kecil
+        "parallel": lambda t, k: autokeyDecryptParallel(t, k, workers=3, min_letters=0, executor=_pool()),
+    }),
+    "findKey": (lambda p, c: findKey(p, c)[0], {
+        "vectorized": findKeyFast,
+    }),
+}
+
+BYTE_ENGINES = {
+    "encryptBytes": (autokeyEncryptBytes, {
+        "vectorized": lambda d, k, s: autokeyEncryptBytesFast(d, k),
+        "prepared-key": lambda d, k, s: autokeyEncryptBytesFast(d, prepareKey(k)),
+        "chunked": chunked(decrypt=False),
+        "resumed": resumed(decrypt=False),
+        "out": intoBuffer(autokeyEncryptBytesFast, inplace=False),
+        "inplace": intoBuffer(autokeyEncryptBytesFast, inplace=True),
+        "inplace-chunked": intoBuffer(lambda d, k, out: processBytesInto(d, k, out, decrypt=False, chunk_size=7),
+                                      inplace=True),
+        "reference-inplace": intoBuffer(autokeyEncryptBytes, inplace=True),
+    }),
+    "decryptBytes": (autokeyDecryptBytes, {
+        "vectorized": lambda d, k, s: autokeyDecryptBytesFast(d, k),
+        "prepared-key": lambda d, k, s: autokeyDecryptBytesFast(d, prepareKey(k)),
+        "chunked": chunked(decrypt=True),
+        "resumed": resumed(decrypt=True),
+        "out": intoBuffer(autokeyDecryptBytesFast, inplace=False),
+        "inplace": intoBuffer(autokeyDecryptBytesFast, inplace=True),
+        "inplace-chunked": intoBuffer(lambda d, k, out: processBytesInto(d, k, out, decrypt=True, chunk_size=7),
+                                      inplace=True),
+        "reference-inplace": intoBuffer(autokeyDecryptBytes, inplace=True),
+    }),
+}
+
+
+# ======================================================
+# HARNESS
+# ======================================================
+class Mismatch(Exception):
+    def __init__(self, op: str, engine: str, run, inputs: dict):
+        super().__init__(f"{op}/{engine} berbeda dari referensi")
+        self.op = op
+        self.engine = engine
+        self.run = run              # fn(**inputs) -> (expected, actual), untuk shrinking
+        self.inputs = inputs
+
+    def report(self, inputs: dict = None) -> str:
+        inputs = self.inputs if inputs is None else inputs
+        expected, actual = self.run(**inputs)
+        detail = "\n".join(f"    {name} = {value!r}" for name, value in inputs.items())
+        return (f"{self}\n{detail}\n"
+                f"    expected = {expected!r}\n    actual   = {actual!r}")
+
+
+def check(op: str, engine: str, expected, actual, run, **inputs):
+    """run(**inputs) menghitung ulang (expected, actual); dipakai untuk memperkecil input."""
+    if expected != actual:
+        raise Mismatch(op, engine, run, inputs)
+
+
+def _stillFails(run, inputs: dict) -> bool:
+    try:
+        expected, actual = run(**inputs)
+    except Exception:
+        return False            # input jadi tidak valid (mis. key kosong): bukan mismatch yang sama
+    return expected != actual
+
+
+def shrink(error: Mismatch) -> dict:
+    """
+    Perkecil input yang gagal: untuk setiap input str/bytes, buang potongan
+    selebar len/2, len/4, ..., 1 selama mismatch tetap terjadi; ulangi
+    sampai tidak ada potongan yang bisa dibuang.
+    """
+    current = dict(error.inputs)
+    progress = True
+    while progress:
+        progress = False
+        for name in current:
+            if not isinstance(current[name], (str, bytes)):
+                continue
+            width = len(current[name]) // 2 or 1
+            while width and current[name]:
+                start = 0
+                while start < len(current[name]):
+                    value = current[name]
+                    candidate = dict(current, **{name: value[:start] + value[start + width:]})
+                    if _stillFails(error.run, candidate):
+                        current, progress = candidate, True
+                    else:
+                        start += width
+                width //= 2
+    if "splits" in current:
+        current["splits"] = clampSplits(current["splits"], len(current["data"]))
+    return current
+
+
+def randomAlphabet(rng: random.Random):
+    if rng.random() < 0.6:
+        return rng.choice(list(PRESETS))
+    pool = "".join(CHAR_POOLS)
+    return "".join(dict.fromkeys(rng.choices(pool, k=rng.randint(1, 40))))
+
+
+def runAlphabetCase(rng: random.Random, max_text: int):
+    """Engine alfabet: versi vektor vs loop referensi, plus round-trip (outside='keep')."""
+    alphabet = randomAlphabet(rng)
+    outside = rng.choice(OUTSIDE_POLICIES)
+    text = randomText(rng, max_text)
+    key = randomText(rng, 10) + rng.choice(getAlphabet(alphabet).symbols)
+    for decrypt in (False, True):
+        fn = autokeyDecryptAlphabet if decrypt else autokeyEncryptAlphabet
+
+        def run(text, key, alphabet, outside, fn=fn, decrypt=decrypt):
+            return autokeyAlphabetReference(text, key, alphabet, outside, decrypt=decrypt), fn(text, key, alphabet, outside)
+        check("alphabet-decrypt" if decrypt else "alphabet-encrypt", "vectorized",
+              *run(text, key, alphabet, outside), run, text=text, key=key, alphabet=alphabet, outside=outside)
+    if outside == "keep":
+        def roundtrip(text, key, alphabet):
+            return text, autokeyDecryptAlphabet(autokeyEncryptAlphabet(text, key, alphabet), key, alphabet)
+        check("alphabet-roundtrip", "vectorized", *roundtrip(text, key, alphabet), roundtrip,
+              text=text, key=key, alphabet=alphabet)
+
+
+def runCase(rng: random.Random, max_text: int, max_bytes: int):
+    for op, (reference, engines) in TEXT_ENGINES.items():
+        if op == "findKey":
+            plaintext = randomText(rng, max_text)
+            key = randomKey(rng, allow_empty=True)
+            # separuh kasus memakai pasangan asli, separuh teks acak bebas
+            other = autokeyEncrypt(plaintext, key)[0] if rng.random() < 0.5 else randomText(rng, max_text)
+            expected = reference(plaintext, other)
+            for name, fn in engines.items():
+                def run(plaintext, ciphertext, reference=reference, fn=fn):
+                    return reference(plaintext, ciphertext), fn(plaintext, ciphertext)
+                check(op, name, expected, fn(plaintext, other), run, plaintext=plaintext, ciphertext=other)
+            continue
+
+        text = randomText(rng, max_text)
+        key = randomKey(rng, allow_empty=True)
+        expected = reference(text, key)
+        for name, fn in engines.items():
+            def run(text, key, reference=reference, fn=fn):
+                return reference(text, key), fn(text, key)
+            check(op, name, expected, fn(text, key), run, text=text, key=key)
+
+    runAlphabetCase(rng, max_text)
+
+    for op, (reference, engines) in BYTE_ENGINES.items():
+        data = rng.randbytes(rng.randint(0, max_bytes))
+        key = randomKey(rng, allow_empty=False)
+        splits = randomSplits(rng, len(data))
+        expected = reference(data, key)
+        for name, fn in engines.items():
+            def run(data, key, splits, reference=reference, fn=fn):
+                return reference(data, key), fn(data, key, clampSplits(splits, len(data)))
+            check(op, name, expected, fn(data, key, splits), run, data=data, key=key, splits=splits)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan engine cepat dengan referensi")
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=None, help="Seed awal (default: acak)")
+    parser.add_argument("--max-text", type=int, default=200,
+                        help="Panjang maksimum teks (referensi teks O(n^2))")
+    parser.add_argument("--max-bytes", type=int, default=4096)
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="Berhenti setelah N detik walau iterasi belum habis")
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    start = time.perf_counter()
+    done = 0
+    for i in range(args.iterations):
+        case_seed = seed + i
+        try:
+            runCase(random.Random(case_seed), args.max_text, args.max_bytes)
+        except Mismatch as e:
+            print(f"❌ Mismatch pada seed {case_seed} (input diperkecil):\n{e.report(shrink(e))}")
+            print(f"Reproduksi: python tests/test_equivalence.py --seed {case_seed} --iterations 1")
+            return 1
+        done += 1
+        if args.time_budget and time.perf_counter() - start > args.time_budget:
+            break
+
+    print(f"✅ {done} kasus identik dengan referensi "
+          f"(seed={seed}, {time.perf_counter() - start:.2f} s)")
+    return 0
+
+
+def test_engines_match_reference():
+    for i in range(ITERATIONS):
+        try:
+            runCase(random.Random(SEED + i), max_text=200, max_bytes=4096)
+        except Mismatch as e:
+            raise AssertionError(f"seed {SEED + i}, input minimal:\n{e.report(shrink(e))}") from None
+
+
+if __name__ == "__main__":
+    sys.exit(main())
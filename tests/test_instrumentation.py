@@ -0,0 +1,14 @@
+import instrumentation
+
+
+def test_label_values_are_escaped():
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        instrumentation.count("files", file='C:\\data\\"laporan"\nv2.pdf')
+        text = instrumentation.prometheusText()
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+    assert 'autokey_files{file="C:\\\\data\\\\\\"laporan\\"\\nv2.pdf"} 1\n' in text
@@ -0,0 +1,123 @@
+import gzip
+import io
+import os
+import struct
+import zipfile
+
+import numpy as np
+import pytest
+
+from autokey_fast import autokeyEncryptBytesFast
+from key_check import checkDecryption
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KEYS = ["KUNCI", "Tr0ngK3y!2024", "RahasiaSekali123", "ab"]
+
+
+def _read(*parts) -> bytes:
+    with open(os.path.join(ROOT, *parts), "rb") as f:
+        return f.read()
+
+
+def _npy(array) -> bytes:
+    buf = io.BytesIO()
+    np.save(buf, array)
+    return buf.getvalue()
+
+
+def _zip() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", _read("README.md")[:2000])
+        z.writestr("word/document.xml", _read("key_check.py"))
+    return buf.getvalue()
+
+
+def _inputs():
+    return {
+        "data.npy": _npy(np.random.default_rng(0).normal(size=8192)),
+        "index.npy": _npy(np.arange(16384, dtype=np.int32)),
+        "readme.md.gz": gzip.compress(_read("README.md"), mtime=0),
+        "laporan.docx": _zip(),
+        "plaintext.jpg": _read("sample", "plaintext.jpg"),
+        "plaintext.pdf": _read("sample", "plaintext.pdf"),
+        "readme.md": _read("README.md"),
+    }
+
+
+INPUTS = _inputs()
+SIGNED = ["data.npy", "index.npy", "readme.md.gz", "laporan.docx", "plaintext.jpg", "plaintext.pdf"]
+# format yang strukturnya diperiksa di balik signature
+VERIFIED = ["readme.md.gz", "laporan.docx", "plaintext.jpg", "plaintext.pdf"]
+
+
+@pytest.mark.parametrize("key", KEYS)
+@pytest.mark.parametrize("name", list(INPUTS))
+def test_correct_key_is_never_rejected(name, key):
+    check = checkDecryption(autokeyEncryptBytesFast(INPUTS[name], key), key, name=name + ".enc")
+    assert not check.rejected, check.reasons
+    if name in VERIFIED or name == "readme.md":
+        assert check.verdict == "benar", check.reasons
+
+
+@pytest.mark.parametrize("name", SIGNED)
+@pytest.mark.parametrize("position", [3, 8, 15])
+def test_one_wrong_byte_is_never_accepted(name, position):
+    key = "RahasiaSekali123"
+    wrong = key[:position] + chr(ord(key[position]) + 1) + key[position + 1:]
+    check = checkDecryption(autokeyEncryptBytesFast(INPUTS[name], key), wrong, name=name + ".enc")
+    assert check.verdict != "benar", check.reasons
+    if name in VERIFIED and position >= 8:
+        # signature utuh, tetapi struktur di belakangnya rusak
+        assert check.rejected, check.reasons
+
+
+@pytest.mark.parametrize("name", SIGNED)
+@pytest.mark.parametrize("wrong", ["KUNC", "KUNCIX", "KUNCIKUNCI"])
+def test_wrong_key_length_is_never_accepted(name, wrong):
+    check = checkDecryption(autokeyEncryptBytesFast(INPUTS[name], "KUNCI"), wrong, name=name + ".enc")
+    assert check.verdict != "benar", check.reasons
+
+
+def test_record_structure_only_lowers_confidence():
+    # float64 tanpa header, berpola per 32 byte: dengan key 16 byte, blok genap/ganjil berbeda tanpa key salah
+    data = np.linspace(0.0, 1.0, 8192).tobytes()
+    check = checkDecryption(autokeyEncryptBytesFast(data, "RahasiaSekali123"), "RahasiaSekali123", name="lin.bin.enc")
+    assert not check.rejected, check.reasons
+
+
+def test_text_with_wrong_key_is_rejected():
+    data = INPUTS["readme.md"]
+    check = checkDecryption(autokeyEncryptBytesFast(data, "KUNCI"), "SALAH", name="readme.md.enc")
+    assert check.rejected, check.reasons
+
+
+def _mov() -> bytes:
+    # QuickTime lama: atom wide/mdat/moov tanpa ftyp di offset 4
+    payload = np.random.default_rng(1).integers(0, 256, 60000, dtype=np.uint8).tobytes()
+    moov = b"mvhd" + bytes(100)
+    return (struct.pack(">I4s", 8, b"wide") + struct.pack(">I4s", 8 + len(payload), b"mdat") + payload
+            + struct.pack(">I4s", 8 + len(moov), b"moov") + moov)
+
+
+def _cp1252() -> bytes:
+    rows = ["nama;kota;nilai"] + [f"Müller-{i};Besançon;{i % 97},5 €" for i in range(800)]
+    return "\r\n".join(rows).encode("cp1252")
+
+
+@pytest.mark.parametrize("key", KEYS)
+@pytest.mark.parametrize("name, data", [
+    ("catatan.txt", _read("README.md").decode("utf-8").encode("utf-16")),
+    ("data.csv", _cp1252()),
+    ("klip.mov", _mov()),
+])
+def test_unsigned_variants_are_not_rejected(name, data, key):
+    # signature/encoding yang tidak dikenali bukan bukti key salah
+    check = checkDecryption(autokeyEncryptBytesFast(data, key), key, name=name + ".enc")
+    assert not check.rejected, check.reasons
+
+
+def test_utf16_text_with_wrong_key_is_rejected():
+    data = _read("README.md").decode("utf-8").encode("utf-16")
+    check = checkDecryption(autokeyEncryptBytesFast(data, "KUNCI"), "SALAH", name="catatan.txt.enc")
+    assert check.rejected, check.reasons
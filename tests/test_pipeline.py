@@ -0,0 +1,49 @@
+import io
+import os
+import random
+
+import pytest
+
+from autokey_fast import AutokeyByteStream, autokeyDecryptBytesFast, autokeyEncryptBytesFast
+from pipeline import pipelineCopy
+
+
+@pytest.mark.parametrize("decrypt", [False, True])
+def test_update_into_in_place_matches_engine(decrypt):
+    rng = random.Random(7)
+    engine = autokeyDecryptBytesFast if decrypt else autokeyEncryptBytesFast
+    for key in ("K", "KUNCI", "kunci rahasia panjang 123"):
+        data = os.urandom(5000)
+        buf = bytearray(data)
+        stream = AutokeyByteStream(key, decrypt=decrypt)
+        start = 0
+        while start < len(buf):
+            # potongan lebih pendek dan lebih panjang dari key
+            end = min(len(buf), start + rng.randint(1, 300))
+            view = memoryview(buf)[start:end]
+            stream.updateInto(view, view)
+            start = end
+        assert bytes(buf) == bytes(engine(data, key))
+
+
+@pytest.mark.parametrize("decrypt", [False, True])
+def test_pipeline_matches_engine(decrypt):
+    data = os.urandom(1_000_003)
+    out = io.BytesIO()
+    stats = pipelineCopy(io.BytesIO(data), out, "KUNCI", decrypt, chunk_size=65536, depth=2)
+    engine = autokeyDecryptBytesFast if decrypt else autokeyEncryptBytesFast
+    assert stats["bytes"] == len(data)
+    assert out.getvalue() == bytes(engine(data, "KUNCI"))
+
+
+class _ShortWriter(io.BytesIO):
+    def write(self, b):
+        # seperti file raw: hanya sebagian yang tertulis per panggilan
+        return super().write(bytes(b)[:1000])
+
+
+def test_pipeline_completes_short_writes():
+    data = os.urandom(200_001)
+    out = _ShortWriter()
+    pipelineCopy(io.BytesIO(data), out, "KUNCI", chunk_size=65536, depth=2)
+    assert out.getvalue() == bytes(autokeyEncryptBytesFast(data, "KUNCI"))
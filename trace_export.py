@@ -0,0 +1,277 @@
+"""
+Trace proses (tabel step-by-step) dalam format kolom bertipe, diekspor per
+potongan ke CSV, Parquet, atau Arrow IPC.
+
+Tabel dari autokeyEncrypt/autokeyDecrypt/findKey adalah DataFrame bertipe
+object dengan string kosong sebagai placeholder, dan kolom KeyStream berisi
+seluruh keystream di setiap baris (O(n^2)). Di sini:
+- kolom angka memakai dtype integer terkecil yang cukup (UInt8 untuk A-Z)
+  dengan null sungguhan (pd.NA) untuk baris spasi
+- kolom KeyStream diganti KeyStreamLen (panjang keystream pada baris itu);
+  isinya bisa direkonstruksi dari key + kolom PT
+- baris dibangkitkan per potongan (chunk_rows), jadi trace jutaan baris bisa
+  ditulis ke file tanpa pernah berada utuh di memori sebagai tabel
+
+Contoh:
+    python trace_export.py encrypt input.txt --key KUNCI --format parquet --output trace.parquet
+    python trace_export.py findKey plain.txt --ciphertext cipher.txt --format csv --output trace.csv
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from autokey_fast import alphaMask, autokeyKeystream, autokeyRecover, keyToNums, textToCodes
+from autokey_functions import normalizeText
+
+# ======================================================
+# KONFIGURASI
+# ======================================================
+CHUNK_ROWS = 100_000
+FORMATS = ("csv", "parquet", "arrow")
+
+COLUMNS = {
+    "encrypt": ["PT", "n(PT)", "K", "n(K)", "(nPT+nK)%26", "CT", "n(CT)", "KeyStreamLen"],
+    "decrypt": ["CT", "n(CT)", "K", "n(K)", "(nCT-nK)%26", "PT", "n(PT)", "KeyStreamLen"],
+    "findKey": ["PT", "n(PT)", "CT", "n(CT)", "(nCT-nPT)%26", "Key", "n(Key)"],
+}
+
+
+def smallestIntDtype(values: np.ndarray) -> str:
+    """Dtype integer nullable terkecil untuk nilai (huruf non-ASCII bisa > 255)."""
+    if len(values) == 0 or (values.min() >= 0 and values.max() <= 255):
+        return "UInt8"
+    if values.min() >= 0 and values.max() <= 65535:
+        return "UInt16"
+    return "Int32"
+
+# ======================================================
+# PERHITUNGAN TRACE (vektor, sekali untuk seluruh input)
+# ======================================================
+class _TextTrace:
+    """Array per baris untuk encrypt/decrypt; baris = spasi atau huruf."""
+
+    def __init__(self, text: str, key, decrypt: bool):
+        codes = textToCodes(normalizeText(text).upper())
+        spaces = codes == 32
+        letters = alphaMask(codes)
+        rows = spaces | letters
+        self.codes = codes[rows]
+        self.isLetter = letters[rows]
+        self.decrypt = decrypt
+
+        keyNums = np.asarray(keyToNums(key), dtype=np.int64)
+        values = self.codes[self.isLetter].astype(np.int64) - 65
+        n = len(values)
+        if decrypt:
+            ct = values
+            pt = autokeyRecover(ct % 26, keyNums, 26) if len(keyNums) else ct % 26
+            stream = pt
+            result = pt
+        else:
+            pt = values
+            stream = pt
+            result = None
+        if len(keyNums):
+            k = autokeyKeystream(stream, keyNums)
+        else:
+            k = np.zeros(n, dtype=np.int64)   # referensi memakai 'A' jika keystream habis
+        if not decrypt:
+            result = (pt + k) % 26
+        self.input = values
+        self.k = k
+        self.result = result
+        # karakter K: dari key (A-Z) atau dari plaintext (bisa huruf non-ASCII saat enkripsi)
+        self.kChar = k + 65
+        if not decrypt and len(keyNums):
+            head = min(n, len(keyNums))
+            self.kChar = np.concatenate([keyNums[:head] + 65, self.codes[self.isLetter][:n - head]])
+        # panjang keystream setelah baris ini diproses
+        letterCount = np.cumsum(self.isLetter)
+        self.keyStreamLen = len(keyNums) + letterCount
+        # dihitung sekali untuk seluruh trace; frame() hanya mengiris
+        self.letterOffsets = np.concatenate([[0], letterCount])
+        self.letterCodes = values + 65
+        self.inDtype = smallestIntDtype(self.input)
+        self.kDtype = smallestIntDtype(self.k)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def frame(self, start: int, stop: int) -> pd.DataFrame:
+        isLetter = self.isLetter[start:stop]
+        li = slice(int(self.letterOffsets[start]), int(self.letterOffsets[stop]))
+        n = stop - start
+
+        def chars(letterCodes, spaceChar):
+            out = np.full(n, ord(spaceChar), dtype=np.uint32)
+            out[isLetter] = letterCodes
+            return pd.array([chr(c) for c in out.tolist()], dtype="string")
+
+        def nums(values, dtype):
+            out = pd.array(np.zeros(n, dtype=np.int64), dtype=dtype)
+            out[~isLetter] = pd.NA
+            out[isLetter] = values
+            return out
+
+        inChars = chars(self.letterCodes[li], " ")
+        kChars = chars(self.kChar[li], " ")
+        kChars[~isLetter] = pd.NA
+        resChars = chars(self.result[li] + 65, " ")
+        resNums = nums(self.result[li], "UInt8")
+        cols = COLUMNS["decrypt" if self.decrypt else "encrypt"]
+        return pd.DataFrame({
+            cols[0]: inChars,
+            cols[1]: nums(self.input[li], self.inDtype),
+            cols[2]: kChars,
+            cols[3]: nums(self.k[li], self.kDtype),
+            cols[4]: resNums,
+            cols[5]: resChars,
+            cols[6]: resNums.copy(),
+            cols[7]: pd.array(self.keyStreamLen[start:stop], dtype="UInt32"),
+        })
+
+
+class _FindKeyTrace:
+    """Array per baris untuk findKey; baris = setiap posisi pasangan PT/CT."""
+
+    def __init__(self, plaintext: str, ciphertext: str):
+        pt = normalizeText(plaintext).upper()
+        ct = normalizeText(ciphertext).upper()
+        n = min(len(pt), len(ct))
+        self.pt = textToCodes(pt[:n])
+        self.ct = textToCodes(ct[:n])
+        self.both = alphaMask(self.pt) & alphaMask(self.ct)
+        self.ptN = self.pt.astype(np.int64) - 65
+        self.ctN = self.ct.astype(np.int64) - 65
+        self.k = (self.ctN - self.ptN) % 26
+        self.ptDtype = smallestIntDtype(self.ptN[self.both])
+        self.ctDtype = smallestIntDtype(self.ctN[self.both])
+
+    def __len__(self):
+        return len(self.pt)
+
+    def frame(self, start: int, stop: int) -> pd.DataFrame:
+        both = self.both[start:stop]
+
+        def nums(values, dtype):
+            out = pd.array(values, dtype=dtype)
+            out[~both] = pd.NA
+            return out
+
+        def chars(codes):
+            return pd.array([chr(c) for c in codes.tolist()], dtype="string")
+
+        ptN = np.where(both, self.ptN[start:stop], 0)
+        ctN = np.where(both, self.ctN[start:stop], 0)
+        k = self.k[start:stop]
+        keyChars = np.where(both, k + 65, 32)
+        cols = COLUMNS["findKey"]
+        return pd.DataFrame({
+            cols[0]: chars(self.pt[start:stop]),
+            cols[1]: nums(ptN, self.ptDtype),
+            cols[2]: chars(self.ct[start:stop]),
+            cols[3]: nums(ctN, self.ctDtype),
+            cols[4]: nums(k, "UInt8"),
+            cols[5]: chars(keyChars),
+            cols[6]: nums(k, "UInt8"),
+        })
+
+# ======================================================
+# API
+# ======================================================
+def iterTrace(operation: str, text: str, key_or_ciphertext, chunk_rows: int = CHUNK_ROWS):
+    """Hasilkan trace bertipe sebagai potongan DataFrame berisi maksimal chunk_rows baris."""
+    if operation == "findKey":
+        trace = _FindKeyTrace(text, key_or_ciphertext)
+    elif operation in ("encrypt", "decrypt"):
+        trace = _TextTrace(text, key_or_ciphertext, decrypt=operation == "decrypt")
+    else:
+        raise ValueError(f"Operasi tidak dikenal: {operation}")
+    for start in range(0, len(trace), chunk_rows):
+        frame = trace.frame(start, min(start + chunk_rows, len(trace)))
+        frame.index = pd.RangeIndex(start, start + len(frame))
+        yield frame
+
+def traceFrame(operation: str, text: str, key_or_ciphertext) -> pd.DataFrame:
+    """Trace lengkap dalam satu DataFrame bertipe (untuk input kecil)."""
+    frames = list(iterTrace(operation, text, key_or_ciphertext))
+    if not frames:
+        return pd.DataFrame({c: pd.Series(dtype="string") for c in COLUMNS[operation]})
+    return pd.concat(frames)
+
+def _requireArrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError("Ekspor Parquet/Arrow membutuhkan paket pyarrow (pip install pyarrow)")
+
+def writeTrace(frames, sink, fmt: str = "csv") -> int:
+    """Tulis potongan trace ke sink (path atau file biner) satu per satu; kembalikan jumlah baris."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Format tidak dikenal: {fmt}")
+    rows = 0
+    writer = None
+    close_sink = isinstance(sink, str)
+    out = open(sink, "wb") if close_sink and fmt == "csv" else sink
+    try:
+        for i, frame in enumerate(frames):
+            rows += len(frame)
+            if fmt == "csv":
+                out.write(frame.to_csv(index=False, header=i == 0).encode("utf-8"))
+                continue
+            pa = _requireArrow()
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                if fmt == "parquet":
+                    import pyarrow.parquet as pq
+                    writer = pq.ParquetWriter(sink, table.schema, compression="zstd")
+                else:
+                    writer = pa.ipc.new_stream(sink, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+        if close_sink and fmt == "csv":
+            out.close()
+    return rows
+
+def exportTrace(operation: str, text: str, key_or_ciphertext, sink, fmt: str = "csv",
+                chunk_rows: int = CHUNK_ROWS) -> int:
+    return writeTrace(iterTrace(operation, text, key_or_ciphertext, chunk_rows), sink, fmt)
+
+# ======================================================
+# CLI
+# ======================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor trace proses Autokey Cipher per potongan")
+    parser.add_argument("operation", choices=list(COLUMNS))
+    parser.add_argument("input", help="File teks input (plaintext untuk findKey)")
+    parser.add_argument("--key", help="Key (encrypt/decrypt)")
+    parser.add_argument("--ciphertext", help="File ciphertext (khusus findKey)")
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    with open(args.input, encoding="utf-8") as f:
+        text = f.read()
+    if args.operation == "findKey":
+        if not args.ciphertext:
+            parser.error("findKey membutuhkan --ciphertext")
+        with open(args.ciphertext, encoding="utf-8") as f:
+            other = f.read()
+    else:
+        if not args.key:
+            parser.error(f"{args.operation} membutuhkan --key")
+        other = args.key
+
+    rows = exportTrace(args.operation, text, other, args.output, args.format, args.chunk_rows)
+    print(f"{rows} baris trace ditulis ke {args.output} ({args.format})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())